@@ -0,0 +1,37 @@
+"""Compares the time of attribute access and method calls on a DataSet with those on a
+DataFrame.
+
+Run with: python benchmarks/attribute_access.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_CALLS = 100_000
+
+
+class Schema:
+    a: int
+    b: float
+
+
+def main() -> None:
+    df = pd.DataFrame({"a": np.arange(100), "b": np.random.random(100)})
+    ds = DataSet[Schema](df)
+
+    statements = ["obj.shape", "obj.columns", "obj.index", "obj.a", "obj.sum", "obj.head"]
+    print(f"{'statement':<16}  {'DataFrame':>12}  {'DataSet':>12}")
+    for statement in statements:
+        timings = [
+            min(timeit.repeat(statement, number=N_CALLS, repeat=5, globals={"obj": obj})) / N_CALLS
+            for obj in [df, ds]
+        ]
+        print(f"{statement:<16}  {timings[0] * 1e9:>9.0f} ns  {timings[1] * 1e9:>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compares creating DataSets one by one with validate_batch(), for many small
+DataFrames that are destined for a limited number of schemas.
+
+Run with: python benchmarks/batch_validation.py
+"""
+
+import timeit
+from typing import Any, List, Tuple
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.batch import validate_batch
+
+N_SCHEMAS = 50
+N_FRAMES = 1_000
+
+
+def create_schema(i: int) -> Any:
+    annotations = {"id": int, "value": float, "label": str, "column_{}".format(i): int}
+    return type("Schema{}".format(i), (), {"__annotations__": annotations})
+
+
+def create_pairs() -> List[Tuple[pd.DataFrame, Any]]:
+    schemas = [create_schema(i) for i in range(N_SCHEMAS)]
+    pairs = []
+    for i in range(N_FRAMES):
+        schema = schemas[i % N_SCHEMAS]
+        df = pd.DataFrame(
+            {
+                "id": np.arange(10),
+                "value": np.random.random(10),
+                "label": ["a"] * 10,
+                "column_{}".format(i % N_SCHEMAS): np.arange(10),
+            }
+        )
+        pairs.append((df, schema))
+    return pairs
+
+
+def main() -> None:
+    pairs = create_pairs()
+
+    def create_one_by_one() -> List[pd.DataFrame]:
+        return [DataSet[schema](df) for df, schema in pairs]  # type: ignore[valid-type]
+
+    one_by_one = min(timeit.repeat(create_one_by_one, number=1, repeat=5))
+    batch = min(timeit.repeat(lambda: validate_batch(pairs), number=1, repeat=5))
+    print(f"{N_FRAMES} frames, {N_SCHEMAS} schemas")
+    print(f"    one by one       {one_by_one * 1000:8.2f} ms")
+    print(f"    validate_batch   {batch * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compares ``DataSet[Schema].coerce(df)`` with casting the columns that do not adhere
+to the schema one by one with ``astype()``, followed by ``DataSet[Schema](df)``.
+
+Run with: python benchmarks/coerce.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_ROWS = 1_000_000
+N_COLUMNS = 20
+N_CAST = 2
+
+
+def main() -> None:
+    schema = type("Schema", (), {"__annotations__": {f"c{i}": int for i in range(N_COLUMNS)}})
+    df = pd.DataFrame({f"c{i}": np.arange(N_ROWS) for i in range(N_COLUMNS)})
+    df = df.astype({f"c{i}": np.int32 for i in range(N_CAST)})
+
+    def by_hand():
+        result = df
+        for i in range(N_CAST):
+            result = result.astype({f"c{i}": np.int64})
+        return DataSet[schema](result)  # type: ignore[valid-type]
+
+    def coerce():
+        return DataSet[schema].coerce(df)  # type: ignore[valid-type]
+
+    print(f"{N_ROWS} rows, {N_COLUMNS} int64 columns of which {N_CAST} are int32")
+    for name, function in [("astype() per column", by_hand), ("coerce()", coerce)]:
+        timing = min(timeit.repeat(function, number=5, repeat=3)) / 5
+        print(f"{name:<20}  {timing * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
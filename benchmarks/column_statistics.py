@@ -0,0 +1,51 @@
+"""Compares computing the min, max, null count and number of distinct values of a column
+with reading them from ``column_statistics()``, on the first and on later reads.
+
+Run with: python benchmarks/column_statistics.py
+"""
+
+import time
+
+import numpy as np  # type: ignore
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.statistics import column_statistics
+
+N_ROWS = 10_000_000
+N_READS = 10
+
+
+class Schema:
+    a: int
+
+
+def read(stats) -> None:
+    stats.min, stats.max, stats.null_count, stats.unique_count
+
+
+def main() -> None:
+    df = DataSet[Schema]({"a": np.random.default_rng(0).integers(0, 100_000, N_ROWS)})
+
+    start = time.perf_counter()
+    for _ in range(N_READS):
+        values = df["a"]
+        values.min(), values.max(), values.isna().sum(), values.nunique()
+    recomputed = (time.perf_counter() - start) / N_READS
+
+    start = time.perf_counter()
+    read(column_statistics(df)["a"])
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N_READS):
+        read(column_statistics(df)["a"])
+    cached = (time.perf_counter() - start) / N_READS
+
+    print(f"{N_ROWS} rows")
+    print(f"{'recomputed':<20}  {recomputed * 1e3:>10.3f} ms")
+    print(f"{'statistics (first)':<20}  {first * 1e3:>10.3f} ms")
+    print(f"{'statistics (later)':<20}  {cached * 1e3:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compares the memory footprint of a feature frame with a plain schema, with that of
+the same frame with a schema that uses Compact and Categorical annotations.
+
+Run with: python benchmarks/compact_schema_memory.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import Categorical, Compact, DataSet
+
+
+class PlainSchema:
+    age: int
+    clicks: int
+    score: float
+    country: str
+    device: str
+
+
+class CompactSchema:
+    age: Compact[int]
+    clicks: Compact[int]
+    score: Compact[float]
+    country: Categorical[str]
+    device: Categorical[str]
+
+
+def create_dataframe(n_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    countries = np.array(["country_{}".format(i) for i in range(20)], dtype=object)
+    devices = np.array(["desktop", "mobile", "tablet"], dtype=object)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 100, n_rows),
+            "clicks": rng.integers(0, 10_000, n_rows),
+            "score": rng.integers(0, 100, n_rows) / 4,
+            "country": countries[rng.integers(0, len(countries), n_rows)],
+            "device": devices[rng.integers(0, len(devices), n_rows)],
+        }
+    )
+
+
+def main() -> None:
+    df = create_dataframe(1_000_000)
+    for schema in [PlainSchema, CompactSchema]:
+
+        def create() -> pd.DataFrame:
+            return DataSet[schema](df)  # type: ignore[valid-type]
+
+        duration = min(timeit.repeat(create, number=1, repeat=3))
+        memory = create().memory_usage(deep=True).sum()
+        print(
+            f"{schema.__name__:<14} {memory / 2**20:8.1f} MiB, construction {duration * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
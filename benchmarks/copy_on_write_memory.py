@@ -0,0 +1,91 @@
+"""Compares the peak memory (RSS) of a 10-step pipeline on DataSets, with and without
+pandas' Copy-on-Write.
+
+Each mode runs in a separate process, since the peak RSS of a process cannot be reset.
+
+Run with: python benchmarks/copy_on_write_memory.py
+"""
+
+import resource
+import subprocess
+import sys
+from typing import Any, Callable, List
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_ROWS = 1_000_000
+N_COLUMNS = 20
+
+
+def create_schema(name: str, columns: List[str]) -> Any:
+    return type(name, (), {"__annotations__": {column: float for column in columns}})
+
+
+COLUMNS = ["x{}".format(i) for i in range(N_COLUMNS)]
+Schema = create_schema("Schema", COLUMNS)
+WideSchema = create_schema("WideSchema", COLUMNS + ["y"])
+NarrowSchema = create_schema("NarrowSchema", COLUMNS[1:])
+
+
+def modify(ds: Any, column: str) -> Any:
+    """Follows the advice of the immutability error: convert to a DataFrame and modify it."""
+    df = ds.to_dataframe()
+    df[column] = df[column] * 2
+    return DataSet[Schema](df)  # type: ignore[valid-type]
+
+
+def restore(ds: Any) -> Any:
+    return DataSet[Schema](  # type: ignore[valid-type]
+        ds.assign(x0=np.zeros(N_ROWS)).drop(columns=["y"], errors="ignore")[COLUMNS]
+    )
+
+
+# every step only changes (at most) a single column
+steps: List[Callable[[Any], Any]] = [
+    lambda ds: ds.assign_typed(WideSchema, y=ds["x0"] + 1),
+    lambda ds: ds.project(Schema),
+    lambda ds: modify(ds, "x1"),
+    lambda ds: DataSet[NarrowSchema](ds.drop(columns=["x0"])),  # type: ignore[valid-type]
+    lambda ds: restore(ds),
+    lambda ds: DataSet[Schema](ds.rename(columns={"x2": "x2"})),  # type: ignore[valid-type]
+    lambda ds: modify(ds, "x3"),
+    lambda ds: ds.assign_typed(WideSchema, y=ds["x4"] * 2),
+    lambda ds: DataSet[Schema](ds.reset_index(drop=True)[COLUMNS]),  # type: ignore[valid-type]
+    lambda ds: modify(ds, "x5"),
+]
+
+
+def max_rss_mb() -> float:
+    # kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(copy_on_write: bool) -> None:
+    pd.set_option("mode.copy_on_write", copy_on_write)
+    # a single block, such that creating the input does not inflate the peak RSS
+    df = pd.DataFrame(np.random.random((N_ROWS, N_COLUMNS)), columns=COLUMNS, copy=False)
+    ds = DataSet[Schema](df)  # type: ignore[valid-type]
+    del df
+    before = max_rss_mb()
+
+    for step in steps:
+        ds = step(ds)
+
+    data = ds.memory_usage(index=False).sum() / 1024**2
+    print(f"{data:.0f} MB of data, peak RSS increase {max_rss_mb() - before:.0f} MB")
+
+
+def main() -> None:
+    for copy_on_write in [False, True]:
+        print(f"copy_on_write={copy_on_write}: ", end="", flush=True)
+        subprocess.run([sys.executable, __file__, str(copy_on_write)], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1] == "True")
+    else:
+        main()
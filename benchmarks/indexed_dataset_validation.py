@@ -0,0 +1,49 @@
+"""Measures the time it takes to validate an IndexedDataSet with a 4-level MultiIndex,
+for an increasing number of rows.
+
+Run with: python benchmarks/indexed_dataset_validation.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import IndexedDataSet
+
+
+class IndexSchema:
+    a: int
+    b: int
+    c: float
+    d: str
+
+
+class DataSchema:
+    e: float
+
+
+def create_dataframe(n_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "a": rng.integers(0, 1000, n_rows),
+            "b": np.arange(n_rows),
+            "c": rng.random(n_rows),
+            "d": rng.choice(["x", "y", "z"], n_rows).astype(object),
+            "e": rng.random(n_rows),
+        }
+    ).set_index(["a", "b", "c", "d"])
+
+
+def main() -> None:
+    for n_rows in [10_000, 100_000, 1_000_000, 10_000_000]:
+        df = create_dataframe(n_rows)
+        duration = min(
+            timeit.repeat(lambda: IndexedDataSet[IndexSchema, DataSchema](df), number=1, repeat=5)
+        )
+        print(f"{n_rows:>12,} rows: {duration * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compares the time of pandas operations on a DataSet with those on a DataFrame.
+
+Run with: python benchmarks/pandas_operations.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_CALLS = 2_000
+
+
+class Schema:
+    a: int
+    b: float
+
+
+def main() -> None:
+    df = pd.DataFrame({"a": np.arange(100), "b": np.random.random(100)})
+    ds = DataSet[Schema](df)
+
+    statements = [
+        'obj["b"]',
+        "obj.iloc[0]",
+        "obj.iloc[:5]",
+        "obj.copy()",
+        "obj + 1",
+        "obj.head()",
+        "obj.sort_values('b')",
+    ]
+    print(f"{'statement':<24}  {'DataFrame':>10}  {'DataSet':>10}")
+    for statement in statements:
+        timings = [
+            min(timeit.repeat(statement, number=N_CALLS, repeat=7, globals={"obj": obj})) / N_CALLS
+            for obj in [df, ds]
+        ]
+        print(f"{statement:<24}  {timings[0] * 1e6:>7.1f} us  {timings[1] * 1e6:>7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measures the time of `quarantine()` on a DataFrame of which a small fraction of the
+rows cannot be coerced to the schema, compared to ``DataSet[Schema].coerce(df)`` on the
+valid rows only.
+
+Run with: python benchmarks/quarantine.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.quarantine import quarantine
+
+N_ROWS = 5_000_000
+INVALID_FRACTION = 0.001
+
+
+class Schema:
+    a: int
+    b: float
+    c: int
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 1000, N_ROWS).astype(np.float64)
+    a[rng.random(N_ROWS) < INVALID_FRACTION] = np.nan
+    df = pd.DataFrame({"a": a, "b": rng.random(N_ROWS), "c": rng.integers(0, 1000, N_ROWS)})
+    valid = df.dropna()
+
+    timings = {
+        "quarantine(df)": min(timeit.repeat(lambda: quarantine(df, Schema), number=1, repeat=3)),
+        "coerce(valid rows)": min(
+            timeit.repeat(lambda: DataSet[Schema].coerce(valid), number=1, repeat=3)
+        ),
+    }
+
+    _, rejected, _ = quarantine(df, Schema)
+    print(f"{N_ROWS} rows, of which {len(rejected)} are rejected")
+    for name, timing in timings.items():
+        print(f"{name:<20}  {timing * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compares creating a DataSet with a wide schema with and without a hit in the
+signature cache, i.e. when a DataFrame with the same column names and dtypes was
+validated before.
+
+Run with: python benchmarks/signature_cache.py
+"""
+
+import timeit
+from typing import Any, Dict
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.validate_schema import signature_cache
+
+N_COLUMNS = 500
+N_ROWS = 100
+
+
+def create_schema() -> Any:
+    annotations = {"column_{}".format(i): [int, float, str][i % 3] for i in range(N_COLUMNS)}
+    return type("WideSchema", (), {"__annotations__": annotations})
+
+
+def create_df() -> pd.DataFrame:
+    columns: Dict[str, Any] = {}
+    for i in range(N_COLUMNS):
+        if i % 3 == 0:
+            columns["column_{}".format(i)] = np.arange(N_ROWS)
+        elif i % 3 == 1:
+            columns["column_{}".format(i)] = np.random.random(N_ROWS)
+        else:
+            columns["column_{}".format(i)] = np.array(["a"] * N_ROWS, dtype=object)
+    return pd.DataFrame(columns)
+
+
+def main() -> None:
+    schema = create_schema()
+    df = create_df()
+
+    def create_cold() -> None:
+        signature_cache.clear()
+        DataSet[schema](df)  # type: ignore[valid-type]
+
+    def create_warm() -> None:
+        DataSet[schema](df)  # type: ignore[valid-type]
+
+    cold = min(timeit.repeat(create_cold, number=100, repeat=5)) / 100
+    warm = min(timeit.repeat(create_warm, number=100, repeat=5)) / 100
+    print(f"{N_COLUMNS} columns, {N_ROWS} rows")
+    print(f"cache miss: {cold * 1e6:8.1f} us per DataSet")
+    print(f"cache hit:  {warm * 1e6:8.1f} us per DataSet")
+    print(f"speedup:    {cold / warm:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compares label lookups in a new IndexedDataSet of which the index schema is declared
+unique and sorted (binary search), with the same lookups in a DataFrame (hash table,
+built on the first lookup in every new index).
+
+Run with: python benchmarks/sorted_index_lookups.py
+"""
+
+import timeit
+from typing import Callable, Dict
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import IndexedDataSet
+
+
+class IndexSchema:
+    __unique__ = True
+    __sorted__ = True
+
+    a: int
+
+
+class DataSchema:
+    b: float
+
+
+def main() -> None:
+    n_rows = 1_000_000
+    keys = np.arange(0, 20_000, 2)
+
+    def create_dataframe() -> pd.DataFrame:
+        return pd.DataFrame(
+            {"a": np.arange(0, 2 * n_rows, 2), "b": np.random.random(n_rows)}
+        ).set_index("a")
+
+    def create_dataset() -> pd.DataFrame:
+        return IndexedDataSet[IndexSchema, DataSchema](create_dataframe())
+
+    workloads: Dict[str, Callable[[pd.DataFrame], object]] = {
+        "loc[scalar]": lambda df: df.loc[1000],
+        "loc[10k labels]": lambda df: df.loc[keys],
+        "reindex(10k labels)": lambda df: df.reindex(keys + 1),
+    }
+    for name, workload in workloads.items():
+        print(name)
+        for label, create in [("DataFrame", create_dataframe), ("IndexedDataSet", create_dataset)]:
+            # every repetition uses a new object, of which the index has no cached hash table
+            duration = min(
+                timeit.repeat(
+                    "workload(df)",
+                    setup="df = create()",
+                    globals={"workload": workload, "create": create},
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(f"    {label:<16} {duration * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
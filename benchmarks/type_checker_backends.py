@@ -0,0 +1,83 @@
+"""Compares the overhead of the runtime type checker backends on code that is unrelated
+to DataSets, on many distinct functions outside of the checked packages (of which each
+is called once, as happens when a large application starts), as well as on a function
+that takes and returns a DataSet.
+
+Run with: python benchmarks/type_checker_backends.py
+"""
+
+import itertools
+import sys
+import timeit
+import warnings
+from typing import Callable, Dict
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas._vendor import typeguard
+from strictly_typed_pandas.type_checker import MonitoringTypeChecker
+
+
+class Schema:
+    a: int
+
+
+def fibonacci(n: int) -> int:
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def identity(df: DataSet[Schema]) -> DataSet[Schema]:
+    return df
+
+
+# typeguard finds the function of a frame by scanning all objects tracked by the garbage collector,
+# of which a real application has many
+heap = [[i] for i in range(200_000)]
+runs = itertools.count()
+
+
+def call_many_functions() -> None:
+    # the functions are distinct on every run, since the type checkers cache (or disable) the code
+    # objects that they have seen before, and equal code objects compare equal
+    run = next(runs)
+    source = "\n".join(f"def f{i}(a: int) -> int:\n    return a + {run}" for i in range(200))
+    namespace = {"__name__": "unrelated_module"}
+    exec(compile(source, "unrelated_module", "exec"), namespace)
+    for i in range(200):
+        namespace[f"f{i}"](i)  # type: ignore[operator]
+
+
+df = DataSet[Schema]({"a": [1, 2, 3]})
+workloads: Dict[str, Callable[[], object]] = {
+    "unrelated code (fibonacci(20))": lambda: fibonacci(20),
+    "distinct functions (200, one call each)": call_many_functions,
+    "DataSet function (10k calls)": lambda: [identity(df) for _ in range(10_000)],
+}
+
+
+def measure(workload: Callable[[], object]) -> float:
+    return min(timeit.repeat(workload, number=1, repeat=5))
+
+
+def main() -> None:
+    backends: Dict[str, Callable[[], object]] = {
+        "no type checker": lambda: None,
+        "sys.setprofile": lambda: typeguard.TypeChecker("__main__"),
+    }
+    if sys.version_info >= (3, 12):
+        backends["sys.monitoring"] = lambda: MonitoringTypeChecker("__main__")
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    for workload_name, workload in workloads.items():
+        print(workload_name)
+        for backend_name, create_checker in backends.items():
+            checker = create_checker()
+            if checker is None:
+                duration = measure(workload)
+            else:
+                with checker:  # type: ignore
+                    duration = measure(workload)
+            print(f"    {backend_name:<20} {duration * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
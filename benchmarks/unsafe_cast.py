@@ -0,0 +1,37 @@
+"""Compares the time of ``DataSet[Schema](df)`` with that of
+``DataSet[Schema].unsafe_cast(df)``, for DataFrames with an increasing number of
+columns.
+
+Run with: python benchmarks/unsafe_cast.py
+"""
+
+import timeit
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_ROWS = 10_000
+N_CALLS = 100
+
+
+def main() -> None:
+    print(f"{'columns':>8}  {'DataSet[Schema](df)':>20}  {'unsafe_cast(df)':>16}")
+    for n_columns in [10, 100, 1000]:
+        schema = type("Schema", (), {"__annotations__": {f"c{i}": int for i in range(n_columns)}})
+        df = pd.DataFrame(
+            np.zeros((N_ROWS, n_columns), dtype=np.int64), columns=list(schema.__annotations__)
+        )
+        DataSet[schema](df)  # type: ignore[valid-type]
+
+        namespace = {"DataSet": DataSet, "schema": schema, "df": df}
+        timings = [
+            min(timeit.repeat(statement, number=N_CALLS, repeat=5, globals=namespace)) / N_CALLS
+            for statement in ["DataSet[schema](df)", "DataSet[schema].unsafe_cast(df)"]
+        ]
+        print(f"{n_columns:>8}  {timings[0] * 1e6:>17.1f} µs  {timings[1] * 1e6:>13.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measures the construction of a DataSet with 10k columns, and setting an internal
+attribute on it (which pandas does e.g. in ``merge``), which used to hash all column
+names to check whether the attribute is a column.
+
+Run with: python benchmarks/wide_dataset_construction.py
+"""
+
+import time
+import timeit
+from typing import Any, Callable, List
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas import DataSet
+
+N_COLUMNS = 10_000
+N_ROWS = 100
+N_REPEATS = 20
+
+
+def create_frames(columns: List[str]) -> List[pd.DataFrame]:
+    # every frame has its own columns, of which the hash table has not been built yet
+    values = np.zeros((N_ROWS, N_COLUMNS), dtype=np.int64)
+    return [pd.DataFrame(values, columns=pd.Index(columns)) for _ in range(N_REPEATS)]
+
+
+def measure(function: Callable[[pd.DataFrame], Any], frames: List[pd.DataFrame]) -> float:
+    durations = []
+    for df in frames:
+        start = time.perf_counter()
+        function(df)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    columns = ["column_{}".format(i) for i in range(N_COLUMNS)]
+    schema: Any = type("WideSchema", (), {"__annotations__": {name: int for name in columns}})
+
+    def construct(df: pd.DataFrame) -> Any:
+        return DataSet[schema](df)  # type: ignore[valid-type]
+
+    def construct_and_set_attribute(df: pd.DataFrame) -> None:
+        ds = construct(df)
+        ds._cache = {}
+
+    print(f"{N_COLUMNS} columns, {N_ROWS} rows")
+    for name, function in [
+        ("construction", construct),
+        ("construction + setattr", construct_and_set_attribute),
+    ]:
+        duration = measure(function, create_frames(columns))
+        print(f"{name:<24} {duration * 1e6:10.1f} us")
+
+    ds = construct(create_frames(columns)[0])
+    duration = min(timeit.repeat("ds._cache = {}", number=10_000, repeat=5, globals=locals()))
+    print(f"{'setattr':<24} {duration / 10_000 * 1e6:10.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from strictly_typed_pandas.dataset import DataSet, IndexedDataSet  # isort: skip
 import strictly_typed_pandas.typeguard  # noqa: F401
+from strictly_typed_pandas.compact import Categorical, Compact
 
-__all__ = ["DataSet", "IndexedDataSet"]
+__all__ = ["Categorical", "Compact", "DataSet", "IndexedDataSet"]
@@ -0,0 +1,117 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from strictly_typed_pandas.dataset import DataSet, _bind, column_dtypes
+from strictly_typed_pandas.instrumentation import observed
+from strictly_typed_pandas.validate_schema import CompiledSchema, compile_schema
+
+
+class BatchError(NamedTuple):
+    """A DataFrame in a batch that does not adhere to its schema.
+
+    :param position: the position of the DataFrame in the batch
+    :param schema: the name of the schema
+    :param message: the reason why the DataFrame does not adhere to the schema
+    """
+
+    position: int
+    schema: str
+    message: str
+
+
+class BatchResult(NamedTuple):
+    """The result of `validate_batch()`.
+
+    :param datasets: per DataFrame in the batch, the ``DataSet[Schema]``, or None if the
+        DataFrame does not adhere to its schema
+    :param errors: the DataFrames that do not adhere to their schema
+    """
+
+    datasets: List[Optional[DataSet]]
+    errors: List[BatchError]
+
+    def raise_for_errors(self) -> None:
+        """Raises a TypeError that lists all errors, if there are any."""
+        if self.errors:
+            msg = "{n} DataFrames in the batch do not adhere to their schema:\n{errors}"
+            raise TypeError(
+                msg.format(
+                    n=len(self.errors),
+                    errors="\n".join(
+                        "{}: {} ({})".format(error.position, error.message, error.schema)
+                        for error in self.errors
+                    ),
+                )
+            )
+
+
+def validate_batch(pairs: Iterable[Tuple[pd.DataFrame, Any]]) -> BatchResult:
+    """Validates many DataFrames against their schemas, and returns them as DataSets.
+
+    .. code-block:: python
+
+        result = validate_batch([(df1, Schema1), (df2, Schema2), (df3, Schema1)])
+        result.raise_for_errors()
+        ds1, ds2, ds3 = result.datasets
+
+    The DataFrames are grouped by their schema and by their column names and dtypes: each group is
+    validated once, after which all DataFrames in it are wrapped in a ``DataSet[Schema]`` without
+    copying them. DataFrames of which the schema converts columns upon creation (e.g. with
+    ``Compact[int]``, or ``__nullable__ = True``) are created one by one, like
+    ``DataSet[Schema](df)``, since the conversion depends on their values.
+
+    Instead of raising a TypeError for a DataFrame that does not adhere to its schema, this is
+    reported in ``BatchResult.errors``, and its position in ``BatchResult.datasets`` is None.
+    """
+    verdicts: Dict[Tuple[CompiledSchema, Tuple[Any, ...], Tuple[Any, ...]], Optional[str]] = {}
+    datasets: List[Optional[DataSet]] = []
+    errors: List[BatchError] = []
+
+    for position, (df, schema) in enumerate(pairs):
+        compiled = compile_schema(schema)
+
+        if compiled.converts:
+            try:
+                datasets.append(DataSet[schema](df))  # type: ignore[valid-type]
+            except TypeError as exc:
+                datasets.append(None)
+                errors.append(BatchError(position, compiled.name, str(exc)))
+            continue
+
+        key = (compiled, tuple(df.columns), tuple(column_dtypes(df)))
+        if key not in verdicts:
+            verdicts[key] = _find_error(compiled, df, key[1], key[2])
+
+        error = verdicts[key]
+        if error is not None:
+            datasets.append(None)
+            errors.append(BatchError(position, compiled.name, error))
+            continue
+
+        datasets.append(_bind(DataSet[schema], df))  # type: ignore[valid-type]
+
+    return BatchResult(datasets, errors)
+
+
+def _find_error(
+    compiled: CompiledSchema,
+    df: pd.DataFrame,
+    names: Tuple[Any, ...],
+    dtypes: Tuple[Any, ...],
+) -> Optional[str]:
+    """Returns the reason why columns ``names`` with ``dtypes`` do not adhere to
+    ``compiled``, or None if they do."""
+    if len(set(names)) != len(names):
+        return "DataSet has duplicate columns: {cols}".format(
+            cols=[name for i, name in enumerate(names) if name in names[:i]]
+        )
+
+    try:
+        observed(
+            "construction", "full", compiled.schema, df, compiled.validate_columns, names, dtypes
+        )
+    except TypeError as exc:
+        return str(exc)
+
+    return None
@@ -0,0 +1,162 @@
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+
+import numpy as np  # type: ignore
+import pandas as pd
+from pandas.api.types import pandas_dtype
+
+from strictly_typed_pandas.create_empty_dataframe import resolve_dtype
+from strictly_typed_pandas.validate_schema import remove_classvars
+
+# kinds of numpy dtypes for which we check that assigning a value to the buffer is lossless
+_numeric_kinds = {"b", "i", "u", "f", "c"}
+
+# kinds of numpy dtypes that can hold missing values (i.e. NaN)
+_nan_kinds = {"f", "c"}
+
+
+class DataSetBuilder:
+    """Builds a ``DataSet`` from records, without type inference and without validation.
+
+    Values are stored in preallocated column buffers with the dtypes of the schema (the same
+    dtypes that are used to create an empty ``DataSet``), which are grown geometrically. Values
+    are coerced to the dtype of their column upon ``append()``, so ``build()`` can return the
+    ``DataSet`` without validating it.
+
+    Create a builder through ``DataSet[Schema].builder()``:
+
+    .. code-block:: python
+
+        class Schema:
+            a: int
+            b: str
+
+        builder = DataSet[Schema].builder(capacity=1024)
+        builder.append({"a": 1, "b": "a"})
+        builder.append({"a": 2, "b": "b"})
+        df = builder.build()
+
+    Columns that pandas stores as extension arrays (e.g. ``str``, which is stored as a
+    ``StringDtype``) are buffered as objects, and are converted to their dtype in ``build()``.
+    """
+
+    def __init__(
+        self,
+        schema_expected: Dict[str, Any],
+        bind: Callable[[pd.DataFrame], Any],
+        capacity: int = 1024,
+    ):
+        if capacity < 1:
+            raise ValueError("The capacity of a DataSetBuilder must be at least 1.")
+
+        self._bind = bind
+        self._initial_capacity = capacity
+        self._dtypes = {
+            name: pandas_dtype(resolve_dtype(dtype))
+            for name, dtype in remove_classvars(schema_expected).items()
+        }
+        self._names = list(self._dtypes.keys())
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._capacity = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """The number of records that fit in the current buffers."""
+        return self._capacity
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Appends a record, i.e. a mapping from each column name in the schema to a
+        value."""
+        if len(record) != len(self._names):
+            self._raise_for_names(record)
+
+        if self._size == self._capacity:
+            self._grow()
+
+        i = self._size
+        for name in self._names:
+            try:
+                value = record[name]
+            except KeyError:
+                self._raise_for_names(record)
+
+            buffer = self._buffers[name]
+            try:
+                buffer[i] = value
+            except (TypeError, ValueError, OverflowError) as exc:
+                raise TypeError(self._coercion_error(name, value)) from exc
+
+            kind = buffer.dtype.kind
+            if kind in _numeric_kinds:
+                # NaN is not equal to itself, and is stored as True in a bool buffer
+                missing = value != value
+                if (missing and kind not in _nan_kinds) or (not missing and buffer[i] != value):
+                    raise TypeError(self._coercion_error(name, value))
+
+        self._size += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Appends multiple records, see ``append()``."""
+        for record in records:
+            self.append(record)
+
+    def build(self) -> Any:
+        """Returns the appended records as a ``DataSet``.
+
+        The buffers are handed over to the ``DataSet`` without copying them (so any unused
+        capacity remains allocated), after which the builder is empty again.
+        """
+        if self._capacity == 0:
+            self._grow()
+
+        columns: Dict[str, Any] = {}
+        for name, dtype in self._dtypes.items():
+            values: Any = self._buffers[name][: self._size]
+            if not isinstance(dtype, np.dtype):
+                try:
+                    values = pd.array(values, dtype=dtype)
+                except (TypeError, ValueError) as exc:
+                    raise TypeError(
+                        "Column {name} cannot be converted to {dtype}: {exc}".format(
+                            name=name, dtype=dtype, exc=exc
+                        )
+                    ) from exc
+            columns[name] = values
+
+        df = pd.DataFrame(columns, copy=False)
+        self._buffers = {}
+        self._capacity = 0
+        self._size = 0
+        return self._bind(df)
+
+    def _grow(self) -> None:
+        capacity = max(self._initial_capacity, 2 * self._capacity)
+        for name, dtype in self._dtypes.items():
+            buffer_dtype = dtype if isinstance(dtype, np.dtype) else np.dtype(object)
+            buffer = np.empty(capacity, dtype=buffer_dtype)
+            if name in self._buffers:
+                buffer[: self._size] = self._buffers[name][: self._size]
+            self._buffers[name] = buffer
+        self._capacity = capacity
+
+    def _raise_for_names(self, record: Mapping[str, Any]) -> None:
+        names: List[str] = list(record.keys())
+        diff = set(names) - set(self._names)
+        if diff:
+            raise TypeError(
+                "Record contains the following columns not present in schema: {diff}".format(
+                    diff=diff
+                )
+            )
+
+        diff = set(self._names) - set(names)
+        raise TypeError(
+            "Schema contains the following columns not present in record: {diff}".format(diff=diff)
+        )
+
+    def _coercion_error(self, name: str, value: Any) -> str:
+        msg = "Value {value!r} of column {name} cannot be stored as {dtype}"
+        return msg.format(value=value, name=name, dtype=self._dtypes[name])
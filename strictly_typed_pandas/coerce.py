@@ -0,0 +1,184 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple, get_origin
+
+import numpy as np  # type: ignore
+import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+
+from strictly_typed_pandas.compact import Categorical, Compact, compact_argument
+from strictly_typed_pandas.pandas_types import DatetimeTZDtype
+from strictly_typed_pandas.validate_schema import CompiledSchema, _check_dtypes
+
+
+@lru_cache(maxsize=1024)
+def cast_plan(
+    compiled: CompiledSchema, names: Tuple[Any, ...], dtypes: Tuple[Any, ...]
+) -> Dict[Any, Any]:
+    """Returns the dtype to cast to per column that does not adhere to ``compiled``, for
+    columns ``names`` with ``dtypes``.
+
+    Columns that already adhere to the schema (according to the rules of `validate_schema()`) are
+    not in the plan, nor are ``Categorical`` columns (which are converted upon the creation of a
+    DataSet anyway), or columns of which the type in the schema does not correspond to a dtype.
+    """
+    plan = {}
+    for name, dtype_observed in zip(names, dtypes):
+        dtype_expected = compiled.columns.get(name)
+        if dtype_expected is None or get_origin(dtype_expected) is Categorical:
+            continue
+
+        try:
+            _check_dtypes({name: dtype_expected}, {name: dtype_observed})
+            continue
+        except TypeError:
+            pass
+
+        # e.g. a float column for Compact[int], which is downcast upon the creation of the DataSet
+        if get_origin(dtype_expected) is Compact:
+            dtype_expected = compact_argument(dtype_expected)
+
+        target = _target_dtype(dtype_expected)
+        if target is not None:
+            plan[name] = target
+
+    return plan
+
+
+def _target_dtype(dtype_expected: Any) -> Any:
+    """Returns the dtype to which a column is cast to adhere to ``dtype_expected``, or
+    None if there is no such dtype."""
+    if dtype_expected is str:
+        return str
+
+    if isinstance(dtype_expected, ExtensionDtype):
+        return dtype_expected
+
+    try:
+        dtype = np.dtype(dtype_expected)
+    except TypeError:
+        return None
+
+    if dtype.kind in "mM" and np.datetime_data(dtype)[0] == "generic":
+        return np.dtype("{}8[ns]".format(dtype.kind))
+
+    return dtype
+
+
+def coerce_column(name: Any, values: pd.Series, dtype: Any) -> pd.Series:
+    """Casts ``values`` to ``dtype``, which is taken from a `cast_plan()`.
+
+    Naive datetimes are localized to the time zone of a `DatetimeTZDtype`, and time zone aware
+    datetimes are converted to UTC for a naive ``datetime64`` dtype. Missing values remain missing
+    for ``str``. Numeric casts to a narrower dtype (e.g. ``float64`` to ``int64``) are only allowed
+    if they are lossless.
+
+    :raises TypeError: if the values cannot be cast to ``dtype``
+    """
+    observed = values.dtype
+    try:
+        if isinstance(dtype, DatetimeTZDtype) and observed.kind == "M":
+            if not isinstance(observed, DatetimeTZDtype):
+                values = values.dt.tz_localize(dtype.tz)
+            return values.astype(dtype)
+
+        if isinstance(observed, DatetimeTZDtype) and getattr(dtype, "kind", None) == "M":
+            return values.dt.tz_convert(None).astype(dtype)
+
+        result = values.astype(dtype)
+        if dtype is str:
+            # astype(str) turns missing values into strings, e.g. "nan"
+            missing = values.isna()
+            if missing.any():
+                result = result.where(~missing, values)
+    except (TypeError, ValueError) as exc:
+        msg = "Column {name} of type {observed} cannot be coerced to {dtype}: {exc}"
+        raise TypeError(msg.format(name=name, observed=observed, dtype=dtype, exc=exc)) from None
+
+    if (
+        isinstance(observed, np.dtype)
+        and isinstance(dtype, np.dtype)
+        and observed.kind in "biuf"
+        and not np.can_cast(observed, dtype, "safe")
+        and not np.array_equal(
+            result.to_numpy().astype(observed), values.to_numpy(), equal_nan=True
+        )
+    ):
+        msg = "Column {name} of type {observed} cannot be coerced to {dtype} without loss"
+        raise TypeError(msg.format(name=name, observed=observed, dtype=dtype))
+
+    return result
+
+
+def coerce_columns(df: pd.DataFrame, plan: Dict[Any, Any]) -> pd.DataFrame:
+    """Returns ``df`` with its columns cast according to ``plan``.
+
+    Only the columns in the plan are copied: the other columns are shared with ``df``.
+    """
+    if not plan:
+        return df
+
+    columns = {
+        name: (
+            coerce_column(name, pd.DataFrame.__getitem__(df, name), plan[name])
+            if name in plan
+            else pd.DataFrame.__getitem__(df, name)
+        )
+        for name in df.columns
+    }
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def parse_column(values: pd.Series, dtype: Any) -> Tuple[pd.Series, np.ndarray]:
+    """Parses ``values`` for a cast to ``dtype``, which is taken from a `cast_plan()`,
+    and finds the values that cannot be cast.
+
+    Numeric and datetime dtypes are parsed with `pd.to_numeric()` and `pd.to_datetime()`. A value
+    cannot be cast if it cannot be parsed, if it is missing while ``dtype`` cannot hold missing
+    values, or if the cast is not lossless (e.g. ``1.5`` to ``int64``). For ``str``, any value can
+    be cast, and missing values remain missing. For other dtypes, the values are returned as is, and
+    none of them are marked.
+
+    :returns: the parsed values, and per value whether it cannot be cast to ``dtype``
+    """
+    missing = values.isna().to_numpy()
+    kind = getattr(dtype, "kind", None)
+
+    if kind in ("b", "i", "u", "f"):
+        numeric = values if values.dtype.kind in "biuf" else pd.to_numeric(values, errors="coerce")
+        array = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        parsed = np.isfinite(array)
+
+        failed = ~parsed & ~missing
+        if kind != "f" and not isinstance(dtype, ExtensionDtype):
+            failed |= missing
+
+        # e.g. int64 for the nullable Int64
+        target = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+        if kind == "b":
+            failed |= parsed & (array != 0) & (array != 1)
+        elif kind in ("i", "u"):
+            info = np.iinfo(target)
+            with np.errstate(invalid="ignore"):
+                failed |= parsed & (
+                    (array != np.trunc(array)) | (array < info.min) | (array > info.max)
+                )
+        elif target.itemsize < array.itemsize:
+            with np.errstate(over="ignore"):
+                failed |= parsed & (array.astype(target).astype(np.float64) != array)
+
+        return numeric, failed
+
+    if dtype is str:
+        # any value can be cast to str, and missing values remain missing (see `coerce_column()`),
+        # like in a column of strings that adheres to the schema
+        return values, np.zeros(len(values), dtype=bool)
+
+    if kind == "M" and values.dtype.kind != "M":
+        try:
+            parsed_datetimes = pd.to_datetime(values, errors="coerce")
+        except (TypeError, ValueError):
+            return values, np.zeros(len(values), dtype=bool)
+
+        return parsed_datetimes, parsed_datetimes.isna().to_numpy() & ~missing
+
+    return values, np.zeros(len(values), dtype=bool)
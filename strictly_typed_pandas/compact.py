@@ -0,0 +1,128 @@
+from typing import Any, Generic, List, Optional, TypeVar, get_args, get_origin
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas.pandas_types import CategoricalDtype
+
+T = TypeVar("T")
+
+_integer_dtypes: List[np.dtype] = [
+    np.dtype(np.int8),
+    np.dtype(np.int16),
+    np.dtype(np.int32),
+    np.dtype(np.int64),
+]
+
+_unsigned_integer_dtypes: List[np.dtype] = [
+    np.dtype(np.uint8),
+    np.dtype(np.uint16),
+    np.dtype(np.uint32),
+    np.dtype(np.uint64),
+]
+
+
+class Compact(Generic[T]):
+    """Annotates a column that is stored with the smallest dtype that holds its values,
+    e.g.:
+
+    .. code-block:: python
+
+        class Schema:
+            a: Compact[int]
+            b: Compact[float]
+
+    Upon the creation of a ``DataSet[Schema]``, integer columns are downcast to the smallest of
+    ``int8``, ``int16``, ``int32`` and ``int64`` that fits their range (or of ``uint8`` to
+    ``uint64`` for unsigned columns) if it is smaller than their dtype, and float columns are
+    downcast to ``float32`` if this is lossless. Any integer (respectively float) dtype adheres to
+    the schema.
+    """
+
+
+class Categorical(Generic[T]):
+    """Annotates a column that is stored as a ``pd.Categorical``, of which the
+    categories adhere to the type argument, e.g.:
+
+    .. code-block:: python
+
+        class Schema:
+            a: Categorical[str]
+
+    Upon the creation of a ``DataSet[Schema]``, such columns are converted to categoricals, which
+    store every distinct value once, and a small integer code per row.
+    """
+
+
+def is_compact(dtype: Any) -> bool:
+    """Whether ``dtype`` is a `Compact` or `Categorical` annotation."""
+    return get_origin(dtype) in (Compact, Categorical)
+
+
+def compact_argument(dtype: Any) -> Any:
+    """Returns the type argument of a `Compact` or `Categorical` annotation."""
+    return get_args(dtype)[0]
+
+
+def compact(values: pd.Series, dtype: Any) -> pd.Series:
+    """Converts ``values`` to the dtype of the `Compact` or `Categorical` annotation
+    ``dtype``.
+
+    Values that cannot be converted are returned as is, such that they are reported by
+    the validation of the schema.
+    """
+    if get_origin(dtype) is Categorical:
+        if isinstance(values.dtype, CategoricalDtype):
+            return values
+        return values.astype("category")
+
+    compact_dtype = _find_compact_dtype(values, compact_argument(dtype))
+    if compact_dtype is None or compact_dtype == values.dtype:
+        return values
+
+    return values.astype(compact_dtype)
+
+
+def _find_compact_dtype(values: pd.Series, logical_type: Any) -> Optional[np.dtype]:
+    dtype = values.dtype
+    if not isinstance(dtype, np.dtype) or len(values) == 0:
+        return None
+
+    if logical_type is int and dtype.kind in "iu":
+        minimum, maximum = values.min(), values.max()
+        candidates = _unsigned_integer_dtypes if dtype.kind == "u" else _integer_dtypes
+        for candidate in candidates:
+            if candidate.itemsize >= dtype.itemsize:
+                return None
+
+            info = np.iinfo(candidate)
+            if info.min <= minimum and maximum <= info.max:
+                return candidate
+        return None
+
+    if logical_type is float and dtype.kind == "f" and dtype.itemsize > 4:
+        array = values.to_numpy()
+        downcast = array.astype(np.float32)
+        if np.array_equal(downcast, array, equal_nan=True):
+            return np.dtype(np.float32)
+
+    return None
+
+
+def is_compact_dtype(dtype_observed: Any, logical_type: Any) -> bool:
+    """Whether ``dtype_observed`` is a (possibly downcast) dtype of ``logical_type``,
+    for the types that are supported by `Compact`."""
+    if not isinstance(dtype_observed, np.dtype):
+        return False
+
+    if logical_type is int:
+        return dtype_observed.kind in "iu"
+
+    if logical_type is float:
+        return dtype_observed.kind == "f"
+
+    raise TypeError(
+        "Compact only supports int and float, got Compact[{logical_type}]".format(
+            logical_type=logical_type
+        )
+    )
@@ -1,34 +1,48 @@
-from typing import Any, Callable, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, get_origin
 
 import numpy as np  # type: ignore
 import pandas as pd
 from pandas.api.extensions import ExtensionDtype
 
+from strictly_typed_pandas.compact import Categorical, Compact, compact_argument
 from strictly_typed_pandas.pandas_types import StringDtype
+from strictly_typed_pandas.validate_schema import check_for_duplicate_columns, schema_type_hints
 
 
-def create_empty_dataframe(schema: Dict[str, Any]) -> pd.DataFrame:
-    res = dict()
-    for name, dtype in schema.items():
-        if dtype == Any:
-            dtype = object
+def resolve_dtype(dtype: Any) -> Any:
+    """Maps a type from a schema to a dtype that pandas can create a column with."""
+    if get_origin(dtype) is Categorical:
+        return "category"
+
+    if get_origin(dtype) is Compact:
+        dtype = compact_argument(dtype)
+
+    if dtype == Any:
+        dtype = object
+
+    if isinstance(dtype, Callable) and isinstance(dtype(), ExtensionDtype):  # type: ignore
+        dtype = dtype.name
 
-        if isinstance(dtype, Callable) and isinstance(dtype(), ExtensionDtype):  # type: ignore
-            dtype = dtype.name
+    if isinstance(dtype, ExtensionDtype):
+        dtype = dtype.name
 
-        if isinstance(dtype, ExtensionDtype):
-            dtype = dtype.name
+    if dtype == np.datetime64:
+        dtype = "datetime64[ns]"
 
-        if dtype == np.datetime64:
-            dtype = "datetime64[ns]"
+    if dtype == np.timedelta64:
+        dtype = "timedelta64[ns]"
 
-        if dtype == np.timedelta64:
-            dtype = "timedelta64[ns]"
+    if dtype == str:
+        dtype = StringDtype.name
 
-        if dtype == str:
-            dtype = StringDtype.name
+    return dtype
 
-        res[name] = pd.Series([], dtype=dtype)
+
+def create_empty_dataframe(schema: Dict[str, Any]) -> pd.DataFrame:
+    res = dict()
+    for name, dtype in schema.items():
+        res[name] = pd.Series([], dtype=resolve_dtype(dtype))
 
     return pd.DataFrame(res)
 
@@ -39,3 +53,44 @@ def create_empty_indexed_dataframe(
     df_index = create_empty_dataframe(index_schema)
     df_data = create_empty_dataframe(data_schema)
     return pd.concat([df_index, df_data], axis=1).set_index(list(index_schema.keys()))
+
+
+def create_empty_dataframe_from_schema(schema: Any) -> pd.DataFrame:
+    """Returns an empty DataFrame for the schema class ``schema``.
+
+    The dtypes are only resolved upon the first call for a given schema; subsequent
+    calls return a copy of a cached template.
+    """
+    return _copy_template(_empty_dataframe_template(schema))
+
+
+def create_empty_indexed_dataframe_from_schema(index_schema: Any, data_schema: Any) -> pd.DataFrame:
+    """Returns an empty indexed DataFrame for the schema classes ``index_schema`` and
+    ``data_schema``, see `create_empty_dataframe_from_schema()`."""
+    return _copy_template(_empty_indexed_dataframe_template(index_schema, data_schema))
+
+
+def _copy_template(template: pd.DataFrame) -> pd.DataFrame:
+    """Returns a copy of ``template`` that shares none of its mutable parts.
+
+    The columns are empty, so a shallow copy suffices for them, but the axes are copied as well:
+    their names can be changed inplace (e.g. ``df.index.name = "b"``), which would otherwise
+    change the template.
+    """
+    df = template.copy(deep=False)
+    df.index = template.index.copy()
+    df.columns = template.columns.copy()
+    return df
+
+
+@lru_cache(maxsize=1024)
+def _empty_dataframe_template(schema: Any) -> pd.DataFrame:
+    return create_empty_dataframe(schema_type_hints(schema))
+
+
+@lru_cache(maxsize=1024)
+def _empty_indexed_dataframe_template(index_schema: Any, data_schema: Any) -> pd.DataFrame:
+    index_schema_expected = schema_type_hints(index_schema)
+    data_schema_expected = schema_type_hints(data_schema)
+    check_for_duplicate_columns(set(index_schema_expected.keys()), set(data_schema_expected.keys()))
+    return create_empty_indexed_dataframe(index_schema_expected, data_schema_expected)
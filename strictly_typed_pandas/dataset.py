@@ -1,26 +1,139 @@
 import inspect
 from abc import ABC
-from typing import Any, Generic, TypeVar, get_type_hints
+from functools import partial, wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+import numpy as np  # type: ignore
 import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.core.common import is_bool_indexer
+from pandas.core.generic import NDFrame
 
+from strictly_typed_pandas.builder import DataSetBuilder
+from strictly_typed_pandas.coerce import cast_plan, coerce_columns
+from strictly_typed_pandas.compact import compact, is_compact
 from strictly_typed_pandas.create_empty_dataframe import (
-    create_empty_dataframe,
-    create_empty_indexed_dataframe,
+    create_empty_dataframe_from_schema,
+    create_empty_indexed_dataframe_from_schema,
 )
 from strictly_typed_pandas.immutable import (
+    _ImmutableAtIndexer,
+    _ImmutableiAtIndexer,
     _ImmutableiLocIndexer,
     _ImmutableLocIndexer,
     immutable_error_msg,
+    immutable_method,
     inplace_argument_interceptor,
+    protect,
+    unprotect,
+)
+from strictly_typed_pandas.index_guarantees import (
+    _SortedLocIndexer,
+    check_index_guarantees,
+    declares_sorted,
+    declares_unique,
+    get_indexer,
+    supports_searchsorted,
+)
+from strictly_typed_pandas.instrumentation import observed
+from strictly_typed_pandas.nullable import to_nullable
+from strictly_typed_pandas.validate_schema import (
+    check_for_duplicate_columns,
+    check_subschema,
+    compile_schema,
+    validate_derived_schema,
 )
-from strictly_typed_pandas.validate_schema import check_for_duplicate_columns, validate_schema
 
 dataframe_functions = dict(inspect.getmembers(pd.DataFrame, predicate=inspect.isfunction))
 dataframe_member_names = dict(inspect.getmembers(pd.DataFrame)).keys()
 
+# attributes that are set on a DataFrame without ever referring to a column, such as the
+# attributes that pandas sets internally (e.g. ``_item_cache``); setting these skips the lookup in
+# the columns, which hashes all column names the first time
+internal_attribute_names = frozenset(
+    set(dataframe_member_names)
+    | set(pd.DataFrame._internal_names_set)  # type: ignore[attr-defined]
+    | {"__orig_class__"}
+)
+
+# functions that only select or reorder rows, hence their results adhere to the same schema
+schema_preserving_functions = {
+    "drop_duplicates",
+    "head",
+    "nlargest",
+    "nsmallest",
+    "query",
+    "sort_index",
+    "sort_values",
+    "tail",
+}
+
+# schema preserving functions that may change the order of the rows
+reordering_functions = {"nlargest", "nsmallest", "sort_index", "sort_values"}
+
+# functions that always modify the DataFrame inplace, including the augmented assignment operators
+# (e.g. ``df /= 2``), which may also change the dtypes of the columns
+mutating_functions = {
+    "__delitem__",
+    "__iadd__",
+    "__iand__",
+    "__ifloordiv__",
+    "__imod__",
+    "__imul__",
+    "__ior__",
+    "__ipow__",
+    "__isub__",
+    "__itruediv__",
+    "__ixor__",
+    "insert",
+    "pop",
+    "update",
+}
+
+_validate_casts = False
+
+
+def set_validate_casts(enabled: bool) -> None:
+    """Sets whether `DataSetBase.unsafe_cast()` validates the data, like
+    ``DataSet[Schema](df)``.
+
+    Enable this in test environments to verify the assumptions under which the casts are made, e.g.
+    with ``pytest --stp-validate-casts``.
+    """
+    global _validate_casts
+    _validate_casts = enabled
+
+
+def validate_casts() -> bool:
+    """Whether `DataSetBase.unsafe_cast()` validates the data, see
+    `set_validate_casts()`."""
+    return _validate_casts
+
+
+D = TypeVar("D", bound="DataSetBase")
+
 
 class DataSetBase(pd.DataFrame, ABC):
+    # the specialized subclass for the schema(s) of this object (e.g. ``DataSet[Schema]``), or
+    # None if it has no schema; see `_specialize()`
+    __orig_class__: Any = None
+
+    # the schema is carried by the class, so there is no metadata to propagate to the results of
+    # pandas operations (see `NDFrame.__finalize__()`)
+    _metadata: List[str] = []
+
     def __init__(self, *args, **kwargs) -> None:
         """This class is a subclass of `pd.DataFrame`, hence it is initialized with the
         same parameters as a `DataFrame`.
@@ -35,21 +148,100 @@ class DataSetBase(pd.DataFrame, ABC):
             )
             raise TypeError(msg)
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        object.__setattr__(self, name, value)
+        protect(self)
+        if self.__orig_class__ is not None:
+            _add_column_properties(self.__orig_class__)
 
-        if name in self.columns and name not in dataframe_member_names:
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in internal_attribute_names and name in self.columns:
             raise NotImplementedError(immutable_error_msg)
 
+        object.__setattr__(self, name, value)
+
     def __setitem__(self, key: Any, value: Any):
         raise NotImplementedError(immutable_error_msg)
 
-    def __getattribute__(self, name: str) -> Any:
-        if name in dataframe_functions:
-            attribute = dataframe_functions[name].__get__(self, type(self))
-            return inplace_argument_interceptor(attribute)
-        else:
-            return object.__getattribute__(self, name)
+    def __getitem__(self, key: Any) -> Any:
+        result = super().__getitem__(key)
+
+        if isinstance(result, pd.DataFrame) and not isinstance(key, pd.DataFrame):
+            if isinstance(key, slice) or is_bool_indexer(key):
+                return self._bind_schema(result, "__getitem__")
+
+        return result
+
+    @classmethod
+    def unsafe_cast(cls: Type[D], df: pd.DataFrame, validate: Optional[bool] = None) -> D:
+        """Returns ``df`` as a ``DataSet[Schema]`` (or ``IndexedDataSet[IndexSchema,
+        DataSchema]``), without validating it.
+
+        .. code-block:: python
+
+            class Schema:
+                a: int
+
+            df = DataSet[Schema].unsafe_cast(read_validated_store())
+
+        Only use this when ``df`` is known to adhere to the schema, e.g. because it was validated
+        before it was stored. The data is not copied, and columns are not converted (e.g. to the
+        dtypes of ``Compact[int]`` or of a nullable schema). If ``df`` already is an instance of
+        this class, it is returned as is.
+
+        :param validate: ``True`` to validate ``df`` like ``DataSet[Schema](df)``; defaults to
+            `validate_casts()`, which can be enabled in test environments
+        """
+        orig_class = cls.__orig_class__
+        if orig_class is None:
+            msg = "Please specify a schema, e.g. {}[Schema].unsafe_cast(df)"
+            raise TypeError(msg.format(cls.__name__))
+
+        if _validate_casts if validate is None else validate:
+            return cls(df)
+
+        if type(df) is orig_class:
+            return df  # type: ignore[return-value]
+
+        return _bind(orig_class, df)
+
+    def _bind_schema(self, df: Any, function: str, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """Binds the schema of this object to ``df``, without validating it.
+
+        Only use this when ``df`` provably adheres to the schema, e.g. because it is the result of
+        a row selection on this object.
+
+        :param function: the name of the function that returned ``df``
+        :param kwargs: the keyword arguments with which this function was called
+        """
+        orig_class = self.__orig_class__
+        if orig_class is None or not isinstance(df, pd.DataFrame):
+            return df
+
+        return _adopt(orig_class, df)
+
+    @property
+    def _constructor(self) -> Callable[..., pd.DataFrame]:
+        # the results of pandas operations may not adhere to the schema, so they are DataFrames;
+        # the schema preserving functions bind the schema to their results (see `_bind_schema()`)
+        return pd.DataFrame
+
+    def _constructor_from_mgr(self, mgr: Any, axes: Any) -> pd.DataFrame:
+        # pandas would otherwise pass the DataFrame to `_constructor`, i.e. create it twice
+        return pd.DataFrame._from_mgr(mgr, axes=axes)  # type: ignore[attr-defined]
+
+    _constructor_sliced = pd.Series
+
+    def _constructor_sliced_from_mgr(self, mgr: Any, axes: Any) -> pd.Series:
+        series = pd.Series._from_mgr(mgr, axes)  # type: ignore[attr-defined]
+        series._name = None
+        return series
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # the specialized subclasses are created dynamically, so they cannot be pickled by name
+        orig_class = self.__orig_class__
+        if orig_class is None or not isinstance(orig_class, type):
+            return super().__reduce_ex__(protocol)
+
+        return _unpickle, (orig_class.__origin__, orig_class.__args__, self.__getstate__())
 
     @property
     def iloc(self) -> _ImmutableiLocIndexer:  # type: ignore
@@ -59,17 +251,75 @@ class DataSetBase(pd.DataFrame, ABC):
     def loc(self) -> _ImmutableLocIndexer:  # type: ignore
         return _ImmutableLocIndexer("loc", self)  # type: ignore
 
+    @property
+    def iat(self) -> _ImmutableiAtIndexer:  # type: ignore
+        return _ImmutableiAtIndexer("iat", self)  # type: ignore
+
+    @property
+    def at(self) -> _ImmutableAtIndexer:  # type: ignore
+        return _ImmutableAtIndexer("at", self)  # type: ignore
+
     def to_dataframe(self) -> pd.DataFrame:
-        """Converts the object to a pandas `DataFrame`."""
-        return pd.DataFrame(self)
+        """Converts the object to a pandas `DataFrame`.
+
+        The data is not copied. With pandas' Copy-on-Write enabled
+        (``pd.options.mode.copy_on_write = True``), the `DataFrame` is a lazy copy: a column is
+        only copied once it is modified, so the `DataSet` is never affected. Without it, inplace
+        modifications of the `DataFrame` (e.g. ``df.loc[0, "a"] = 1``) also modify the `DataSet`.
+        """
+        return unprotect(self)
 
     def to_frame(self) -> pd.DataFrame:
         """Synonym of to to_dataframe(): converts the object to a pandas `DataFrame`."""
         return self.to_dataframe()
 
 
+def _intercepts(function: Callable) -> bool:
+    """Whether the DataFrame method ``function`` is wrapped by `intercept()` on a
+    DataSet."""
+    if function.__name__ in schema_preserving_functions:
+        return True
+
+    parameters = inspect.signature(function).parameters.values()
+    return any(
+        parameter.name == "inplace" or parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
+def intercept(function: Callable) -> Callable:
+    """Wraps the DataFrame method ``function`` for DataSets, such that it raises when it
+    is called with ``inplace=True``, and that it binds the schema to its result if it
+    only selects or reorders rows."""
+    if function.__name__ not in schema_preserving_functions:
+        return inplace_argument_interceptor(function)
+
+    @wraps(function)
+    def schema_preserving(self, *args, **kwargs):
+        return self._bind_schema(function(self, *args, **kwargs), function.__name__, kwargs)
+
+    return inplace_argument_interceptor(schema_preserving)
+
+
+# the public DataFrame methods that are wrapped by `intercept()`, i.e. those that have an inplace
+# argument (or accept arbitrary keyword arguments), and the schema preserving functions; these are
+# wrapped once on the class, so that attribute access on a DataSet is as fast as on a DataFrame
+intercepted_functions = {
+    name: function
+    for name, function in dataframe_functions.items()
+    if not name.startswith("_") and name not in DataSetBase.__dict__ and _intercepts(function)
+}
+
+for _name, _function in intercepted_functions.items():
+    setattr(DataSetBase, _name, intercept(_function))
+
+for _name in mutating_functions:
+    setattr(DataSetBase, _name, immutable_method(_name))
+
+
 T = TypeVar("T")
 V = TypeVar("V")
+S = TypeVar("S")
 
 
 class DataSet(Generic[T], DataSetBase):
@@ -92,29 +342,166 @@ class DataSet(Generic[T], DataSetBase):
         * `typeguard` (<3.0) for type checking during run-time (i.e. while you run your unit tests).
     """
 
-    _schema_annotations = None
-
     def __class_getitem__(cls, item):
-        """Allows us to define a schema for the ``DataSet``."""
-        cls = super().__class_getitem__(item)
-        cls._schema_annotations = item
-        return cls
+        """Allows us to define a schema for the ``DataSet``: returns the subclass of
+        ``DataSet`` for this schema, see `_specialize()`."""
+        return _specialize(cls, item if isinstance(item, tuple) else (item,))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        if DataSet._schema_annotations is None:
+        if self.__orig_class__ is None:
             return
 
-        schema_expected = get_type_hints(DataSet._schema_annotations)
-        DataSet._schema_annotations = None
-
+        schema = self.__orig_class__.__args__[0]
         if self.shape == (0, 0):
-            df = create_empty_dataframe(schema_expected)
+            df = create_empty_dataframe_from_schema(schema)
             super().__init__(df)
         else:
-            schema_observed = dict(zip(self.columns, self.dtypes))
-            validate_schema(schema_expected, schema_observed)
+            compiled = compile_schema(schema)
+            if compiled.converts:
+                _convert_columns(self, compiled.columns, compiled.nullable)
+            observed("construction", "full", schema, self, _validate_data, self, schema)
+
+    @classmethod
+    def builder(cls, capacity: int = 1024) -> DataSetBuilder:
+        """Returns a `DataSetBuilder`, which builds a ``DataSet[Schema]`` from records
+        without type inference or validation.
+
+        .. code-block:: python
+
+            class Schema:
+                a: int
+
+            builder = DataSet[Schema].builder(capacity=1024)
+            builder.append({"a": 1})
+            df = builder.build()
+
+        :param capacity: the number of records for which space is preallocated; the buffers are
+            doubled in size when they are full
+        """
+        orig_class = cls.__orig_class__
+        if orig_class is None:
+            raise TypeError("Please specify a schema, e.g. DataSet[Schema].builder()")
+
+        return DataSetBuilder(
+            compile_schema(orig_class.__args__[0]).type_hints,
+            partial(_bind, orig_class),
+            capacity,
+        )
+
+    @classmethod
+    def coerce(cls: Type[D], df: pd.DataFrame) -> D:
+        """Casts the columns of ``df`` of which the dtype does not adhere to the schema,
+        and returns the result as a ``DataSet[Schema]``.
+
+        .. code-block:: python
+
+            class Schema:
+                a: int
+                b: pd.DatetimeTZDtype(tz="UTC")
+
+            df = pd.DataFrame({"a": np.array([1, 2], dtype=np.int32), "b": ["2024-01-01"] * 2})
+            DataSet[Schema].coerce(df)
+
+        The casts are planned from the dtypes of ``df`` alone (see `cast_plan()`), and only the
+        columns that are cast are copied. Naive datetimes are localized to the time zone in the
+        schema, and numeric columns are only cast to a narrower dtype if this is lossless.
+
+        :raises TypeError: if a column cannot be cast, or if ``df`` does not adhere to the schema
+            after the casts (e.g. because it lacks a column)
+        """
+        orig_class = cls.__orig_class__
+        if orig_class is None:
+            raise TypeError("Please specify a schema, e.g. DataSet[Schema].coerce(df)")
+
+        if df.columns.duplicated().any():
+            return cls(df)
+
+        schema = orig_class.__args__[0]
+        compiled = compile_schema(schema)
+        coerced = coerce_columns(
+            df, cast_plan(compiled, tuple(df.columns), tuple(column_dtypes(df)))
+        )
+        if coerced is df or compiled.converts:
+            return cls(coerced)
+
+        observed("construction", "full", schema, coerced, _validate_data, coerced, schema)
+        return _adopt(orig_class, coerced)
+
+    def project(self, schema: Type[S]) -> "DataSet[S]":
+        """Selects the columns of ``schema`` and returns them as a ``DataSet[schema]``.
+
+        Whether the columns adhere to ``schema`` is derived from the schema of this ``DataSet``,
+        so the data is not validated again. The columns are not copied.
+
+        .. code-block:: python
+
+            class Schema:
+                a: int
+                b: str
+
+            class SubSchema:
+                a: int
+
+            DataSet[Schema]({"a": [1, 2], "b": ["a", "b"]}).project(SubSchema)
+        """
+        orig_class = self.__orig_class__
+        if orig_class is None:
+            raise TypeError("Cannot project a DataSet without a schema; use DataSet[Schema](...)")
+
+        check_subschema(orig_class.__args__[0], schema)
+        names = list(compile_schema(schema).columns.keys())  # type: ignore[arg-type]
+        df = pd.DataFrame(
+            {name: pd.DataFrame.__getitem__(self, name) for name in names}, copy=False
+        )
+        return _bind(DataSet[schema], df)  # type: ignore[valid-type]
+
+    def assign_typed(self, schema: Type[S], **kwargs) -> "DataSet[S]":
+        """Assigns new columns like `DataFrame.assign()`, and returns the result as a
+        ``DataSet[schema]``.
+
+        Only the assigned columns are validated: the other columns adhere to ``schema`` as long as
+        their type is the same in the schema of this ``DataSet``.
+
+        .. code-block:: python
+
+            class Schema:
+                a: int
+
+            class OutputSchema:
+                a: int
+                b: str
+
+            DataSet[Schema]({"a": [1, 2]}).assign_typed(OutputSchema, b=["a", "b"])
+        """
+        df = pd.DataFrame.assign(self, **kwargs)
+        return _derive(schema, df, [self])
+
+    @staticmethod
+    def merge_typed(
+        schema: Type[S], left: pd.DataFrame, right: pd.DataFrame, **kwargs
+    ) -> "DataSet[S]":
+        """Merges ``left`` and ``right`` like `pd.merge()`, and returns the result as a
+        ``DataSet[schema]``.
+
+        Columns that are taken unchanged from a ``DataSet`` with the same type in its schema are
+        not validated again, only the remaining columns (e.g. columns that were upcast because of
+        missing values, or that come from a plain `DataFrame`) are.
+        """
+        df = pd.merge(left, right, **kwargs)
+        return _derive(schema, df, [left, right])
+
+    @staticmethod
+    def concat_typed(schema: Type[S], objs: Sequence[pd.DataFrame], **kwargs) -> "DataSet[S]":
+        """Concatenates ``objs`` like `pd.concat()`, and returns the result as a
+        ``DataSet[schema]``.
+
+        Columns that are taken unchanged from DataSets with the same type in their
+        schema are not validated again, only the remaining columns are.
+        """
+        df = pd.concat(objs, **kwargs)
+        return _derive(schema, df, list(objs))
 
 
 class IndexedDataSet(Generic[T, V], DataSetBase):
@@ -145,48 +532,391 @@ class IndexedDataSet(Generic[T, V], DataSetBase):
         * validates whether the data adheres to the provided schema upon its initialization.
         * is immutable, so its schema cannot be changed using inplace modifications.
 
+    The index schema can declare that the index is unique and sorted in increasing order, using
+    ``__unique__ = True`` and ``__sorted__ = True``. These are verified upon initialization, after
+    which ``loc`` and ``reindex`` look up labels with a binary search if both are declared.
+
     The `IndexedDataSet[Schema]` annotations are compatible with:
         * `mypy` for type checking during linting-time (i.e. while you write your code).
         * `typeguard` (<3.0) for type checking during run-time (i.e. while you run your unit tests).
     """
 
-    _schema_index = None
-    _schema_data = None
-
     def __class_getitem__(cls, item):
-        """Allows us to define a schema for the ``DataSet``."""
-        cls = super().__class_getitem__(item)
-        cls._schema_index = item[0]
-        cls._schema_data = item[1]
-        return cls
+        """Allows us to define a schema for the ``DataSet``: returns the subclass of
+        ``IndexedDataSet`` for these schemas, see `_specialize()`."""
+        return _specialize(cls, item if isinstance(item, tuple) else (item,))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        if IndexedDataSet._schema_index is None or IndexedDataSet._schema_data is None:
+        if self.__orig_class__ is None:
             return
 
-        schema_index_expected = get_type_hints(IndexedDataSet._schema_index)
-        schema_data_expected = get_type_hints(IndexedDataSet._schema_data)
-        IndexedDataSet._schema_index = None
-        IndexedDataSet._schema_data = None
+        schema_index, schema_data = self.__orig_class__.__args__
+        if self.shape == (0, 0) and self.index.shape == (0,):
+            df = create_empty_indexed_dataframe_from_schema(schema_index, schema_data)
+            super().__init__(df)
+        else:
+            compiled_data = compile_schema(schema_data)
+            check_for_duplicate_columns(
+                set(compile_schema(schema_index).type_hints.keys()),
+                set(compiled_data.type_hints.keys()),
+            )
+            if compiled_data.converts:
+                _convert_columns(self, compiled_data.columns, compiled_data.nullable)
+            observed(
+                "construction",
+                "full",
+                (schema_index, schema_data),
+                self,
+                _validate_indexed_schemas,
+                self,
+                schema_index,
+                schema_data,
+            )
+
+    def __getitem__(self, key: Any) -> Any:
+        result = super().__getitem__(key)
+
+        orig_class = self.__orig_class__
+        if (
+            isinstance(key, slice)
+            and key.step is not None
+            and key.step < 0
+            and isinstance(result, DataSetBase)
+            and orig_class is not None
+            and declares_sorted(orig_class.__args__[0])
+            and not result.index.is_monotonic_increasing
+        ):
+            # the slice reverses the rows, which are no longer sorted by their index
+            return result.to_dataframe()
+
+        return result
 
-        check_for_duplicate_columns(
-            set(schema_index_expected.keys()), set(schema_data_expected.keys())
+    @property
+    def loc(self) -> _ImmutableLocIndexer:  # type: ignore
+        if self._has_sorted_unique_index():
+            return _SortedLocIndexer("loc", self)  # type: ignore
+
+        return _ImmutableLocIndexer("loc", self)  # type: ignore
+
+    def reindex(self, *args, **kwargs) -> pd.DataFrame:  # type: ignore[override]
+        """Conforms the ``IndexedDataSet`` to a new index, like `DataFrame.reindex()`.
+
+        If the index schema is declared ``__unique__`` and ``__sorted__``, reindexing the rows to a
+        list of labels looks up the labels with a binary search.
+        """
+        if len(args) == 1 and set(kwargs.keys()) <= {"fill_value"}:
+            target = args[0]
+        elif not args and "index" in kwargs and set(kwargs.keys()) <= {"index", "fill_value"}:
+            target = kwargs["index"]
+        else:
+            target = None
+
+        if target is not None and self._has_sorted_unique_index():
+            new_index = pd.Index(target)
+            if not hasattr(target, "name"):
+                new_index = new_index.set_names(self.index.name)
+
+            # an empty target is cast to the dtype of the index, which is left to pandas
+            indexer = get_indexer(self.index, new_index) if len(new_index) > 0 else None
+            if indexer is not None:
+                return pd.DataFrame(self)._reindex_with_indexers(  # type: ignore[operator]
+                    {0: [new_index, indexer]}, fill_value=kwargs.get("fill_value", np.nan)
+                )
+
+        return pd.DataFrame.reindex(self, *args, **kwargs)
+
+    def _has_sorted_unique_index(self) -> bool:
+        orig_class = self.__orig_class__
+        if orig_class is None:
+            return False
+
+        schema_index = orig_class.__args__[0]
+        return (
+            declares_unique(schema_index)
+            and declares_sorted(schema_index)
+            and supports_searchsorted(self.index)
         )
 
-        if self.shape == (0, 0) and self.index.shape == (0,):
-            df = create_empty_indexed_dataframe(schema_index_expected, schema_data_expected)
-            super().__init__(df)
+    def _bind_schema(self, df: Any, function: str, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        if kwargs and kwargs.get("ignore_index"):
+            # the index is replaced, which may not adhere to the index schema
+            return df.to_dataframe() if isinstance(df, DataSetBase) else df
+
+        orig_class = self.__orig_class__
+        if (
+            orig_class is not None
+            and function in reordering_functions
+            and declares_sorted(orig_class.__args__[0])
+            and not df.index.is_monotonic_increasing
+        ):
+            # the rows are no longer sorted by their index, as the index schema requires
+            return df.to_dataframe() if isinstance(df, DataSetBase) else df
+
+        return super()._bind_schema(df, function, kwargs)
+
+
+_specializations: Dict[Tuple[Any, Tuple[Any, ...]], Any] = {}
+
+
+def _specialize(cls: Any, args: Tuple[Any, ...]) -> Any:
+    """Returns the subclass of ``cls`` (i.e. `DataSet` or `IndexedDataSet`) for the
+    schemas ``args``, e.g. ``DataSet[Schema]``.
+
+    The subclass is created once per schema, and has:
+
+    * ``__origin__`` and ``__args__``, like ``typing`` generics (e.g. ``cls`` and ``(Schema,)``),
+      such that type checkers can compare it to annotations.
+    * ``__orig_class__``, which refers to the subclass itself, and from which instances read
+      their schema.
+    * a property per column of the (data) schema, see `_add_column_properties()`.
+
+    Type variables (e.g. ``DataSet[T]``) and forward references (e.g. ``DataSet["Schema"]``)
+    result in a ``typing`` generic alias instead.
+    """
+    key = (cls, args)
+    specialized: Any = _specializations.get(key)
+    if specialized is not None:
+        return specialized
+
+    if not cls.__parameters__:
+        raise TypeError("{} is already specialized".format(cls.__name__))
+
+    if any(isinstance(arg, (TypeVar, str, ForwardRef)) for arg in args):
+        return super(cls, cls).__class_getitem__(args if len(args) > 1 else args[0])
+
+    if len(args) != len(cls.__parameters__):
+        raise TypeError(
+            "Too {} arguments for {}; expected {}".format(
+                "many" if len(args) > len(cls.__parameters__) else "few",
+                cls.__name__,
+                len(cls.__parameters__),
+            )
+        )
+
+    name = "{}[{}]".format(cls.__name__, ", ".join(_type_name(arg) for arg in args))
+    namespace: Dict[str, Any] = {
+        "__module__": cls.__module__,
+        "__qualname__": name,
+        "__origin__": cls,
+        "__args__": args,
+    }
+    specialized = type(name, (cls,), namespace)
+    specialized.__orig_class__ = specialized
+    return _specializations.setdefault(key, specialized)
+
+
+def _add_column_properties(specialized: Any) -> None:
+    """Adds a property per column of the (data) schema to ``specialized`` (e.g.
+    ``DataSet[Schema]``), which returns the column without the attribute resolution of
+    `pd.DataFrame` (e.g. ``df.a``).
+
+    This is done upon the creation of the first instance rather than in `_specialize()`, since
+    compiling the schema resolves its annotations, which may refer to names that are only defined
+    after ``DataSet[Schema]`` is used in an annotation.
+    """
+    if "_column_properties" in specialized.__dict__:
+        return
+
+    for column in compile_schema(specialized.__args__[-1]).columns:
+        if (
+            isinstance(column, str)
+            and column.isidentifier()
+            and not hasattr(specialized.__origin__, column)
+        ):
+            setattr(specialized, column, _column_property(column))
+
+    specialized._column_properties = True
+
+
+def _type_name(type_: Any) -> str:
+    if isinstance(type_, type):
+        return type_.__qualname__
+
+    return repr(type_)
+
+
+def _column_property(name: str) -> property:
+    def get(self: pd.DataFrame) -> pd.Series:
+        # the columns of a DataSet cannot be modified, so the cache of pandas is always valid
+        column = self._item_cache.get(name)
+        if column is None:
+            column = self._get_item_cache(name)  # type: ignore[operator]
+        return column
+
+    def set(self: pd.DataFrame, value: Any) -> None:
+        raise NotImplementedError(immutable_error_msg)
+
+    return property(get, set, doc="The column ``{}``.".format(name))
+
+
+def _unpickle(cls: Any, args: Tuple[Any, ...], state: Dict[str, Any]) -> Any:
+    specialized = _specialize(cls, args)
+    _add_column_properties(specialized)
+    result = specialized.__new__(specialized)
+    result.__setstate__(state)
+    return result
+
+
+def _bind(orig_class: Any, df: pd.DataFrame) -> Any:
+    """Creates an instance of ``orig_class`` (e.g. ``DataSet[Schema]``) from ``df``,
+    without copying or validating the data."""
+    _add_column_properties(orig_class)
+    result = orig_class.__new__(orig_class)
+    pd.DataFrame.__init__(result, df)  # type: ignore[call-arg]
+    protect(result)
+    return result
+
+
+def _adopt(orig_class: Any, df: pd.DataFrame) -> Any:
+    """Like `_bind()`, for a ``df`` that is not used elsewhere (e.g. the result of a
+    pandas operation), of which the instance takes over the internal data rather than a
+    copy of it."""
+    _add_column_properties(orig_class)
+    result = orig_class.__new__(orig_class)
+    NDFrame.__init__(result, df._mgr)  # type: ignore[call-arg]
+    protect(result)
+    return result.__finalize__(df)
+
+
+_untrusted = object()
+
+
+def _derive(schema: Any, df: pd.DataFrame, sources: List[pd.DataFrame]) -> Any:
+    """Returns ``df`` as a ``DataSet[schema]``, where ``df`` was derived from
+    ``sources``.
+
+    A column of ``df`` is only validated if it could not be inherited from the ``sources``: it is
+    inherited if each of the sources that contains it is a DataSet with the same type for this
+    column in its schema, and with the same dtype as in ``df``. Like upon the creation of a
+    ``DataSet[schema]``, the columns are converted first (e.g. for `Compact` columns).
+    """
+    if df.columns.duplicated().any():
+        msg = "DataSet has duplicate columns: {cols}".format(
+            cols=df.columns[df.columns.duplicated()]
+        )
+        raise TypeError(msg)
+
+    compiled = compile_schema(schema)
+    result = _bind(DataSet[schema], df)
+    if compiled.converts:
+        _convert_columns(result, compiled.columns, compiled.nullable)
+
+    schema_observed = dict(zip(result.columns, column_dtypes(result)))
+    schema_inherited: Dict[str, Any] = {}
+    for source in sources:
+        orig_class = source.__orig_class__ if isinstance(source, DataSetBase) else None
+        # the schema of the data columns is the last argument for both DataSet and IndexedDataSet
+        schema_declared = (
+            {} if orig_class is None else compile_schema(orig_class.__args__[-1]).type_hints
+        )
+        for name, dtype in zip(source.columns, column_dtypes(source)):
+            if (
+                name in schema_declared
+                and dtype == schema_observed.get(name)
+                and schema_inherited.get(name, schema_declared[name]) == schema_declared[name]
+            ):
+                schema_inherited.setdefault(name, schema_declared[name])
+            else:
+                schema_inherited[name] = _untrusted
+
+    observed(
+        "construction",
+        "derived",
+        schema,
+        result,
+        validate_derived_schema,
+        compiled.type_hints,
+        schema_observed,
+        {name: dtype for name, dtype in schema_inherited.items() if dtype is not _untrusted},
+    )
+    return result
+
+
+def _convert_columns(df: DataSetBase, schema_expected: Dict[str, Any], nullable: bool) -> None:
+    """Converts the columns of ``df`` that are annotated with `Compact` or `Categorical`
+    in ``schema_expected`` to their compact dtypes, and if the schema is ``nullable``,
+    the columns with a nullable dtype in ``schema_expected`` to that dtype."""
+    converted = {}
+    for name, dtype in schema_expected.items():
+        if name not in df.columns:
+            continue
+
+        if is_compact(dtype):
+            values = pd.DataFrame.__getitem__(df, name)
+            result = compact(values, dtype)
+        elif nullable and isinstance(dtype, ExtensionDtype):
+            values = pd.DataFrame.__getitem__(df, name)
+            result = to_nullable(values, dtype)
         else:
-            schema_data_observed = dict(zip(self.columns, self.dtypes))
-            schema_index_observed = {
-                name: self.index.get_level_values(i).dtype
-                for i, name in enumerate(self.index.names)
-            }
+            continue
+
+        if result is not values:
+            converted[name] = result
+
+    if converted:
+        columns = {
+            name: converted[name] if name in converted else pd.DataFrame.__getitem__(df, name)
+            for name in df.columns
+        }
+        pd.DataFrame.__init__(  # type: ignore[call-arg]
+            df, pd.DataFrame(columns, index=df.index, copy=False)
+        )
+        protect(df)
+
+
+def column_dtypes(df: pd.DataFrame) -> np.ndarray:
+    """Returns the dtype of every column of ``df``, like ``df.dtypes.values``, without
+    creating a Series."""
+    try:
+        return df._mgr.get_dtypes()
+    except AttributeError:  # pragma: no cover
+        return np.asarray(df.dtypes)
+
+
+def _validate_data(df: pd.DataFrame, schema: Any) -> None:
+    compile_schema(schema).validate_columns(tuple(df.columns), tuple(column_dtypes(df)))
+
 
-            if all(name is None for name in self.index.names):
-                raise TypeError("No named columns in index. Did you remember to set the index?")
+def _validate_indexed_data(df: pd.DataFrame, schema_index: Any, schema_data: Any) -> None:
+    if all(name is None for name in df.index.names):
+        raise TypeError("No named columns in index. Did you remember to set the index?")
+
+    compile_schema(schema_index).validate_columns(
+        tuple(df.index.names), tuple(_index_dtypes(df.index))
+    )
+    compile_schema(schema_data).validate_columns(tuple(df.columns), tuple(column_dtypes(df)))
+
+
+def _validate_indexed_schemas(df: pd.DataFrame, schema_index: Any, schema_data: Any) -> None:
+    """Validates ``df`` against the index and data schemas, including the guarantees on
+    the index that are declared in the index schema (e.g. ``__sorted__``)."""
+    _validate_indexed_data(df, schema_index, schema_data)
+    check_index_guarantees(df.index, schema_index)
+
+
+def _missing_values_change_dtype(dtype: Any) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "iub"
+
+
+def _index_dtypes(index: pd.Index) -> List[Any]:
+    """Returns the dtype of each level of ``index``.
+
+    For a `MultiIndex`, these are read from its levels (i.e. the unique values per level), rather
+    than from ``get_level_values()``, which would materialize an array with a value per row. Only
+    the levels of which the dtype cannot hold missing values (i.e. integer and boolean levels) have
+    another dtype if they contain missing values (e.g. float64 for a level of integers); for these,
+    the codes are checked for missing values (i.e. a code of -1).
+    """
+    if isinstance(index, pd.MultiIndex):
+        return [
+            (
+                index.get_level_values(i).dtype
+                if _missing_values_change_dtype(level.dtype) and len(codes) and codes.min() < 0
+                else level.dtype
+            )
+            for i, (level, codes) in enumerate(zip(index.levels, index.codes))
+        ]
 
-            validate_schema(schema_index_expected, schema_index_observed)
-            validate_schema(schema_data_expected, schema_data_observed)
+    return [index.dtype]
@@ -1,7 +1,12 @@
 import inspect
+from functools import wraps
 from typing import Any, Callable, Optional
 
-from pandas.core.indexing import _iLocIndexer, _LocIndexer
+import numpy as np  # type: ignore
+import pandas as pd
+from pandas.core.indexing import _AtIndexer, _iAtIndexer, _iLocIndexer, _LocIndexer
+
+from strictly_typed_pandas.pandas_types import copy_on_write
 
 immutable_error_msg = (
     "To ensure that the DataSet adheres to its schema, you cannot perform inplace modifications. You can either use "
@@ -20,6 +25,27 @@ class _ImmutableLocIndexer(_LocIndexer):
         raise NotImplementedError(immutable_error_msg)
 
 
+class _ImmutableiAtIndexer(_iAtIndexer):
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise NotImplementedError(immutable_error_msg)
+
+
+class _ImmutableAtIndexer(_AtIndexer):
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise NotImplementedError(immutable_error_msg)
+
+
+def immutable_method(name: str) -> Callable:
+    """Returns a method ``name`` that raises, for DataFrame methods that always modify
+    the DataFrame inplace (e.g. ``insert``)."""
+
+    def func(self, *args, **kwargs):
+        raise NotImplementedError(immutable_error_msg)
+
+    func.__name__ = name
+    return func
+
+
 def _get_index_of_inplace_in_args(call: Callable) -> Optional[int]:
     signature = inspect.signature(call)
     parameters = signature.parameters.keys()
@@ -33,6 +59,7 @@ def _get_index_of_inplace_in_args(call: Callable) -> Optional[int]:
 def inplace_argument_interceptor(call: Callable) -> Callable:
     inplace_ind = _get_index_of_inplace_in_args(call)
 
+    @wraps(call)
     def func(*args, **kwargs):
         if inplace_ind is not None and inplace_ind < len(args) and args[inplace_ind]:
             raise NotImplementedError(immutable_error_msg)
@@ -43,3 +70,69 @@ def inplace_argument_interceptor(call: Callable) -> Callable:
         return call(*args, **kwargs)
 
     return func
+
+
+_readonly_arrays = False
+
+
+def set_readonly_arrays(enabled: bool) -> None:
+    """Sets whether new DataSets mark their numpy arrays as read-only.
+
+    By default, DataSets only guard against inplace modifications through their own methods (e.g.
+    ``df["a"] = ...``, ``df.loc[...] = ...`` or ``inplace=True``). With read-only arrays, writes
+    to the underlying data are also blocked by numpy, e.g. ``df.values[0] = ...``,
+    ``df.to_numpy()[0] = ...`` or ``df["a"].values[0] = ...``.
+
+    The arrays are marked read-only through views, so the DataFrames from which DataSets are
+    created remain writable. Note that DataFrames that are derived from a DataSet without copying
+    its data (e.g. ``df.iloc[:10]``) share its read-only arrays; use ``df.to_dataframe()`` to
+    obtain a writable DataFrame.
+
+    This has no effect when pandas' Copy-on-Write is enabled, which already blocks these writes
+    (and copies the data of derived DataFrames only when they are modified).
+    """
+    global _readonly_arrays
+    _readonly_arrays = enabled
+
+
+def readonly_arrays() -> bool:
+    """Whether new DataSets mark their numpy arrays as read-only, see
+    `set_readonly_arrays()`."""
+    return _readonly_arrays
+
+
+def protect(df: pd.DataFrame) -> None:
+    """Marks the numpy arrays of ``df`` as read-only, if enabled by
+    `set_readonly_arrays()`."""
+    if not _readonly_arrays or copy_on_write():
+        return
+
+    protected = False
+    for block in df._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray) and values.flags.writeable:
+            view = values.view()
+            view.flags.writeable = False
+            block.values = view
+            protected = True
+
+    if protected:
+        # cached columns refer to the writable arrays
+        df._clear_item_cache()  # type: ignore[operator]
+
+
+def unprotect(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns ``df`` as a DataFrame of which the numpy arrays are writable, without
+    copying them unless they were read-only before `protect()`."""
+    result = pd.DataFrame(df)
+    for block in result._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray) and not values.flags.writeable:
+            view = values.view()
+            try:
+                view.flags.writeable = True
+            except ValueError:
+                view = values.copy()
+            block.values = view
+
+    return result
@@ -0,0 +1,110 @@
+from typing import Any, Optional
+
+import numpy as np  # type: ignore
+import pandas as pd
+from pandas.api.types import is_scalar
+from pandas.core.common import is_bool_indexer
+
+from strictly_typed_pandas.immutable import _ImmutableLocIndexer
+from strictly_typed_pandas.pandas_types import StringDtype
+
+
+def declares_unique(schema_index: Any) -> bool:
+    """Whether the index schema declares that the index is unique, i.e. ``__unique__ =
+    True``."""
+    return bool(getattr(schema_index, "__unique__", False))
+
+
+def declares_sorted(schema_index: Any) -> bool:
+    """Whether the index schema declares that the index is sorted in increasing order,
+    i.e. ``__sorted__ = True``."""
+    return bool(getattr(schema_index, "__sorted__", False))
+
+
+def check_index_guarantees(index: pd.Index, schema_index: Any) -> None:
+    """Checks whether ``index`` is unique and sorted, as far as this is declared in
+    ``schema_index``."""
+    if declares_unique(schema_index) and not index.is_unique:
+        raise TypeError(
+            "Index contains duplicate values, but index schema {schema} is declared unique".format(
+                schema=schema_index.__name__
+            )
+        )
+
+    if declares_sorted(schema_index) and not index.is_monotonic_increasing:
+        raise TypeError(
+            "Index is not sorted, but index schema {schema} is declared sorted".format(
+                schema=schema_index.__name__
+            )
+        )
+
+
+def supports_searchsorted(index: pd.Index) -> bool:
+    """Whether labels can be looked up in ``index`` with a binary search, given that the
+    index is known to be unique and sorted.
+
+    This excludes a `MultiIndex` and datetime-like indexes, for which ``loc`` and ``reindex``
+    support keys that are not labels themselves (e.g. partial string indexing).
+    """
+    if isinstance(index, pd.MultiIndex):
+        return False
+
+    return index.dtype.kind in "iufO" or isinstance(index.dtype, StringDtype)
+
+
+def get_position(index: pd.Index, label: Any) -> Optional[int]:
+    """Returns the position of ``label`` in the unique and sorted ``index``, or None if
+    it is not present."""
+    try:
+        position: Any = index.searchsorted(label)
+    except TypeError:
+        return None
+
+    if position < len(index) and index[position] == label:
+        return int(position)
+
+    return None
+
+
+def get_indexer(index: pd.Index, target: pd.Index) -> Optional[np.ndarray]:
+    """Returns the positions of ``target`` in the unique and sorted ``index``, with -1
+    for the labels that are not present (like `Index.get_indexer()`).
+
+    Unlike `Index.get_indexer()`, this uses a binary search per label, rather than a hash table of
+    all labels in ``index``, which is built on the first lookup in every new index.
+
+    Returns None if the labels cannot be compared to those in ``index``.
+    """
+    if len(index) == 0:
+        return np.full(len(target), -1, dtype=np.intp)
+
+    try:
+        positions = np.minimum(index.searchsorted(target), len(index) - 1)
+        found = np.asarray(index.take(positions) == target, dtype=bool)
+    except TypeError:
+        return None
+
+    return np.where(found, positions, -1)
+
+
+class _SortedLocIndexer(_ImmutableLocIndexer):
+    """An immutable ``loc`` indexer for an index that is known to be unique and sorted,
+    which looks up labels with a binary search."""
+
+    obj: Any
+
+    def __getitem__(self, key: Any) -> Any:
+        index = self.obj.index
+
+        if is_scalar(key):
+            position = get_position(index, key)
+            if position is not None:
+                return self.obj.iloc[position]
+
+        elif isinstance(key, (list, np.ndarray, pd.Index)) and not is_bool_indexer(key):
+            indexer = get_indexer(index, pd.Index(key))
+            if indexer is not None and (indexer >= 0).all():
+                return self.obj.iloc[indexer]
+
+        # fall back to pandas for everything else, including the KeyErrors for missing labels
+        return super().__getitem__(key)
@@ -0,0 +1,215 @@
+"""Hooks to observe the validations that are performed by strictly typed pandas.
+
+Register a listener to receive a `ValidationEvent` for every validation:
+
+.. code-block:: python
+
+    from strictly_typed_pandas.instrumentation import ValidationStatistics, add_listener
+
+    statistics = ValidationStatistics()
+    add_listener(statistics)
+    ...
+    print(statistics.report())
+
+When no listener is registered, validations are not timed and no events are created.
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+from warnings import warn
+
+import numpy as np  # type: ignore
+
+
+class ValidationEvent(NamedTuple):
+    """Describes a single validation.
+
+    :param kind: ``"construction"`` for the validation of a new (Indexed)DataSet, or ``"check"``
+        for a type check by typeguard
+    :param schema: the name of the schema, or of the index and data schemas, separated by a comma
+    :param level: ``"full"`` if all columns were validated, ``"derived"`` if only the columns that
+        could not be derived from the schemas of the inputs were validated, or ``"schema"`` if only
+        the schema of an (Indexed)DataSet was compared to an annotation
+    :param rows: the number of rows of the data
+    :param columns: the number of columns of the data
+    :param start_time: the start of the validation, in nanoseconds since the epoch
+    :param duration: the duration of the validation, in seconds
+    :param error: the error message if the validation failed, otherwise None
+    """
+
+    kind: str
+    schema: str
+    level: str
+    rows: int
+    columns: int
+    start_time: int
+    duration: float
+    error: Optional[str]
+
+
+Listener = Callable[[ValidationEvent], None]
+
+_listeners: List[Listener] = []
+
+
+def add_listener(listener: Listener) -> None:
+    """Registers ``listener``, which is called with a `ValidationEvent` after every
+    validation.
+
+    Listeners are called from the thread that performed the validation, which is not
+    necessarily the main thread (e.g. when validations are offloaded to an executor).
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """Unregisters ``listener``."""
+    _listeners.remove(listener)
+
+
+def observed(kind: str, level: str, schema: Any, df: Any, validate: Callable, *args) -> Any:
+    """Calls ``validate(*args)``, which validates ``df`` against ``schema``, and emits a
+    `ValidationEvent` to the registered listeners.
+
+    If no listeners are registered, this just calls ``validate(*args)``. Any exception raised by
+    ``validate`` is reported as an error, and an exception raised by a listener is emitted as a
+    `RuntimeWarning` rather than failing the validation.
+    """
+    if not _listeners:
+        return validate(*args)
+
+    error = None
+    start_time = time.time_ns()
+    start = time.perf_counter()
+    try:
+        return validate(*args)
+    except TypeError as exc:
+        error = str(exc)
+        raise
+    except BaseException as exc:
+        error = "{}: {}".format(type(exc).__name__, exc)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        event = ValidationEvent(
+            kind=kind,
+            schema=schema_name(schema),
+            level=level,
+            rows=len(df.index),
+            columns=len(df.columns),
+            start_time=start_time,
+            duration=duration,
+            error=error,
+        )
+        for listener in list(_listeners):
+            try:
+                listener(event)
+            except Exception as exc:
+                warn(
+                    "Validation listener {listener!r} raised {exc!r}".format(
+                        listener=listener, exc=exc
+                    ),
+                    RuntimeWarning,
+                )
+
+
+def schema_name(schema: Any) -> str:
+    """Returns the name of ``schema``, or the names of a tuple of schemas separated by a
+    comma."""
+    if isinstance(schema, tuple):
+        return ",".join(schema_name(item) for item in schema)
+
+    return getattr(schema, "__name__", str(schema))
+
+
+class OpenTelemetryListener:
+    """Emits a span for every validation to an OpenTelemetry tracer.
+
+    .. code-block:: python
+
+        add_listener(OpenTelemetryListener())
+
+    The spans are named ``strictly_typed_pandas.construction`` or ``strictly_typed_pandas.check``,
+    and have the other fields of the `ValidationEvent` as attributes. They are children of the
+    span that is current while the validation is performed.
+
+    :param tracer: the tracer to use; defaults to ``opentelemetry.trace.get_tracer()``, which
+        requires ``opentelemetry-api`` to be installed
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace  # type: ignore
+            except ImportError as exc:
+                raise ImportError(
+                    "OpenTelemetryListener requires opentelemetry-api, or a tracer to be passed"
+                ) from exc
+
+            tracer = trace.get_tracer("strictly_typed_pandas")
+
+        self._tracer = tracer
+
+    def __call__(self, event: ValidationEvent) -> None:
+        attributes = {
+            "strictly_typed_pandas.schema": event.schema,
+            "strictly_typed_pandas.level": event.level,
+            "strictly_typed_pandas.rows": event.rows,
+            "strictly_typed_pandas.columns": event.columns,
+        }
+        if event.error is not None:
+            attributes["error.type"] = "TypeError"
+            attributes["strictly_typed_pandas.error"] = event.error
+
+        span = self._tracer.start_span(
+            "strictly_typed_pandas." + event.kind,
+            start_time=event.start_time,
+            attributes=attributes,
+        )
+        span.end(end_time=event.start_time + int(event.duration * 1e9))
+
+
+class ValidationStatistics:
+    """Aggregates the durations of validations in-process, per kind and schema.
+
+    :param max_samples: the number of most recent durations that are kept per kind and
+        schema
+    """
+
+    def __init__(self, max_samples: int = 10_000):
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._durations: Dict[Tuple[str, str], Deque[float]] = {}
+
+    def __call__(self, event: ValidationEvent) -> None:
+        key = (event.kind, event.schema)
+        with self._lock:
+            self._counts[key] += 1
+            if key not in self._durations:
+                self._durations[key] = deque(maxlen=self._max_samples)
+            self._durations[key].append(event.duration)
+
+    def report(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Returns the number of validations and the p50 and p99 of their durations (in
+        seconds), per kind and schema."""
+        with self._lock:
+            samples = {key: list(durations) for key, durations in self._durations.items()}
+            counts = dict(self._counts)
+
+        return {
+            key: {
+                "count": counts[key],
+                "p50": float(np.percentile(durations, 50)),
+                "p99": float(np.percentile(durations, 99)),
+            }
+            for key, durations in sorted(samples.items())
+        }
+
+    def reset(self) -> None:
+        """Removes all recorded durations."""
+        with self._lock:
+            self._counts.clear()
+            self._durations.clear()
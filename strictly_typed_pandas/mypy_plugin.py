@@ -0,0 +1,171 @@
+"""A mypy plugin that infers the schema of the results of pandas operations on DataSets.
+
+Enable it in the mypy configuration, e.g. in ``pyproject.toml``:
+
+.. code-block:: toml
+
+    [tool.mypy]
+    plugins = ["strictly_typed_pandas.mypy_plugin"]
+
+On a ``DataSet[Schema]`` (or ``IndexedDataSet[IndexSchema, DataSchema]``), the plugin infers:
+
+    * ``DataSet[Schema]`` for the functions that only select or reorder rows (e.g. ``head()``,
+      ``sort_values()`` or ``query()``), and for row selections with a boolean mask or a slice
+      (e.g. ``df[df.a > 1]`` or ``df[:10]``). These results are bound to the schema at runtime as
+      well, without validating them. On an ``IndexedDataSet``, this excludes the functions that
+      reorder rows (the result may violate ``__sorted__`` in the index schema) and calls with
+      ``ignore_index`` (which replaces the index); these are inferred to be a ``DataFrame``.
+    * ``DataFrame`` for the other functions that pandas-stubs annotate to return ``Self`` (e.g.
+      ``copy()``, ``dropna()`` or ``reset_index()``), since these return a ``DataFrame`` at runtime.
+
+Hence, results that mypy infers to be a ``DataSet[Schema]`` need not be created again with
+``DataSet[Schema](df)``, and are accepted by `typechecked` functions without validating their
+data.
+"""
+
+from functools import partial
+from typing import Callable, Optional, Type
+
+from mypy.nodes import TypeInfo
+from mypy.plugin import MethodContext, Plugin
+from mypy.types import Instance, ProperType
+from mypy.types import Type as MypyType
+from mypy.types import UnionType, get_proper_type
+
+# keep in sync with `strictly_typed_pandas.dataset.schema_preserving_functions`
+schema_preserving_functions = {
+    "drop_duplicates",
+    "head",
+    "nlargest",
+    "nsmallest",
+    "query",
+    "sort_index",
+    "sort_values",
+    "tail",
+}
+
+# keep in sync with `strictly_typed_pandas.dataset.reordering_functions`
+reordering_functions = {"nlargest", "nsmallest", "sort_index", "sort_values"}
+
+dataset_base_name = "strictly_typed_pandas.dataset.DataSetBase"
+indexed_dataset_name = "strictly_typed_pandas.dataset.IndexedDataSet"
+dataframe_name = "pandas.core.frame.DataFrame"
+dataframe_classes = {dataframe_name, "pandas.core.generic.NDFrame"}
+
+
+class StrictlyTypedPandasPlugin(Plugin):
+    def get_method_hook(self, fullname: str) -> Optional[Callable[[MethodContext], MypyType]]:
+        class_name, _, method = fullname.rpartition(".")
+        info = self._dataset_info(class_name)
+        if info is None:
+            return None
+
+        defined_by = info.get_containing_type_info(method)
+        if defined_by is None:
+            return None
+
+        if method == "__getitem__":
+            return _getitem_hook if defined_by.fullname == dataset_base_name else None
+
+        # the functions that are defined by DataSets themselves are annotated accordingly
+        if defined_by.fullname not in dataframe_classes or method.startswith("_"):
+            return None
+
+        if method in schema_preserving_functions:
+            return partial(_schema_preserving_hook, method)
+
+        return _schema_dropping_hook
+
+    def _dataset_info(self, class_name: str) -> Optional[TypeInfo]:
+        """Returns the class ``class_name``, if it is a (subclass of a) DataSet."""
+        node = self.lookup_fully_qualified(class_name)
+        if node is None or not isinstance(node.node, TypeInfo):
+            return None
+
+        return node.node if node.node.has_base(dataset_base_name) else None
+
+
+def _dataset(ctx: MethodContext) -> Optional[Instance]:
+    """Returns the type of the object on which the method is called, if it is a
+    DataSet."""
+    receiver = get_proper_type(ctx.type)
+    if isinstance(receiver, Instance) and receiver.type.has_base(dataset_base_name):
+        return receiver
+
+    return None
+
+
+def _is_dataframe(type_: ProperType) -> bool:
+    return isinstance(type_, Instance) and type_.type.fullname == dataframe_name
+
+
+def _replace(type_: MypyType, replace: Callable[[ProperType], bool], by: MypyType) -> MypyType:
+    """Replaces ``type_`` (or the items of the union ``type_``) by ``by`` where
+    ``replace``."""
+    proper = get_proper_type(type_)
+    if isinstance(proper, UnionType):
+        return UnionType.make_union(
+            [_replace(item, replace, by) for item in proper.items], proper.line, proper.column
+        )
+
+    return by if replace(proper) else type_
+
+
+def _schema_preserving_hook(method: str, ctx: MethodContext) -> MypyType:
+    dataset = _dataset(ctx)
+    if dataset is None:
+        return ctx.default_return_type
+
+    if dataset.type.has_base(indexed_dataset_name) and (
+        method in reordering_functions or _passes(ctx, "ignore_index")
+    ):
+        # see `IndexedDataSet._bind_schema()`
+        return _schema_dropping_hook(ctx)
+
+    return _replace(ctx.default_return_type, _is_dataframe, dataset)
+
+
+def _passes(ctx: MethodContext, argument: str) -> bool:
+    """Whether the call passes ``argument``."""
+    return argument in ctx.callee_arg_names and bool(ctx.args[ctx.callee_arg_names.index(argument)])
+
+
+def _schema_dropping_hook(ctx: MethodContext) -> MypyType:
+    dataset = _dataset(ctx)
+    if dataset is None:
+        return ctx.default_return_type
+
+    dataframe = next(
+        Instance(info, []) for info in dataset.type.mro if info.fullname == dataframe_name
+    )
+    return _replace(ctx.default_return_type, lambda type_: type_ == dataset, dataframe)
+
+
+def _getitem_hook(ctx: MethodContext) -> MypyType:
+    dataset = _dataset(ctx)
+    if dataset is None or not ctx.arg_types or len(ctx.arg_types[0]) != 1:
+        return ctx.default_return_type
+
+    if _selects_rows(get_proper_type(ctx.arg_types[0][0])):
+        return dataset
+
+    return ctx.default_return_type
+
+
+def _selects_rows(key: ProperType) -> bool:
+    """Whether ``df[key]`` selects rows, i.e. ``key`` is a slice or a boolean Series."""
+    if not isinstance(key, Instance):
+        return False
+
+    if key.type.fullname == "builtins.slice":
+        return True
+
+    if key.type.fullname == "pandas.core.series.Series" and key.args:
+        item = get_proper_type(key.args[0])
+        return isinstance(item, Instance) and item.type.fullname == "builtins.bool"
+
+    return False
+
+
+def plugin(version: str) -> Type[Plugin]:
+    return StrictlyTypedPandasPlugin
@@ -0,0 +1,61 @@
+from typing import Any, Dict
+
+import numpy as np  # type: ignore
+import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import infer_dtype
+
+from strictly_typed_pandas.pandas_types import BooleanDtype, Int64Dtype, StringDtype
+
+# the dtypes that the types in a schema with ``__nullable__ = True`` are mapped to
+nullable_dtypes: Dict[Any, ExtensionDtype] = {
+    int: Int64Dtype(),
+    np.int64: Int64Dtype(),
+    bool: BooleanDtype(),
+    np.bool_: BooleanDtype(),
+    str: StringDtype(),
+}
+
+# per nullable dtype: the kinds of numpy dtypes, and the types inferred from object columns, that
+# can be converted to it without coercing the values
+_convertible_kinds = {Int64Dtype.name: "iuf", BooleanDtype.name: "b", StringDtype.name: ""}
+_convertible_inferred_types = {
+    Int64Dtype.name: {"integer", "empty"},
+    BooleanDtype.name: {"boolean", "empty"},
+    StringDtype.name: {"string", "empty"},
+}
+
+
+def declares_nullable(schema: Any) -> bool:
+    """Whether ``schema`` declares that its columns are nullable, i.e. ``__nullable__ =
+    True``."""
+    return bool(getattr(schema, "__nullable__", False))
+
+
+def to_nullable(values: pd.Series, dtype: ExtensionDtype) -> pd.Series:
+    """Converts ``values`` to the nullable ``dtype``, e.g. a float64 column with
+    integers and NaNs to ``Int64``.
+
+    Values that cannot be converted without coercion (e.g. strings to ``Int64``) are returned as
+    is, such that they are reported by the validation of the schema.
+    """
+    if values.dtype == dtype or dtype.name not in _convertible_kinds:
+        return values
+
+    if isinstance(dtype, StringDtype) and isinstance(values.dtype, StringDtype):
+        return values
+
+    observed = values.dtype
+    convertible = (
+        isinstance(observed, np.dtype) and observed.kind in _convertible_kinds[dtype.name]
+    ) or (
+        observed == object
+        and infer_dtype(values, skipna=True) in _convertible_inferred_types[dtype.name]
+    )
+    if not convertible:
+        return values
+
+    try:
+        return values.astype(dtype)
+    except (TypeError, ValueError):
+        return values
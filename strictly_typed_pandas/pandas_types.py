@@ -71,3 +71,12 @@ else:  # pragma: no cover
 
     class BooleanDtype(BackwardCompatibility):  # type: ignore
         pass
+
+
+def copy_on_write() -> bool:
+    """Whether pandas' Copy-on-Write is enabled, i.e. ``pd.options.mode.copy_on_write =
+    True`` (pandas >= 2.0)."""
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # pragma: no cover
+        return False
@@ -0,0 +1,192 @@
+"""A profiler that attributes the overhead of strictly typed pandas to the code that
+causes it.
+
+.. code-block:: python
+
+    from strictly_typed_pandas.profiling import Profile
+
+    with Profile():
+        run_pipeline()
+
+This prints a report with the time spent in strictly typed pandas per call site (i.e. the line in
+your code that caused it) and per category, ranked by the total time.
+"""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import strictly_typed_pandas
+from strictly_typed_pandas import instrumentation
+from strictly_typed_pandas.dataset import DataSetBase, intercept, intercepted_functions
+
+ATTRIBUTE_INTERCEPTION = "attribute interception"
+VALIDATION = "validation"
+TYPE_CHECKS = "runtime type checks"
+
+# frames in these directories are skipped when looking for the call site, as well as the frames
+# of the standard library (e.g. of executor threads)
+_library_paths = tuple(
+    os.path.dirname(module.__file__) + os.sep  # type: ignore
+    for module in [strictly_typed_pandas, pd]
+)
+_stdlib_path = sysconfig.get_paths()["stdlib"] + os.sep
+_site_packages_paths = tuple(
+    sysconfig.get_paths()[name] + os.sep for name in ["purelib", "platlib"]
+)
+
+_unknown_call_site = "<unknown>"
+
+
+def _is_library(filename: str) -> bool:
+    if filename.startswith(_library_paths) or filename.startswith("<"):
+        return True
+
+    return filename.startswith(_stdlib_path) and not filename.startswith(_site_packages_paths)
+
+
+def _find_call_site() -> str:
+    """Returns the location of the innermost frame on the stack that is not part of
+    strictly typed pandas, pandas or the standard library."""
+    frame: Any = sys._getframe(1)
+    while frame is not None:
+        if not _is_library(frame.f_code.co_filename):
+            return "{}:{} ({})".format(
+                frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+            )
+        frame = frame.f_back
+
+    return _unknown_call_site
+
+
+class Profile:
+    """Measures the overhead of strictly typed pandas while it is active, per call site and per
+    category:
+
+    * attribute interception: the DataFrame methods that are wrapped on a DataSet to prevent
+      inplace modifications and to preserve the schema of their results (excluding the time
+      spent in pandas itself).
+    * validation: validating data against a schema upon the creation of a DataSet.
+    * runtime type checks: checking DataSets against annotations with typeguard.
+
+    The profiler only instruments strictly typed pandas while it is active, so there is no
+    overhead otherwise. Only one profiler can be active at a time.
+
+    :param print_report: whether to print the report when the profiler stops
+    :param limit: the maximum number of rows in the printed report
+    """
+
+    _active: Optional["Profile"] = None
+
+    def __init__(self, print_report: bool = True, limit: int = 20):
+        self._print_report = print_report
+        self._limit = limit
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._durations: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._local = threading.local()
+        self._originals: Dict[str, Callable] = {}
+
+    def __enter__(self) -> "Profile":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+        if self._print_report:
+            print(self.report(self._limit))
+
+    def start(self) -> None:
+        """Starts instrumenting strictly typed pandas."""
+        if Profile._active is not None:
+            raise RuntimeError("Another profiler is already active")
+
+        Profile._active = self
+        for name, function in intercepted_functions.items():
+            self._originals[name] = DataSetBase.__dict__[name]
+            setattr(DataSetBase, name, self._instrument(function))
+        instrumentation.add_listener(self._on_validation)
+
+    def stop(self) -> None:
+        """Stops instrumenting strictly typed pandas."""
+        if Profile._active is not self:
+            return
+
+        instrumentation.remove_listener(self._on_validation)
+        for name, original in self._originals.items():
+            setattr(DataSetBase, name, original)
+        self._originals.clear()
+        Profile._active = None
+
+    def record(self, call_site: str, category: str, duration: float) -> None:
+        """Adds ``duration`` seconds to the time spent in ``category`` for
+        ``call_site``."""
+        with self._lock:
+            self._calls[(call_site, category)] += 1
+            self._durations[(call_site, category)] += duration
+
+    def results(self) -> List[Tuple[str, str, int, float]]:
+        """Returns the call site, category, number of calls and the total duration in
+        seconds of all measurements, ranked by their total duration."""
+        with self._lock:
+            results = [
+                (call_site, category, self._calls[(call_site, category)], duration)
+                for (call_site, category), duration in self._durations.items()
+            ]
+
+        return sorted(results, key=lambda result: result[3], reverse=True)
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Returns the results as a table, ranked by the total duration."""
+        results = self.results()
+        total = sum(result[3] for result in results)
+
+        lines = [
+            "strictly typed pandas overhead: {:.2f} ms".format(total * 1000),
+            "{:>10}  {:>8}  {:<24}  {}".format("total ms", "calls", "category", "call site"),
+        ]
+        for call_site, category, calls, duration in results[:limit]:
+            lines.append(
+                "{:>10.2f}  {:>8}  {:<24}  {}".format(duration * 1000, calls, category, call_site)
+            )
+
+        return "\n".join(lines)
+
+    def _instrument(self, function: Callable) -> Callable:
+        """Returns the DataSet method that wraps the DataFrame method ``function``,
+        which records the time spent in the wrapper, excluding the time spent in
+        ``function`` itself."""
+        local = self._local
+
+        @wraps(function)
+        def timed_function(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                local.duration = time.perf_counter() - start
+
+        interceptor = intercept(timed_function)
+
+        @wraps(interceptor)
+        def timed_interceptor(*args, **kwargs):
+            local.duration = 0.0
+            start = time.perf_counter()
+            try:
+                return interceptor(*args, **kwargs)
+            finally:
+                overhead = time.perf_counter() - start - local.duration
+                self.record(_find_call_site(), ATTRIBUTE_INTERCEPTION, overhead)
+
+        return timed_interceptor
+
+    def _on_validation(self, event: instrumentation.ValidationEvent) -> None:
+        category = VALIDATION if event.kind == "construction" else TYPE_CHECKS
+        self.record(_find_call_site(), category, event.duration)
@@ -22,6 +22,11 @@ def pytest_addoption(parser):
             "instrument for type checking by strictly typed pandas"
         ),
     )
+    group.addoption(
+        "--stp-validate-casts",
+        action="store_true",
+        help="validate the data in DataSet[Schema].unsafe_cast(df), like DataSet[Schema](df)",
+    )
     if not TYPEGUARD_INSTALLED:
         group = parser.getgroup("typeguard")
         group.addoption(
@@ -41,6 +46,11 @@ def _parse_packages(val: str) -> List[str]:
 
 
 def pytest_configure(config):
+    if config.getoption("stp_validate_casts"):
+        from strictly_typed_pandas.dataset import set_validate_casts
+
+        set_validate_casts(True)
+
     packages = _parse_packages(config.getoption("stp_typeguard_packages"))
     typeguard_packages = _parse_packages(config.getoption("typeguard_packages"))
 
@@ -0,0 +1,91 @@
+from typing import Any, Dict, NamedTuple
+
+import numpy as np  # type: ignore
+import pandas as pd
+
+from strictly_typed_pandas.coerce import cast_plan, parse_column
+from strictly_typed_pandas.dataset import DataSet, column_dtypes
+from strictly_typed_pandas.validate_schema import _check_names, compile_schema
+
+
+class QuarantineResult(NamedTuple):
+    """The result of `quarantine()`.
+
+    :param dataset: the rows that adhere to the schema (after coercion), as a ``DataSet[Schema]``
+    :param rejected: the other rows, as they were in the DataFrame
+    :param reasons: per rejected row (with the same index as ``rejected``) and per column of which
+        values could not be coerced to the schema, whether the value of this row could not be
+        coerced
+    """
+
+    dataset: DataSet
+    rejected: pd.DataFrame
+    reasons: pd.DataFrame
+
+
+def quarantine(df: pd.DataFrame, schema: Any) -> QuarantineResult:
+    """Splits ``df`` into the rows that can be coerced to ``schema``, and the rows that
+    cannot.
+
+    .. code-block:: python
+
+        class Schema:
+            a: int
+
+        df = pd.DataFrame({"a": ["1", "2", "three", None]})
+        dataset, rejected, reasons = quarantine(df, Schema)
+
+    Like `DataSet.coerce()`, the columns of which the dtype does not adhere to the schema are
+    cast. Where `DataSet.coerce()` raises a TypeError if any value cannot be cast (e.g. ``"three"``
+    or a missing value to ``int``), these rows are set aside in ``rejected``. The values that
+    cannot be cast are found with a vectorized check per column, after which the rows are split
+    with a single ``take()`` per output.
+
+    :raises TypeError: if ``df`` does not adhere to the schema regardless of its values, e.g.
+        because it lacks a column, or because a column cannot be cast at all
+    """
+    compiled = compile_schema(schema)
+    if df.columns.duplicated().any():
+        msg = "DataSet has duplicate columns: {cols}".format(
+            cols=df.columns[df.columns.duplicated()]
+        )
+        raise TypeError(msg)
+
+    _check_names(set(compiled.columns.keys()), set(df.columns))
+
+    parsed: Dict[Any, pd.Series] = {}
+    failures: Dict[Any, np.ndarray] = {}
+    for name, dtype in cast_plan(compiled, tuple(df.columns), tuple(column_dtypes(df))).items():
+        values = pd.DataFrame.__getitem__(df, name)
+        parsed[name], failed = parse_column(values, dtype)
+        if failed.any():
+            failures[name] = failed
+
+    if parsed:
+        columns = {
+            name: parsed.get(name, pd.DataFrame.__getitem__(df, name)) for name in df.columns
+        }
+        prepared = pd.DataFrame(columns, index=df.index, copy=False)
+    else:
+        prepared = df
+
+    if not failures:
+        return QuarantineResult(
+            DataSet[schema].coerce(prepared),  # type: ignore[valid-type]
+            df.iloc[:0],
+            pd.DataFrame(index=df.index[:0]),
+        )
+
+    rejected = np.logical_or.reduce(list(failures.values()))
+    accepted_rows = np.flatnonzero(~rejected)
+    rejected_rows = np.flatnonzero(rejected)
+
+    accepted = prepared.take(accepted_rows)  # type: ignore[arg-type]
+    return QuarantineResult(
+        DataSet[schema].coerce(accepted),  # type: ignore[valid-type]
+        df.take(rejected_rows),  # type: ignore[arg-type]
+        pd.DataFrame(
+            {name: failed[rejected_rows] for name, failed in failures.items()},
+            index=df.index[rejected_rows],
+        ),
+    )
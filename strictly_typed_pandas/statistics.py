@@ -0,0 +1,125 @@
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping
+
+import pandas as pd
+
+from strictly_typed_pandas.dataset import DataSetBase
+
+
+class ColumnStatistics:
+    """The statistics of a column of a DataSet, of which each is computed upon its first
+    access and cached thereafter.
+
+    :param values: the values of the column
+    """
+
+    def __init__(self, values: pd.Series):
+        self._values = values
+        self._computed: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def min(self) -> Any:
+        """The smallest value, ignoring missing values; None if the values cannot be
+        ordered or if there are no values."""
+        return self._get("min", partial(_reduce, "min"))
+
+    @property
+    def max(self) -> Any:
+        """The largest value, ignoring missing values; None if the values cannot be
+        ordered or if there are no values."""
+        return self._get("max", partial(_reduce, "max"))
+
+    @property
+    def null_count(self) -> int:
+        """The number of missing values."""
+        return self._get("null_count", lambda values: int(values.isna().sum()))
+
+    @property
+    def unique_count(self) -> int:
+        """The number of distinct values, ignoring missing values."""
+        return self._get("unique_count", lambda values: int(values.nunique(dropna=True)))
+
+    def _get(self, name: str, compute: Callable[[pd.Series], Any]) -> Any:
+        with self._lock:
+            if name not in self._computed:
+                self._computed[name] = compute(self._values)
+            return self._computed[name]
+
+    def __repr__(self) -> str:
+        return "ColumnStatistics(min={}, max={}, null_count={}, unique_count={})".format(
+            self.min, self.max, self.null_count, self.unique_count
+        )
+
+
+class Statistics(Mapping[Hashable, ColumnStatistics]):
+    """The `ColumnStatistics` per column of a DataSet, see `column_statistics()`.
+
+    Since a DataSet is immutable, its statistics remain valid: they are computed per
+    column upon their first access and cached on the DataSet.
+
+    :param df: the DataSet
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        # a DataFrame that shares the data of the DataSet, rather than the DataSet itself, such
+        # that the DataSet (which refers to its statistics) is not part of a reference cycle
+        self._df = pd.DataFrame(df, copy=False)
+        self._columns: Dict[Hashable, ColumnStatistics] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: Hashable) -> ColumnStatistics:
+        with self._lock:
+            if name not in self._columns:
+                if name not in self._df.columns:
+                    raise KeyError(name)
+                self._columns[name] = ColumnStatistics(self._df[name])
+            return self._columns[name]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._df.columns)
+
+    def __len__(self) -> int:
+        return len(self._df.columns)
+
+
+def column_statistics(df: DataSetBase) -> Statistics:
+    """Returns the statistics of the columns of ``df``, e.g.
+    ``column_statistics(df)["a"].max``.
+
+    .. code-block:: python
+
+        from strictly_typed_pandas.statistics import column_statistics
+
+        stats = column_statistics(df)["a"]
+        stats.min, stats.max, stats.null_count, stats.unique_count
+
+    Each statistic is computed upon its first access and cached on ``df``, so later reads are free.
+    They are not propagated to the results of operations on ``df`` (e.g. ``df.head()``). Without
+    pandas' Copy-on-Write, the statistics are not updated if the data is modified through a
+    `DataFrame` that shares it (see `DataSetBase.to_dataframe()`).
+
+    This is a function rather than a property of the DataSet, such that it does not hide a column
+    with the same name.
+    """
+    statistics = df.__dict__.get("_statistics")
+    if statistics is None:
+        statistics = Statistics(df)
+        object.__setattr__(df, "_statistics", statistics)
+
+    return statistics
+
+
+def _reduce(function: str, values: pd.Series) -> Any:
+    """Returns ``values.min()`` or ``values.max()``, or None if this is missing or
+    undefined (e.g. for an unordered categorical)."""
+    if values.dtype == object:
+        values = values.dropna()  # e.g. strings and None cannot be compared
+
+    try:
+        result = getattr(values, function)()
+    except TypeError:
+        return None
+
+    return None if pd.isna(result) else result
@@ -0,0 +1,240 @@
+import sys
+import threading
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+from warnings import warn
+
+from strictly_typed_pandas._vendor import typeguard
+from strictly_typed_pandas.dataset import DataSetBase
+
+_monitoring: Any = getattr(sys, "monitoring", None)
+
+
+def references_dataset(annotation: Any) -> bool:
+    """Returns whether an annotation refers to a `DataSet` or `IndexedDataSet`, possibly
+    nested inside other types (e.g. ``Optional[DataSet[Schema]]``)."""
+    if isinstance(annotation, str):
+        return "DataSet" in annotation
+
+    if isinstance(annotation, type) and issubclass(annotation, DataSetBase):
+        return True
+
+    origin = getattr(annotation, "__origin__", None)
+    if isinstance(origin, type) and issubclass(origin, DataSetBase):
+        return True
+
+    return any(references_dataset(arg) for arg in getattr(annotation, "__args__", ()))
+
+
+class MonitoringTypeChecker:
+    """A type checker that collects type violations using :mod:`sys.monitoring` (Python
+    3.12+), as a low-overhead replacement of typeguard's `TypeChecker`.
+
+    Rather than inspecting every call frame, it only keeps events enabled for code objects of
+    functions whose annotations reference a `DataSet` or `IndexedDataSet`. All other code
+    objects are disabled after their first call, so unrelated code runs at (nearly) full speed.
+    Since :mod:`sys.monitoring` can only enable disabled code objects again for all tools at once,
+    these remain disabled for later type checkers that use the same tool id.
+
+    Violations are emitted as a `TypeWarning`, like typeguard's `TypeChecker`.
+
+    :param packages: list of top level modules and packages or modules to include for type
+        checking
+    :param all_threads: ``True`` to check types in all threads, ``False`` to only check in the
+        thread that started the checker
+    :param forward_refs_policy: how to handle unresolvable forward references in annotations
+    """
+
+    def __init__(
+        self,
+        packages: Union[str, Sequence[str]],
+        *,
+        all_threads: bool = True,
+        forward_refs_policy: typeguard.ForwardRefPolicy = typeguard.ForwardRefPolicy.ERROR,
+    ):
+        if _monitoring is None:
+            raise RuntimeError("MonitoringTypeChecker requires Python 3.12 or higher.")
+
+        self.all_threads = all_threads
+        self.annotation_policy = forward_refs_policy
+        self._functions: Dict[CodeType, Callable] = {}
+        self._memos: Dict[Callable, Any] = {}
+        self._tool_id: Optional[int] = None
+        self._thread_id: Optional[int] = None
+
+        self._packages: Tuple[str, ...]
+        if isinstance(packages, str):
+            self._packages = (packages,)
+        else:
+            self._packages = tuple(packages)
+
+    @property
+    def active(self) -> bool:
+        """Return ``True`` if currently collecting type violations."""
+        return self._tool_id is not None
+
+    def should_check_type(self, func: Callable) -> bool:
+        annotations = getattr(func, "__annotations__", None)
+        if not annotations:
+            return False
+
+        if typeguard.isasyncgenfunction(func):
+            return False
+
+        if not self._in_packages(func.__module__):
+            return False
+
+        return any(references_dataset(annotation) for annotation in annotations.values())
+
+    def _in_packages(self, module: Optional[str]) -> bool:
+        module = module or ""
+        return any(
+            module == package or module.startswith(package + ".") for package in self._packages
+        )
+
+    def start(self):
+        if self.active:
+            raise RuntimeError("type checker already running")
+
+        tool_id = next(
+            (i for i in (3, 4, 5, 0, 1, 2) if _monitoring.get_tool(i) is None),
+            None,
+        )
+        if tool_id is None:
+            raise RuntimeError("No free sys.monitoring tool id available.")
+
+        self._tool_id = tool_id
+        self._thread_id = threading.get_ident()
+
+        events = _monitoring.events
+        _monitoring.use_tool_id(tool_id, "strictly_typed_pandas")
+        _monitoring.register_callback(tool_id, events.PY_START, self._on_start)
+        _monitoring.register_callback(tool_id, events.PY_RETURN, self._on_return)
+        _monitoring.register_callback(tool_id, events.PY_YIELD, self._on_yield)
+        _monitoring.set_events(tool_id, events.PY_START)
+
+    def stop(self):
+        if not self.active:
+            return
+
+        tool_id = self._tool_id
+        events = _monitoring.events
+        _monitoring.set_events(tool_id, events.NO_EVENTS)
+        for code in self._functions:
+            _monitoring.set_local_events(tool_id, code, events.NO_EVENTS)
+        for event in (events.PY_START, events.PY_RETURN, events.PY_YIELD):
+            _monitoring.register_callback(tool_id, event, None)
+        _monitoring.free_tool_id(tool_id)
+
+        self._functions.clear()
+        self._memos.clear()
+        self._tool_id = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _skip_thread(self) -> bool:
+        return not self.all_threads and threading.get_ident() != self._thread_id
+
+    def _on_start(self, code: CodeType, instruction_offset: int) -> Any:
+        frame = sys._getframe(1)
+        func = self._functions.get(code)
+        if func is None:
+            func = self._register(code, frame)
+            if func is None:
+                return _monitoring.DISABLE
+
+        if self._skip_thread():
+            return None
+
+        memo = self._memo(func, frame)
+        if memo.is_generator:
+            # arguments are bound upon creation of the generator, not upon its first resumption
+            return None
+
+        try:
+            typeguard.check_argument_types(memo)
+        except TypeError as exc:
+            warn(typeguard.TypeWarning(memo, "call", frame, exc))
+
+        return None
+
+    def _on_return(self, code: CodeType, instruction_offset: int, retval: Any) -> Any:
+        func = self._functions.get(code)
+        if func is None or self._skip_thread() or typeguard.isgeneratorfunction(func):
+            return None
+
+        frame = sys._getframe(1)
+        memo = self._memo(func, frame)
+        try:
+            typeguard.check_return_type(retval, memo)
+        except TypeError as exc:
+            warn(typeguard.TypeWarning(memo, "return", frame, exc))
+
+        return None
+
+    def _on_yield(self, code: CodeType, instruction_offset: int, retval: Any) -> Any:
+        func = self._functions.get(code)
+        if func is None or self._skip_thread():
+            return None
+
+        frame = sys._getframe(1)
+        memo = self._memo(func, frame)
+        return_type = memo.type_hints.get("return")
+        if getattr(return_type, "__origin__", None) not in typeguard.generator_origin_types:
+            return None
+
+        try:
+            typeguard.check_type("yielded value", retval, return_type.__args__[0], memo)
+        except TypeError as exc:
+            warn(typeguard.TypeWarning(memo, "return", frame, exc))
+
+        return None
+
+    def _register(self, code: CodeType, frame) -> Optional[Callable]:
+        # finding the function of a frame scans the referrers of its code object, which is far
+        # more expensive than checking the module first
+        if not self._in_packages(frame.f_globals.get("__name__")):
+            return None
+
+        try:
+            func = typeguard.find_function(frame)
+        except Exception:
+            return None
+
+        if func is None or not self.should_check_type(func):
+            return None
+
+        events = _monitoring.events
+        _monitoring.set_local_events(self._tool_id, code, events.PY_RETURN | events.PY_YIELD)
+        self._functions[code] = func
+        return func
+
+    def _memo(self, func: Callable, frame) -> Any:
+        """Creates the call memo of ``func`` for ``frame``.
+
+        Resolving the signature and type hints of the function is only done once: later memos
+        are shallow copies of the first one, bound to the locals of the new frame.
+        """
+        template = self._memos.get(func)
+        if template is None:
+            template = self._memos[func] = typeguard._CallMemo(
+                func, frame.f_locals, forward_refs_policy=self.annotation_policy
+            )
+            return template
+
+        memo = typeguard._CallMemo.__new__(typeguard._CallMemo)
+        for name in ("globals", "func", "func_name", "is_generator", "type_hints"):
+            setattr(memo, name, getattr(template, name))
+        memo.locals = memo.arguments = frame.f_locals
+        return memo
+
+
+if _monitoring is not None:
+    TypeChecker: Any = MonitoringTypeChecker
+else:  # pragma: no cover
+    TypeChecker = typeguard.TypeChecker
@@ -1,7 +1,17 @@
+import asyncio
+import inspect
+import sys
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from functools import partial, wraps
 from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List, Optional
 
 from strictly_typed_pandas import DataSet, IndexedDataSet
 from strictly_typed_pandas._vendor import typeguard
+from strictly_typed_pandas.dataset import _validate_data, _validate_indexed_schemas
+from strictly_typed_pandas.index_guarantees import declares_sorted, declares_unique
+from strictly_typed_pandas.instrumentation import observed
 
 try:
     COMPATIBLE_EXTERNAL_TYPEGUARD_EXISTS = version("typeguard").startswith("2.")
@@ -14,6 +24,59 @@ else:
     external_typeguard = None
 
 
+# When set, validations of DataSets are collected here rather than executed immediately, such
+# that they can be offloaded to an executor (see `typechecked(offload_validation=True)`).
+_deferred_validations: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "deferred_validations", default=None
+)
+
+
+def _validate_or_defer(
+    argname: str, expected: str, validate: Callable[[], None], expensive: bool
+) -> None:
+    """Validates a DataSet without a schema (e.g. ``DataSet(df)``) against the expected
+    schema.
+
+    Comparing the dtypes of the columns with the schema is cached per signature of the columns,
+    and takes about 10 microseconds, whereas awaiting an executor takes about 75 microseconds.
+    Hence, only ``expensive`` validations (i.e. the guarantees on the index, such as
+    ``__unique__``, which take O(rows)) are deferred to an executor within an offloading
+    `typechecked` coroutine.
+    """
+
+    def validation() -> None:
+        try:
+            validate()
+        except TypeError as exc:
+            msg = "Type of {argname} must be a {expected}; {exc}"
+            raise TypeError(msg.format(argname=argname, expected=expected, exc=exc)) from None
+
+    deferred = _deferred_validations.get()
+    if deferred is None or not expensive:
+        validation()
+    else:
+        deferred.append(validation)
+
+
+async def _check_offloaded(check: Callable[[], Any], executor: Optional[Executor]) -> None:
+    """Runs the cheap parts of ``check`` inline and awaits the DataSet validations it
+    requires in ``executor``."""
+    deferred: List[Callable[[], None]] = []
+    token = _deferred_validations.set(deferred)
+    try:
+        check()
+    except TypeError as exc:
+        raise TypeError(*exc.args) from None
+    finally:
+        _deferred_validations.reset(token)
+
+    if deferred:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, validation) for validation in deferred)
+        )
+
+
 def check_dataset(argname: str, value, expected_type, memo: typeguard._TypeCheckMemo) -> None:
     schema_expected = expected_type.__args__[0]
     if not isinstance(value, DataSet):
@@ -26,7 +89,38 @@ def check_dataset(argname: str, value, expected_type, memo: typeguard._TypeCheck
             )
         )
 
-    schema_observed = value.__orig_class__.__args__[0]
+    orig_class = getattr(value, "__orig_class__", None)
+    if orig_class is None:
+        _validate_or_defer(
+            argname,
+            "DataSet[{}]".format(typeguard.qualified_name(schema_expected)),
+            partial(
+                observed,
+                "check",
+                "full",
+                schema_expected,
+                value,
+                _validate_data,
+                value,
+                schema_expected,
+            ),
+            expensive=False,
+        )
+        return
+
+    observed(
+        "check",
+        "schema",
+        schema_expected,
+        value,
+        _check_dataset_schema,
+        argname,
+        orig_class.__args__[0],
+        schema_expected,
+    )
+
+
+def _check_dataset_schema(argname: str, schema_observed, schema_expected) -> None:
     if schema_observed != schema_expected:
         msg = "Type of {argname} must be a DataSet[{schema_expected}]; got DataSet[{schema_observed}] instead"
         raise TypeError(
@@ -55,8 +149,51 @@ def check_indexed_dataset(argname: str, value, expected_type, memo: typeguard._T
             )
         )
 
-    schema_index_observed = value.__orig_class__.__args__[0]
-    schema_data_observed = value.__orig_class__.__args__[1]
+    orig_class = getattr(value, "__orig_class__", None)
+    if orig_class is None:
+        _validate_or_defer(
+            argname,
+            "IndexedDataSet[{},{}]".format(
+                typeguard.qualified_name(schema_index_expected),
+                typeguard.qualified_name(schema_data_expected),
+            ),
+            partial(
+                observed,
+                "check",
+                "full",
+                (schema_index_expected, schema_data_expected),
+                value,
+                _validate_indexed_schemas,
+                value,
+                schema_index_expected,
+                schema_data_expected,
+            ),
+            expensive=declares_unique(schema_index_expected)
+            or declares_sorted(schema_index_expected),
+        )
+        return
+
+    observed(
+        "check",
+        "schema",
+        (schema_index_expected, schema_data_expected),
+        value,
+        _check_indexed_dataset_schemas,
+        argname,
+        orig_class.__args__[0],
+        orig_class.__args__[1],
+        schema_index_expected,
+        schema_data_expected,
+    )
+
+
+def _check_indexed_dataset_schemas(
+    argname: str,
+    schema_index_observed,
+    schema_data_observed,
+    schema_index_expected,
+    schema_data_expected,
+) -> None:
     if (
         schema_index_observed != schema_index_expected
         or schema_data_observed != schema_data_expected
@@ -76,9 +213,124 @@ def check_indexed_dataset(argname: str, value, expected_type, memo: typeguard._T
         )
 
 
+class _OffloadingAsyncGenerator:
+    """Checks the arguments of an async generator function upon the first iteration, and
+    the values it yields thereafter."""
+
+    def __init__(self, wrapped, memo: typeguard._CallMemo, executor: Optional[Executor]):
+        return_type = memo.type_hints.get("return")
+        self._wrapped = wrapped
+        self._memo = memo
+        self._executor = executor
+        self._yield_type = Any
+        self._initialized = False
+
+        if getattr(return_type, "__origin__", None) in typeguard.asyncgen_origin_types:
+            self._yield_type = return_type.__args__[0]
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.asend(None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._wrapped, name)
+
+    def athrow(self, *args):
+        return self._wrapped.athrow(*args)
+
+    def aclose(self):
+        return self._wrapped.aclose()
+
+    async def asend(self, obj):
+        if not self._initialized:
+            self._initialized = True
+            await _check_offloaded(
+                partial(typeguard.check_argument_types, self._memo), self._executor
+            )
+
+        value = await self._wrapped.asend(obj)
+        await _check_offloaded(
+            partial(
+                typeguard.check_type,
+                "value yielded from generator",
+                value,
+                self._yield_type,
+                memo=self._memo,
+            ),
+            self._executor,
+        )
+        return value
+
+
+def typechecked(
+    func=None,
+    *,
+    always: bool = False,
+    offload_validation: bool = False,
+    executor: Optional[Executor] = None,
+    _localns: Optional[Dict[str, Any]] = None,
+):
+    """Performs runtime type checking on the arguments and the return value of the
+    wrapped function, see typeguard's `typechecked` for details.
+
+    :param func: the function or class to enable type checking for
+    :param always: ``True`` to enable type checks even in optimized mode
+    :param offload_validation: only applies to coroutine functions and async generators. If
+        ``True``, checks that inspect all rows of a DataSet are awaited in ``executor``, such that
+        they don't block the event loop. Note that this is a narrow set of checks: only an
+        ``IndexedDataSet`` without a schema (e.g. ``IndexedDataSet(df)``), of which the annotated
+        index schema declares ``__unique__`` or ``__sorted__``, has its index checked against
+        every row. All other checks (e.g. whether the schema or the dtypes of a DataSet match the
+        annotation) take less time than awaiting the executor, so these are performed inline.
+    :param executor: the executor in which validations are offloaded; defaults to the default
+        executor of the event loop
+    """
+    if _localns is None:
+        _localns = sys._getframe(1).f_locals
+
+    if func is None:
+        return partial(
+            typechecked,
+            always=always,
+            offload_validation=offload_validation,
+            executor=executor,
+            _localns=_localns,
+        )
+
+    if not offload_validation or not (
+        inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+    ):
+        return typeguard.typechecked(func, always=always, _localns=_localns)
+
+    if not __debug__ and not always:  # pragma: no cover
+        return func
+
+    python_func = inspect.unwrap(func, stop=lambda f: hasattr(f, "__code__"))
+
+    if inspect.isasyncgenfunction(func):
+
+        @wraps(func)
+        def asyncgen_wrapper(*args, **kwargs):
+            memo = typeguard._CallMemo(python_func, _localns, args=args, kwargs=kwargs)
+            return _OffloadingAsyncGenerator(func(*args, **kwargs), memo, executor)
+
+        return asyncgen_wrapper
+
+    @wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        memo = typeguard._CallMemo(python_func, _localns, args=args, kwargs=kwargs)
+        await _check_offloaded(partial(typeguard.check_argument_types, memo), executor)
+        retval = await func(*args, **kwargs)
+        await _check_offloaded(partial(typeguard.check_return_type, retval, memo), executor)
+        return retval
+
+    return async_wrapper
+
+
 typeguard.origin_type_checkers[DataSet] = check_dataset
 typeguard.origin_type_checkers[IndexedDataSet] = check_indexed_dataset
-typechecked = typeguard.typechecked
 
 if external_typeguard is not None:
     external_typeguard.origin_type_checkers[DataSet] = check_dataset
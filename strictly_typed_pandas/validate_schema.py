@@ -1,10 +1,33 @@
-from typing import Any, ClassVar, Dict, Set, get_origin
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    get_origin,
+    get_type_hints,
+)
 
 import numpy as np  # type: ignore
 from pandas.api.extensions import ExtensionDtype
 from pandas.core.dtypes.common import is_dtype_equal
 
-from strictly_typed_pandas.pandas_types import StringDtype
+from strictly_typed_pandas.compact import (
+    Categorical,
+    Compact,
+    compact_argument,
+    is_compact,
+    is_compact_dtype,
+)
+from strictly_typed_pandas.nullable import declares_nullable, nullable_dtypes
+from strictly_typed_pandas.pandas_types import CategoricalDtype, StringDtype
 
 
 def check_for_duplicate_columns(names_index: Set[str], names_data: Set[str]) -> None:
@@ -21,12 +44,213 @@ def remove_classvars(schema_expected: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def schema_type_hints(schema: Any) -> Dict[str, Any]:
+    """Returns the types of the columns in the schema class ``schema``.
+
+    If the schema declares ``__nullable__ = True``, ``int``, ``bool`` and ``str`` are mapped to the
+    nullable ``Int64``, ``boolean`` and ``string`` dtypes of pandas.
+    """
+    hints = get_type_hints(schema)
+    if not declares_nullable(schema):
+        return hints
+
+    return {
+        name: nullable_dtypes.get(dtype, dtype) if isinstance(dtype, Hashable) else dtype
+        for name, dtype in hints.items()
+    }
+
+
+class CompiledSchema:
+    """The information about a schema class that is needed to validate data against it,
+    which is computed once per schema class by `compile_schema()`."""
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        self.name: str = getattr(schema, "__name__", str(schema))
+        self.type_hints = schema_type_hints(schema)
+        self.columns = remove_classvars(self.type_hints)
+        self.nullable = declares_nullable(schema)
+        # whether columns are converted upon the creation of a DataSet, e.g. for Compact[int]
+        self.converts = any(
+            is_compact(dtype) or (self.nullable and isinstance(dtype, ExtensionDtype))
+            for dtype in self.columns.values()
+        )
+
+    def validate(self, schema_observed: Dict[str, Any]) -> None:
+        """Validates the observed dtypes per column name against the schema, see
+        `validate_schema()`."""
+        _check_names(set(self.columns.keys()), set(schema_observed.keys()))
+        _check_dtypes(self.columns, schema_observed)
+
+    def validate_columns(self, names: Tuple[Any, ...], dtypes: Tuple[Any, ...]) -> None:
+        """Validates columns ``names`` with ``dtypes`` against the schema, like
+        `validate()`.
+
+        The verdict is stored in `signature_cache`, so columns with the same names and dtypes are
+        only validated once (as long as they are not evicted from the cache).
+        """
+        key = (self, names, dtypes)
+        found, error = signature_cache.get(key)
+        if not found:
+            try:
+                self.validate(dict(zip(names, dtypes)))
+                error = None
+            except TypeError as exc:
+                error = str(exc)
+            signature_cache.put(key, error)
+
+        if error is not None:
+            raise TypeError(error)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SignatureCache:
+    """A least-recently-used cache of the verdicts of
+    `CompiledSchema.validate_columns()`, keyed on the compiled schema and the names and
+    dtypes of the columns.
+
+    :param maxsize: the maximum number of verdicts in the cache
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._verdicts: "OrderedDict[Any, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Any) -> Tuple[bool, Optional[str]]:
+        """Returns whether ``key`` is in the cache, and if so, its verdict: None if the
+        columns adhere to the schema, otherwise the error message."""
+        with self._lock:
+            try:
+                error = self._verdicts[key]
+            except KeyError:
+                self._misses += 1
+                return False, None
+
+            self._verdicts.move_to_end(key)
+            self._hits += 1
+            return True, error
+
+    def put(self, key: Any, error: Optional[str]) -> None:
+        """Stores the verdict for ``key``, and evicts the least recently used verdicts
+        if the cache is full."""
+        with self._lock:
+            self._verdicts[key] = error
+            while len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Returns the number of hits and misses, and the maximum and current size of
+        the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._verdicts))
+
+    def clear(self) -> None:
+        """Removes all verdicts, and resets the counters."""
+        with self._lock:
+            self._verdicts.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+signature_cache = SignatureCache()
+
+
+@lru_cache(maxsize=1024)
+def compile_schema(schema: Any) -> CompiledSchema:
+    """Returns the `CompiledSchema` of the schema class ``schema``, which is cached."""
+    return CompiledSchema(schema)
+
+
 def validate_schema(schema_expected: Dict[str, Any], schema_observed: Dict[str, Any]):
     schema_expected = remove_classvars(schema_expected)
     _check_names(set(schema_expected.keys()), set(schema_observed.keys()))
     _check_dtypes(schema_expected, schema_observed)
 
 
+@lru_cache(maxsize=None)
+def _find_subschema_error(schema_super: Any, schema_sub: Any) -> Optional[str]:
+    dtypes_super = compile_schema(schema_super).columns
+    dtypes_sub = compile_schema(schema_sub).columns
+
+    diff = set(dtypes_sub.keys()) - set(dtypes_super.keys())
+    if diff:
+        return "Schema {super} does not contain the following columns of {sub}: {diff}".format(
+            super=schema_super.__name__, sub=schema_sub.__name__, diff=diff
+        )
+
+    for name, dtype_sub in dtypes_sub.items():
+        dtype_super = dtypes_super[name]
+        if _is_compatible(dtype_sub, dtype_super):
+            continue
+
+        msg = "Column {name} is {dtype_super} in schema {super}, but {dtype_sub} in schema {sub}"
+        return msg.format(
+            name=name,
+            dtype_super=dtype_super,
+            super=schema_super.__name__,
+            dtype_sub=dtype_sub,
+            sub=schema_sub.__name__,
+        )
+
+    return None
+
+
+def validate_derived_schema(
+    schema_expected: Dict[str, Any],
+    schema_observed: Dict[str, Any],
+    schema_inherited: Dict[str, Any],
+) -> None:
+    """Validates a schema like `validate_schema`, but skips the dtype checks of the
+    columns in ``schema_inherited``.
+
+    :param schema_inherited: the columns that were taken unchanged (with the same dtype)
+        from a validated DataSet, mapped to the type that was declared in the schema of
+        that DataSet
+    """
+    schema_expected = remove_classvars(schema_expected)
+    _check_names(set(schema_expected.keys()), set(schema_observed.keys()))
+
+    schema_delta = {
+        name: dtype
+        for name, dtype in schema_expected.items()
+        if name not in schema_inherited or not _is_compatible(dtype, schema_inherited[name])
+    }
+    _check_dtypes(schema_delta, schema_observed)
+
+
+def _is_compatible(dtype_expected: Any, dtype_declared: Any) -> bool:
+    """Whether every dtype that is allowed by ``dtype_declared`` is also allowed by
+    ``dtype_expected``."""
+    if dtype_expected in [object, np.object_, Any] or dtype_expected == dtype_declared:
+        return True
+
+    # e.g. any int64 column adheres to Compact[int]
+    return (
+        get_origin(dtype_expected) is Compact and compact_argument(dtype_expected) == dtype_declared
+    )
+
+
+def check_subschema(schema_super: Any, schema_sub: Any) -> None:
+    """Checks whether any data that adheres to ``schema_super`` also adheres to
+    ``schema_sub`` after selecting the columns of ``schema_sub``.
+
+    This is decided on the schema definitions alone (and memoized per pair of schemas),
+    so it does not require inspecting any data.
+    """
+    error = _find_subschema_error(schema_super, schema_sub)
+    if error is not None:
+        raise TypeError(error)
+
+
 def _check_names(names_expected: Set[str], names_observed: Set[str]) -> None:
     diff = names_observed - names_expected
     if diff:
@@ -48,13 +272,36 @@ def _check_dtypes(schema_expected: Dict[str, Any], schema_observed: Dict[str, An
         if dtype_expected in [object, np.object_, Any]:
             continue
 
+        origin = get_origin(dtype_expected)
+        if origin is Compact:
+            if is_compact_dtype(dtype_observed, compact_argument(dtype_expected)):
+                continue
+            _raise_dtype_error(name, dtype_observed, dtype_expected)
+
+        if origin is Categorical:
+            if isinstance(dtype_observed, CategoricalDtype):
+                # the categories should adhere to the type argument, e.g. str for Categorical[str]
+                _check_dtypes(
+                    {name: compact_argument(dtype_expected)},
+                    {name: dtype_observed.categories.dtype},
+                )
+                continue
+            _raise_dtype_error(name, dtype_observed, dtype_expected)
+
         if dtype_expected == str and dtype_observed == object:
             continue  # pandas stores strings as objects by default
 
         if dtype_expected == str and isinstance(dtype_observed, StringDtype):
             continue  # since np.int64 == int, I'd say we should also support pd.StringDtype == str
 
-        if isinstance(dtype_observed, np.dtype) and dtype_observed != np.object_:
+        if isinstance(dtype_expected, StringDtype) and isinstance(dtype_observed, StringDtype):
+            continue  # regardless of the storage, e.g. python or pyarrow
+
+        if (
+            isinstance(dtype_observed, np.dtype)
+            and dtype_observed != np.object_
+            and not isinstance(dtype_expected, ExtensionDtype)
+        ):
             if dtype_observed == dtype_expected or np.issubdtype(dtype_observed, dtype_expected):
                 continue
 
@@ -63,14 +310,22 @@ def _check_dtypes(schema_expected: Dict[str, Any], schema_observed: Dict[str, An
         ):
             continue
 
-        if dtype_observed != object and isinstance(dtype_observed, dtype_expected):
+        if (
+            dtype_observed != object
+            and isinstance(dtype_expected, type)
+            and isinstance(dtype_observed, dtype_expected)
+        ):
             continue
 
-        msg = "Column {name} is of type {dtype_observed}, but the schema suggests {dtype_expected}"
+        _raise_dtype_error(name, dtype_observed, dtype_expected)
 
-        if isinstance(dtype_observed, np.dtype):
-            dtype_observed = "numpy." + str(dtype_observed)
 
-        raise TypeError(
-            msg.format(name=name, dtype_observed=dtype_observed, dtype_expected=dtype_expected)
-        )
+def _raise_dtype_error(name: str, dtype_observed: Any, dtype_expected: Any) -> NoReturn:
+    msg = "Column {name} is of type {dtype_observed}, but the schema suggests {dtype_expected}"
+
+    if isinstance(dtype_observed, np.dtype):
+        dtype_observed = "numpy." + str(dtype_observed)
+
+    raise TypeError(
+        msg.format(name=name, dtype_observed=dtype_observed, dtype_expected=dtype_expected)
+    )
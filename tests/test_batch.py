@@ -0,0 +1,83 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import Compact, DataSet
+from strictly_typed_pandas.batch import BatchError, validate_batch
+
+
+class Schema:
+    a: int
+
+
+class OtherSchema:
+    b: str
+
+
+class CompactSchema:
+    a: Compact[int]
+
+
+def test_validate_batch():
+    df1 = pd.DataFrame({"a": [1, 2]})
+    df2 = pd.DataFrame({"b": ["a"]})
+    df3 = pd.DataFrame({"a": [3]})
+    df4 = pd.DataFrame({"a": [1]})
+
+    result = validate_batch(
+        [(df1, Schema), (df2, OtherSchema), (df3, Schema), (df4, CompactSchema)]
+    )
+    result.raise_for_errors()
+
+    assert result.errors == []
+    for dataset, schema, df in zip(
+        result.datasets, [Schema, OtherSchema, Schema, CompactSchema], [df1, df2, df3, df4]
+    ):
+        assert isinstance(dataset, DataSet)
+        assert dataset.__orig_class__ == DataSet[schema]
+        pd.testing.assert_frame_equal(dataset.to_dataframe(), df, check_dtype=False)
+
+    assert result.datasets[3].dtypes["a"] == np.int8
+    assert np.shares_memory(result.datasets[0].a.values, df1.a.values)
+
+
+def test_validate_batch_errors():
+    result = validate_batch(
+        [
+            (pd.DataFrame({"a": [1]}), Schema),
+            (pd.DataFrame({"a": ["a"]}), Schema),
+            (pd.DataFrame({"a": ["b"]}), Schema),
+            (pd.DataFrame([[1, 2]], columns=["a", "a"]), Schema),
+            (pd.DataFrame({"a": ["c"]}), CompactSchema),
+        ]
+    )
+
+    assert result.datasets[0] is not None
+    assert result.datasets[1:] == [None, None, None, None]
+    assert [error.position for error in result.errors] == [1, 2, 3, 4]
+    assert isinstance(result.errors[0], BatchError)
+    assert result.errors[0].schema == "Schema"
+    assert "Column a is of type" in result.errors[0].message
+    assert "duplicate columns" in result.errors[2].message
+
+    with pytest.raises(TypeError, match="4 DataFrames in the batch"):
+        result.raise_for_errors()
+
+
+def test_validate_batch_validates_signature_once(monkeypatch):
+    import strictly_typed_pandas.validate_schema as validate_schema
+
+    calls = []
+    check_dtypes = validate_schema._check_dtypes
+
+    def counting_check_dtypes(*args):
+        calls.append(args)
+        check_dtypes(*args)
+
+    monkeypatch.setattr(validate_schema, "_check_dtypes", counting_check_dtypes)
+    validate_schema.signature_cache.clear()
+    frames = [pd.DataFrame({"a": [i]}) for i in range(10)]
+    result = validate_batch([(df, Schema) for df in frames])
+
+    assert len(result.datasets) == 10
+    assert len(calls) == 1
@@ -0,0 +1,80 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.pandas_types import StringDtype
+
+
+class Schema:
+    a: int
+    b: str
+    c: float
+    d: bool
+    e: np.datetime64
+
+
+def record(i: int) -> dict:
+    return {"a": i, "b": str(i), "c": i / 2, "d": i % 2 == 0, "e": pd.Timestamp(2020, 1, i + 1)}
+
+
+def test_builder(monkeypatch):
+    builder = DataSet[Schema].builder(capacity=2)
+    builder.extend(record(i) for i in range(5))
+
+    assert len(builder) == 5
+    assert builder.capacity == 8
+
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_data", None)
+    df = builder.build()
+
+    assert df.__orig_class__ == DataSet[Schema]
+    assert df.shape == (5, 5)
+    assert list(df.a) == [0, 1, 2, 3, 4]
+    assert df.dtypes.iloc[0] == np.int64
+    assert isinstance(df.dtypes.iloc[1], StringDtype)
+    assert len(builder) == 0
+
+
+def test_builder_result_adheres_to_schema():
+    builder = DataSet[Schema].builder()
+    builder.append(record(0))
+
+    DataSet[Schema](builder.build())
+    DataSet[Schema](builder.build())
+
+
+def test_builder_coercion():
+    builder = DataSet[Schema].builder()
+
+    with pytest.raises(TypeError, match="column a"):
+        builder.append({**record(0), "a": 1.5})
+
+    with pytest.raises(TypeError, match="column c"):
+        builder.append({**record(0), "c": "1.5"})
+
+    with pytest.raises(TypeError, match="column d"):
+        builder.append({**record(0), "d": np.nan})
+
+    with pytest.raises(TypeError, match="column a"):
+        builder.append({**record(0), "a": 2**70})
+
+    with pytest.raises(TypeError, match="not present in schema"):
+        builder.append({**record(0), "f": 1})
+
+    with pytest.raises(TypeError, match="not present in record"):
+        builder.append({"a": 1})
+
+    builder.append({**record(0), "a": np.int8(3), "b": 1, "c": 1})
+    builder.append({**record(0), "c": np.nan})
+    df = builder.build()
+    assert len(df) == 2
+    assert np.isnan(df.c.iloc[1])
+    assert df.a.iloc[0] == 3
+    assert df.b.iloc[0] == "1"
+    assert df.c.iloc[0] == 1.0
+
+
+def test_builder_without_schema():
+    with pytest.raises(TypeError):
+        DataSet.builder()
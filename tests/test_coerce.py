@@ -0,0 +1,127 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import Compact, DataSet
+from strictly_typed_pandas.coerce import cast_plan
+from strictly_typed_pandas.dataset import column_dtypes
+from strictly_typed_pandas.validate_schema import compile_schema
+
+utc = pd.DatetimeTZDtype(tz="UTC")
+
+
+class Schema:
+    a: int
+    b: utc  # type: ignore[valid-type]
+    c: pd.StringDtype()  # type: ignore[valid-type]
+    d: np.datetime64
+    e: float
+
+
+class IntSchema:
+    a: int
+
+
+class CompactSchema:
+    a: Compact[int]
+    b: str
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": np.array([1, 2], dtype=np.int32),
+            "b": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "c": ["x", "y"],
+            "d": pd.to_datetime(["2024-01-01", "2024-01-02"]).tz_localize("Europe/Amsterdam"),
+            "e": [1.5, 2.5],
+        }
+    )
+
+
+def test_cast_plan():
+    df = _frame()
+    plan = cast_plan(compile_schema(Schema), tuple(df.columns), tuple(column_dtypes(df)))
+
+    assert plan == {
+        "a": np.dtype(np.int64),
+        "b": utc,
+        "c": pd.StringDtype(),
+        "d": np.dtype("datetime64[ns]"),
+    }
+
+
+def test_coerce():
+    df = _frame()
+    ds = DataSet[Schema].coerce(df)
+
+    assert type(ds) is DataSet[Schema]
+    assert ds.dtypes["a"] == np.int64
+    assert ds.dtypes["b"] == utc
+    assert isinstance(ds.dtypes["c"], pd.StringDtype)
+    assert ds.dtypes["d"] == np.dtype("datetime64[ns]")
+    assert ds["d"].iloc[0] == pd.Timestamp("2023-12-31 23:00")
+
+    # columns that are not cast are not copied
+    assert np.shares_memory(ds["e"].values, df["e"].values)
+
+
+def test_coerce_conforming_data():
+    df = pd.DataFrame({"a": [1, 2]})
+    ds = DataSet[IntSchema].coerce(df)
+
+    assert type(ds) is DataSet[IntSchema]
+    assert np.shares_memory(ds["a"].values, df["a"].values)
+
+
+def test_coerce_compact():
+    ds = DataSet[CompactSchema].coerce(pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2]}))
+
+    assert ds.dtypes["a"] == np.int8
+    assert list(ds["b"]) == ["1", "2"]
+
+
+def test_coerce_str_with_missing_values():
+    class StrSchema:
+        b: str
+
+    ds = DataSet[StrSchema].coerce(pd.DataFrame({"b": [1.0, None]}))
+
+    assert ds["b"].iloc[0] == "1.0"
+    assert pd.isna(ds["b"].iloc[1])
+
+
+def test_coerce_lossless():
+    ds = DataSet[IntSchema].coerce(pd.DataFrame({"a": [1.0, 2.0]}))
+    assert list(ds["a"]) == [1, 2]
+
+    with pytest.raises(TypeError, match="without loss"):
+        DataSet[IntSchema].coerce(pd.DataFrame({"a": [1.5, 2.0]}))
+
+    with pytest.raises(TypeError, match="cannot be coerced"):
+        DataSet[IntSchema].coerce(pd.DataFrame({"a": [np.nan, 2.0]}))
+
+    with pytest.raises(TypeError, match="cannot be coerced"):
+        DataSet[IntSchema].coerce(pd.DataFrame({"a": ["x", "y"]}))
+
+
+def test_coerce_float_with_missing_values():
+    class FloatSchema:
+        a: np.float32
+
+    ds = DataSet[FloatSchema].coerce(pd.DataFrame({"a": [1.0, np.nan]}))
+
+    assert ds.dtypes["a"] == np.float32
+    assert ds["a"].iloc[0] == 1.0
+    assert np.isnan(ds["a"].iloc[1])
+
+
+def test_coerce_invalid():
+    with pytest.raises(TypeError, match="not present in data"):
+        DataSet[Schema].coerce(pd.DataFrame({"a": [1, 2]}))
+
+    with pytest.raises(TypeError, match="duplicate"):
+        DataSet[IntSchema].coerce(pd.DataFrame([[1, 2]], columns=["a", "a"]))
+
+    with pytest.raises(TypeError):
+        DataSet.coerce(pd.DataFrame({"a": [1, 2]}))
@@ -0,0 +1,122 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import Categorical, Compact, DataSet, IndexedDataSet
+
+
+class Schema:
+    a: Compact[int]
+    b: Compact[float]
+    c: Categorical[str]
+
+
+class IndexSchema:
+    i: int
+
+
+def test_compact_construction():
+    df = DataSet[Schema]({"a": [1, 2, 300], "b": [0.5, 1.0, np.nan], "c": ["x", "y", "x"]})
+
+    assert df.dtypes["a"] == np.int16
+    assert df.dtypes["b"] == np.float32
+    assert isinstance(df.dtypes["c"], pd.CategoricalDtype)
+    assert list(df.c.cat.categories) == ["x", "y"]
+    pd.testing.assert_frame_equal(
+        df.to_dataframe(),
+        pd.DataFrame({"a": [1, 2, 300], "b": [0.5, 1.0, np.nan], "c": ["x", "y", "x"]}),
+        check_dtype=False,
+        check_categorical=False,
+    )
+
+
+def test_compact_lossless():
+    df = DataSet[Schema]({"a": [-(2**40)], "b": [0.1], "c": ["x"]})
+
+    assert df.dtypes["a"] == np.int64
+    assert df.dtypes["b"] == np.float64
+
+
+def test_compact_unsigned():
+    def create(values, dtype):
+        return DataSet[Schema]({"a": np.array(values, dtype=dtype), "b": [1.0], "c": ["x"]})
+
+    # a dtype that is not larger than the smallest one that fits the values is kept
+    assert create([200], np.uint8).dtypes["a"] == np.uint8
+    assert create([200], np.int16).dtypes["a"] == np.int16
+    assert create([200], np.uint64).dtypes["a"] == np.uint8
+    assert create([2**16], np.uint64).dtypes["a"] == np.uint32
+    assert create([2**63], np.uint64).dtypes["a"] == np.uint64
+
+
+def test_compact_validation():
+    # already compact data adheres to the schema as is
+    DataSet[Schema](
+        {
+            "a": np.array([1], dtype=np.int8),
+            "b": np.array([1.0], dtype=np.float64),
+            "c": pd.Categorical(["x"]),
+        }
+    )
+
+    with pytest.raises(TypeError, match="Column a is of type"):
+        DataSet[Schema]({"a": ["1"], "b": [1.0], "c": ["x"]})
+
+    with pytest.raises(TypeError, match="Column b is of type"):
+        DataSet[Schema]({"a": [1], "b": ["1.0"], "c": ["x"]})
+
+    with pytest.raises(TypeError, match="Column c is of type"):
+        DataSet[Schema]({"a": [1], "b": [1.0], "c": [1]})
+
+
+def test_compact_empty():
+    df = DataSet[Schema]()
+
+    assert df.dtypes["a"] == np.int64
+    assert isinstance(df.dtypes["c"], pd.CategoricalDtype)
+
+
+def test_compact_indexed_dataset():
+    df = (
+        pd.DataFrame({"i": [1, 2], "a": [1, 2], "b": [1.0, 2.0], "c": ["x", "y"]})
+        .set_index("i")
+        .pipe(IndexedDataSet[IndexSchema, Schema])
+    )
+
+    assert df.dtypes["a"] == np.int8
+
+
+def test_compact_project():
+    class LogicalSchema:
+        a: int
+        b: float
+
+    class SubSchema:
+        a: Compact[int]
+
+    df = DataSet[LogicalSchema]({"a": [1], "b": [1.0]})
+    assert df.project(SubSchema).dtypes["a"] == np.int64
+
+    with pytest.raises(TypeError):
+        DataSet[Schema]({"a": [1], "b": [1.0], "c": ["x"]}).project(LogicalSchema)
+
+
+def test_compact_typed_operations():
+    class LogicalSchema:
+        a: int
+
+    class CompactSchema:
+        a: Compact[int]
+        b: Categorical[str]
+
+    df = DataSet[LogicalSchema]({"a": [1, 2]})
+    assigned = df.assign_typed(CompactSchema, b=["x", "y"])
+
+    assert assigned.dtypes["a"] == np.int8
+    assert isinstance(assigned.dtypes["b"], pd.CategoricalDtype)
+
+    merged = DataSet.merge_typed(
+        CompactSchema, DataSet[LogicalSchema]({"a": [1]}), assigned.to_dataframe(), on="a"
+    )
+    assert merged.dtypes["a"] == np.int8
+    assert list(merged["b"]) == ["x"]
@@ -1,6 +1,6 @@
 import pickle
 import tempfile
-from typing import ClassVar
+from typing import Any, ClassVar, ForwardRef
 
 import numpy as np  # type: ignore
 import pandas as pd
@@ -79,7 +79,73 @@ def test_dataset_immutable() -> None:
         # 4th argument is inplace
         df.set_index(["a"], True, False, True)  # type: ignore
 
+    with pytest.raises(NotImplementedError):
+        df.at[0, "a"] = 1
+
+    with pytest.raises(NotImplementedError):
+        df.iat[0, 0] = 1
+
+    with pytest.raises(NotImplementedError):
+        df.insert(0, "c", strings)
+
+    with pytest.raises(NotImplementedError):
+        df.pop("a")
+
+    with pytest.raises(NotImplementedError):
+        del df["a"]
+
     assert isinstance(df.assign(a=strings), pd.DataFrame)
+    assert "a" not in df.__dict__
+    assert df.at[0, "a"] == 1
+    assert df.iat[0, 1] == "a"
+
+
+def test_dataset_augmented_assignment() -> None:
+    df = DataSet[AlternativeSchema]({"a": [1, 2]})
+
+    for operator in ("+=", "-=", "*=", "/=", "//=", "%=", "**=", "&=", "|=", "^="):
+        with pytest.raises(NotImplementedError):
+            exec("df {} 2".format(operator))
+
+    assert df.dtypes["a"] == np.int64
+    assert list(df["a"]) == [1, 2]
+
+
+def test_dataset_setattr(monkeypatch) -> None:
+    df = DataSet[Schema](dictionary)
+    df.custom_attribute = 1
+    assert df.custom_attribute == 1
+
+    # internal attributes are set without looking them up in the columns
+    monkeypatch.setattr(DataSet[Schema], "columns", None)
+    df._item_cache = {}
+    df.__orig_class__ = DataSet[Schema]
+
+
+def test_dataset_readonly_arrays() -> None:
+    from strictly_typed_pandas.immutable import set_readonly_arrays
+
+    with pd.option_context("mode.copy_on_write", False):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        set_readonly_arrays(True)
+        try:
+            ds = DataSet[AlternativeSchema](df)
+        finally:
+            set_readonly_arrays(False)
+
+        with pytest.raises(ValueError, match="read-only"):
+            ds.values[0, 0] = 10
+
+        with pytest.raises(ValueError, match="read-only"):
+            ds["a"].values[0] = 10
+
+        with pytest.raises(ValueError, match="read-only"):
+            ds.head(2).to_numpy()[0, 0] = 10
+
+        df.loc[0, "a"] = 10
+        writable = ds.to_dataframe()
+        writable.loc[1, "a"] = 20
+        assert list(writable["a"]) == [10, 20, 3]
 
 
 def test_dataset_to_dataframe() -> None:
@@ -139,19 +205,359 @@ def test_resetting_of_schema_annotations():
 
     a: pd.DataFrame
 
-    # if no schema is specified, the annotation should be None
+    # if no schema is specified, there is no schema
     a = DataSet(df)
-    assert a._schema_annotations is None
+    assert a.__orig_class__ is None
 
-    # when we specify a schema, the class variable will be set to A, but afterwards it should be
-    # reset to None again when we initialize a new object without specifying a schema
+    # specifying a schema without initializing it has no effect on other initializations
     DataSet[A]
     a = DataSet(df)
-    assert a._schema_annotations is None
+    assert a.__orig_class__ is None
 
     # and then to B
     a = DataSet[B](df)
+    assert a.__orig_class__ is DataSet[B]
 
     # and then to None again
     a = DataSet(df)
-    assert a._schema_annotations is None
+    assert a.__orig_class__ is None
+
+
+def test_specialized_subclass():
+    cls = DataSet[Schema]
+    df = cls(dictionary)
+
+    assert cls is DataSet[Schema]
+    assert issubclass(cls, DataSet)
+    assert type(df) is cls
+    assert cls.__origin__ is DataSet
+    assert cls.__args__ == (Schema,)
+    assert cls.__name__ == "DataSet[Schema]"
+
+    # the reused class validates every initialization
+    with pytest.raises(TypeError):
+        cls({"a": ["1"], "b": ["a"]})
+
+    assert list(df.a) == [1, 2, 3]
+    assert df.a is df["a"]
+    assert "a" in vars(cls)
+
+    with pytest.raises(TypeError, match="already specialized"):
+        cls[AlternativeSchema]  # type: ignore[type-arg]
+
+    with pytest.raises(TypeError, match="Too many arguments"):
+        DataSet[Schema, Schema]
+
+
+class ForwardSchema:
+    a: "LaterDefined"
+
+
+# the schema is not compiled before the first DataSet[ForwardSchema] is created, so its annotations
+# may refer to names that are defined later, and the schema itself may be a forward reference
+def _forward_references(df: DataSet[ForwardSchema]) -> DataSet["ForwardSchema"]:
+    return df
+
+
+LaterDefined = int
+
+
+def test_forward_references():
+    df = DataSet[ForwardSchema]({"a": [1, 2]})
+
+    assert _forward_references(df) is df
+    assert list(df.a) == [1, 2]
+    assert DataSet["ForwardSchema"].__args__ == (ForwardRef("ForwardSchema"),)
+
+
+def test_pickle_preserves_schema():
+    df = pickle.loads(pickle.dumps(DataSet[Schema](dictionary)))
+
+    assert type(df) is DataSet[Schema]
+    assert list(df.a) == [1, 2, 3]
+    assert type(pickle.loads(pickle.dumps(DataSet(df)))) is DataSet
+
+
+def test_schema_preserving_functions(monkeypatch):
+    df = DataSet[Schema]({"a": [3, 1, 2, 2], "b": ["c", "a", "b", "b"]})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("_validate_data should not be called")
+
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_data", fail)
+
+    results = [
+        df.head(2),
+        df.tail(2),
+        df.query("a > 1"),
+        df.sort_values("a"),
+        df.sort_index(ascending=False),
+        df.drop_duplicates(),
+        df.nlargest(2, "a"),
+        df.nsmallest(2, "a"),
+        df[df.a > 1],
+        df[1:3],
+    ]
+    for result in results:
+        assert isinstance(result, DataSet)
+        assert result.__orig_class__ == DataSet[Schema]
+
+    assert df[df.a > 1].shape == (3, 2)
+
+    with pytest.raises(NotImplementedError):
+        df.head(2)["a"] = 1
+
+
+def test_schema_changing_functions():
+    df = DataSet[Schema](dictionary)
+
+    assert type(df[["a"]]) is pd.DataFrame
+    assert type(df.assign(c=1)) is pd.DataFrame
+    assert isinstance(df["a"], pd.Series)
+    # without a schema, there is nothing to preserve
+    assert type(DataSet(df).head()) is pd.DataFrame
+
+
+def test_results_of_pandas_operations(monkeypatch):
+    df = DataSet[Schema](dictionary)
+    df.attrs["source"] = "test"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("DataSets should not be initialized")
+
+    monkeypatch.setattr(DataSet, "__init__", fail)
+
+    for result in [df.copy(), df.iloc[:2], df + df, df.T, df.head(2).iloc[:1]]:
+        assert type(result) is pd.DataFrame
+        assert result.attrs == {"source": "test"}
+
+    for series in [df["a"], df.a, df.iloc[0], df.max()]:
+        assert type(series) is pd.Series
+
+    assert df.head(2).attrs == {"source": "test"}
+    assert type(df.head(2)) is DataSet[Schema]
+
+
+class SchemaWithAny:
+    a: Any
+
+
+def test_project(monkeypatch):
+    df = DataSet[Schema](dictionary)
+
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_data", None)
+    projected = df.project(AlternativeSchema)
+
+    assert isinstance(projected, DataSet)
+    assert projected.__orig_class__ == DataSet[AlternativeSchema]
+    assert list(projected.columns) == ["a"]
+    assert np.shares_memory(projected["a"].values, df["a"].values)
+
+    assert df.project(SchemaWithAny).__orig_class__ == DataSet[SchemaWithAny]
+
+
+def test_project_incompatible_schema():
+    class Other:
+        c: int
+
+    class OtherType:
+        a: float
+
+    df = DataSet[Schema](dictionary)
+
+    with pytest.raises(TypeError, match="does not contain"):
+        df.project(Other)
+
+    with pytest.raises(TypeError, match="Column a is"):
+        df.project(OtherType)
+
+    with pytest.raises(TypeError, match="without a schema"):
+        DataSet(df).project(AlternativeSchema)
+
+
+class OutputSchema:
+    a: int
+    b: str
+    c: float
+
+
+class RightSchema:
+    a: int
+    c: float
+
+
+def _validated_columns(monkeypatch):
+    validated = []
+
+    def check_dtypes(schema_expected, schema_observed):
+        validated.extend(schema_expected.keys())
+
+    monkeypatch.setattr("strictly_typed_pandas.validate_schema._check_dtypes", check_dtypes)
+    return validated
+
+
+def test_assign_typed(monkeypatch):
+    df = DataSet[Schema](dictionary)
+    validated = _validated_columns(monkeypatch)
+
+    result = df.assign_typed(OutputSchema, c=[1.0, 2.0, 3.0])
+    assert result.__orig_class__ == DataSet[OutputSchema]
+    assert validated == ["c"]
+
+
+def test_assign_typed_invalid():
+    df = DataSet[Schema](dictionary)
+
+    with pytest.raises(TypeError, match="Column c is of type"):
+        df.assign_typed(OutputSchema, c=["a", "b", "c"])
+
+    with pytest.raises(TypeError, match="Column a is of type"):
+        df.assign_typed(OutputSchema, a=["a", "b", "c"], c=[1.0, 2.0, 3.0])
+
+    with pytest.raises(TypeError, match="not present in schema"):
+        df.assign_typed(Schema, c=[1.0, 2.0, 3.0])
+
+
+def test_merge_typed(monkeypatch):
+    left = DataSet[Schema](dictionary)
+    right = DataSet[RightSchema]({"a": [1, 2], "c": [1.0, 2.0]})
+    validated = _validated_columns(monkeypatch)
+
+    result = DataSet.merge_typed(OutputSchema, left, right, on="a", how="inner")
+    assert result.__orig_class__ == DataSet[OutputSchema]
+    assert validated == []
+
+    # a left join introduces missing values, such that c may be upcast
+    DataSet.merge_typed(OutputSchema, left, right.to_dataframe(), on="a", how="left")
+    assert validated == ["a", "c"]
+
+
+def test_concat_typed(monkeypatch):
+    df = DataSet[Schema](dictionary)
+    validated = _validated_columns(monkeypatch)
+
+    result = DataSet.concat_typed(Schema, [df, df], ignore_index=True)
+    assert result.__orig_class__ == DataSet[Schema]
+    assert result.shape == (6, 2)
+    assert validated == []
+
+    DataSet.concat_typed(Schema, [df, pd.DataFrame({"a": [1.0], "b": ["a"]})])
+    assert validated == ["a", "b"]
+
+
+def test_concat_typed_invalid():
+    df = DataSet[Schema](dictionary)
+
+    with pytest.raises(TypeError, match="Column a is of type"):
+        DataSet.concat_typed(Schema, [df, pd.DataFrame({"a": [1.0], "b": ["a"]})])
+
+
+def test_empty_dataset_from_template():
+    df1 = DataSet[Schema]()
+    df2 = DataSet[Schema]()
+    assert df1 is not df2
+
+    modified = df1.to_dataframe()
+    modified["c"] = []
+    modified.rename(columns={"a": "d"}, inplace=True)
+
+    df3 = DataSet[Schema]()
+    assert list(df3.columns) == ["a", "b"]
+    assert df3.dtypes.iloc[0] == int
+
+    # the names of the axes can be changed inplace, even on a DataSet
+    df3.index.name = "leak"
+    df3.columns.name = "leak"
+    assert DataSet[Schema]().index.name is None
+    assert DataSet[Schema]().columns.name is None
+
+
+def test_signature_cache():
+    from strictly_typed_pandas.validate_schema import signature_cache
+
+    signature_cache.clear()
+    DataSet[Schema](dictionary)
+    DataSet[Schema](pd.DataFrame({"a": [4, 5], "b": ["c", "d"]}))
+    assert signature_cache.info()[:2] == (1, 1)
+
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Column a is of type"):
+            DataSet[Schema]({"a": [1.0], "b": ["a"]})
+    assert signature_cache.info()[:2] == (2, 2)
+
+
+def test_signature_cache_is_bounded():
+    from strictly_typed_pandas.validate_schema import SignatureCache
+
+    cache = SignatureCache(maxsize=2)
+    for key in range(3):
+        cache.put(key, None)
+
+    assert cache.get(0) == (False, None)
+    assert cache.get(2) == (True, None)
+    assert cache.info() == (1, 1, 2, 2)
+
+
+def test_dataset_copy_on_write() -> None:
+    from strictly_typed_pandas.immutable import set_readonly_arrays
+
+    with pd.option_context("mode.copy_on_write", True):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        set_readonly_arrays(True)
+        try:
+            ds = DataSet[AlternativeSchema](df)
+        finally:
+            set_readonly_arrays(False)
+
+        # pandas protects the arrays, so they are not marked read-only by strictly typed pandas
+        assert ds._mgr.blocks[0].values.flags.writeable
+        assert not ds.to_numpy().flags.writeable
+
+        df.loc[0, "a"] = 10
+        modified = ds.to_dataframe()
+        modified.loc[1, "a"] = 20
+
+        assert list(ds["a"]) == [1, 2, 3]
+        assert list(modified["a"]) == [1, 20, 3]
+        assert np.shares_memory(ds.to_dataframe()["a"].values, ds["a"].values)
+
+
+def test_unsafe_cast(monkeypatch):
+    df = pd.DataFrame(dictionary)
+
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_casts", False)
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_data", None)
+    ds = DataSet[Schema].unsafe_cast(df)
+
+    assert type(ds) is DataSet[Schema]
+    assert np.shares_memory(ds["a"].values, df["a"].values)
+    assert DataSet[Schema].unsafe_cast(ds) is ds
+
+    # no validation, hence no error
+    assert type(DataSet[AlternativeSchema].unsafe_cast(df)) is DataSet[AlternativeSchema]
+
+
+def test_unsafe_cast_validate():
+    from strictly_typed_pandas.dataset import set_validate_casts, validate_casts
+
+    df = pd.DataFrame(dictionary)
+    enabled = validate_casts()
+
+    with pytest.raises(TypeError):
+        DataSet[AlternativeSchema].unsafe_cast(df, validate=True)
+
+    set_validate_casts(True)
+    try:
+        with pytest.raises(TypeError):
+            DataSet[AlternativeSchema].unsafe_cast(df)
+        assert (
+            type(DataSet[AlternativeSchema].unsafe_cast(df, validate=False))
+            is DataSet[AlternativeSchema]
+        )
+    finally:
+        set_validate_casts(enabled)
+
+
+def test_unsafe_cast_without_schema():
+    with pytest.raises(TypeError):
+        DataSet.unsafe_cast(pd.DataFrame(dictionary))
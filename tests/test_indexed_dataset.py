@@ -39,6 +39,10 @@ def test_empty_indexed_dataset() -> None:
     assert df.dtypes.iloc[0] == int
     assert df.dtypes.iloc[1] == object or isinstance(df.dtypes.iloc[1], StringDtype)
 
+    # renaming the index of an empty IndexedDataSet does not affect later ones
+    df.index.names = ["x", "y"]
+    assert list(IndexedDataSet[IndexSchema, DataSchema]().index.names) == ["a", "b"]
+
 
 def test_indexed_dataset() -> None:
     (
@@ -70,3 +74,136 @@ def test_typeguard_indexed_dataset() -> None:
 
     with pytest.raises(TypeError):
         foo(pd.DataFrame())  # type: ignore
+
+
+def test_schema_preserving_functions():
+    df = (
+        pd.DataFrame({"a": [1, 1, 2], "b": ["a", "a", "b"], "c": [1, 1, 2], "d": ["a", "a", "b"]})
+        .set_index(["a", "b"])
+        .pipe(IndexedDataSet[IndexSchema, DataSchema])
+    )
+
+    for result in [df.drop_duplicates(), df.sort_values("c"), df[df.c > 1], df.head(1)]:
+        assert isinstance(result, IndexedDataSet)
+        assert result.__orig_class__ == IndexedDataSet[IndexSchema, DataSchema]
+
+    # the index is reset, so the result does not adhere to the index schema
+    assert type(df.drop_duplicates(ignore_index=True)) is pd.DataFrame
+
+
+def test_multiindex_level_dtypes(monkeypatch):
+    df = pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["a", "b", "c"], "c": [1, 2, 3], "d": ["a", "b", "c"]}
+    ).set_index(["a", "b"])
+    df_float = df.rename(index=float, level="a")
+
+    def get_level_values(*args, **kwargs):
+        raise AssertionError("Validation should not materialize the levels of the index")
+
+    monkeypatch.setattr(pd.MultiIndex, "get_level_values", get_level_values)
+    IndexedDataSet[IndexSchema, DataSchema](df)
+
+    with pytest.raises(TypeError, match="Column a is of type"):
+        IndexedDataSet[IndexSchema, DataSchema](df_float)
+
+
+def test_multiindex_missing_values():
+    index = pd.MultiIndex(levels=[[1, 2], ["x"]], codes=[[0, -1], [0, 0]], names=["a", "b"])
+    df = pd.DataFrame({"c": [1, 2], "d": ["a", "b"]}, index=index)
+
+    # the level of a is int64, but the values of a are float64 because of the missing value
+    with pytest.raises(TypeError, match="Column a is of type numpy.float64"):
+        IndexedDataSet[IndexSchema, DataSchema](df)
+
+
+def test_multiindex_levels_are_not_materialized(monkeypatch):
+    index = pd.MultiIndex(levels=[[1, 2], ["x"]], codes=[[0, 1], [0, -1]], names=["a", "b"])
+    df = pd.DataFrame({"c": [1, 2], "d": ["a", "b"]}, index=index)
+
+    # missing values do not change the dtype of the level of b (object), and the level of a has
+    # no missing values, so neither level is materialized
+    monkeypatch.setattr(pd.MultiIndex, "get_level_values", None)
+    IndexedDataSet[IndexSchema, DataSchema](df)
+
+
+class SortedIndexSchema:
+    __unique__ = True
+    __sorted__ = True
+
+    a: int
+
+
+class ValueSchema:
+    c: int
+
+
+def test_index_guarantees():
+    def create(a):
+        df = pd.DataFrame({"a": a, "c": [1, 2, 3]}).set_index("a")
+        return IndexedDataSet[SortedIndexSchema, ValueSchema](df)
+
+    create([1, 2, 3])
+
+    with pytest.raises(TypeError, match="duplicate values"):
+        create([1, 1, 3])
+
+    with pytest.raises(TypeError, match="not sorted"):
+        create([1, 3, 2])
+
+    with pytest.raises(TypeError, match="not sorted"):
+        sorted_identity(IndexedDataSet(pd.DataFrame({"a": [2, 1], "c": [1, 2]}).set_index("a")))
+
+
+def sorted_identity(
+    df: IndexedDataSet[SortedIndexSchema, ValueSchema],
+) -> IndexedDataSet[SortedIndexSchema, ValueSchema]:
+    return df
+
+
+def test_sorted_index_lookups():
+    df = pd.DataFrame({"a": [1, 3, 5, 7], "c": [1, 2, 3, 4]}).set_index("a")
+    ds = IndexedDataSet[SortedIndexSchema, ValueSchema](df)
+
+    pd.testing.assert_series_equal(ds.loc[3], df.loc[3])
+    pd.testing.assert_frame_equal(ds.loc[[7, 1]], df.loc[[7, 1]])
+    pd.testing.assert_frame_equal(ds.loc[np.array([3])], df.loc[np.array([3])])
+    pd.testing.assert_frame_equal(ds.loc[3:5], df.loc[3:5])
+    pd.testing.assert_frame_equal(ds.loc[ds.c > 2], df.loc[df.c > 2])
+
+    with pytest.raises(KeyError):
+        ds.loc[2]
+
+    with pytest.raises(KeyError):
+        ds.loc[[1, 2]]
+
+    with pytest.raises(NotImplementedError):
+        ds.loc[1, "c"] = 2
+
+    for target in [[7, 2, 1], pd.Index([0, 9], name="b"), []]:
+        pd.testing.assert_frame_equal(ds.reindex(target), df.reindex(target))
+        pd.testing.assert_frame_equal(ds.reindex(index=target), df.reindex(index=target))
+    pd.testing.assert_frame_equal(
+        ds.reindex([2, 3], fill_value=0), df.reindex([2, 3], fill_value=0)
+    )
+
+
+def test_sorted_index_reordering_functions():
+    df = (
+        pd.DataFrame({"a": [1, 3, 5, 7], "c": [4, 3, 2, 1]})
+        .set_index("a")
+        .pipe(IndexedDataSet[SortedIndexSchema, ValueSchema])
+    )
+
+    assert isinstance(df.sort_values("a"), IndexedDataSet)
+    assert isinstance(df.head(2), IndexedDataSet)
+    assert isinstance(df[df.c > 1], IndexedDataSet)
+
+    # the rows are no longer sorted by the index
+    assert type(df.sort_values("c")) is pd.DataFrame
+    assert type(df.nsmallest(2, "c")) is pd.DataFrame
+    assert type(df.sort_index(ascending=False)) is pd.DataFrame
+
+    assert isinstance(df[1:], IndexedDataSet)
+    assert isinstance(df[::2], IndexedDataSet)
+    assert type(df[::-1]) is pd.DataFrame
+    assert list(df[::-1].reindex([1, 3])["c"]) == [4, 3]
@@ -0,0 +1,160 @@
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet, IndexedDataSet
+from strictly_typed_pandas.instrumentation import (
+    OpenTelemetryListener,
+    ValidationStatistics,
+    add_listener,
+    remove_listener,
+)
+
+
+class Schema:
+    a: int
+
+
+class IndexSchema:
+    a: int
+
+
+class DataSchema:
+    b: int
+
+
+def foo(df: DataSet[Schema]) -> None:
+    pass
+
+
+@pytest.fixture
+def events():
+    events = []
+    add_listener(events.append)
+    yield events
+    remove_listener(events.append)
+
+
+def test_construction_events(events):
+    DataSet[Schema]({"a": [1, 2, 3]})
+    pd.DataFrame({"a": [1], "b": [2]}).set_index("a").pipe(IndexedDataSet[IndexSchema, DataSchema])
+    DataSet[Schema]({"a": [1]}).assign_typed(Schema, a=[2])
+
+    with pytest.raises(TypeError):
+        DataSet[Schema]({"a": ["a"]})
+
+    assert [(e.kind, e.schema, e.level, e.rows, e.columns) for e in events] == [
+        ("construction", "Schema", "full", 3, 1),
+        ("construction", "IndexSchema,DataSchema", "full", 1, 1),
+        ("construction", "Schema", "full", 1, 1),
+        ("construction", "Schema", "derived", 1, 1),
+        ("construction", "Schema", "full", 1, 1),
+    ]
+    assert [e.error is None for e in events] == [True, True, True, True, False]
+    assert all(e.duration >= 0 for e in events)
+
+
+def test_check_events(events):
+    df = DataSet[Schema]({"a": [1]})
+    events.clear()
+
+    foo(df)
+    foo(DataSet({"a": [1]}))
+
+    assert [(e.kind, e.level) for e in events] == [("check", "schema"), ("check", "full")]
+
+
+def test_failing_validation_events(events, monkeypatch):
+    def validate(*args):
+        raise ValueError("broken")
+
+    monkeypatch.setattr("strictly_typed_pandas.dataset._validate_data", validate)
+    with pytest.raises(ValueError):
+        DataSet[Schema]({"a": [1]})
+
+    assert [e.error for e in events] == ["ValueError: broken"]
+
+
+def test_failing_listener():
+    def listener(event):
+        raise RuntimeError("broken")
+
+    add_listener(listener)
+    try:
+        with pytest.warns(RuntimeWarning, match="broken"):
+            df = DataSet[Schema]({"a": [1]})
+    finally:
+        remove_listener(listener)
+
+    assert list(df.a) == [1]
+
+
+def test_no_listeners():
+    events = []
+    add_listener(events.append)
+    remove_listener(events.append)
+
+    DataSet[Schema]({"a": [1]})
+    assert events == []
+
+
+def test_validation_statistics():
+    statistics = ValidationStatistics()
+    add_listener(statistics)
+    try:
+        for _ in range(10):
+            DataSet[Schema]({"a": [1]})
+    finally:
+        remove_listener(statistics)
+
+    report = statistics.report()
+    assert list(report.keys()) == [("construction", "Schema")]
+    assert report[("construction", "Schema")]["count"] == 10
+    assert (
+        0 <= report[("construction", "Schema")]["p50"] <= report[("construction", "Schema")]["p99"]
+    )
+
+    statistics.reset()
+    assert statistics.report() == {}
+
+
+class Span:
+    def __init__(self, name, start_time, attributes):
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time):
+        self.end_time = end_time
+
+
+class Tracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time, attributes):
+        self.spans.append(Span(name, start_time, attributes))
+        return self.spans[-1]
+
+
+def test_open_telemetry_listener():
+    tracer = Tracer()
+    listener = OpenTelemetryListener(tracer)
+    add_listener(listener)
+    try:
+        DataSet[Schema]({"a": [1, 2]})
+        with pytest.raises(TypeError):
+            DataSet[Schema]({"a": ["a"]})
+    finally:
+        remove_listener(listener)
+
+    span, failed_span = tracer.spans
+    assert span.name == "strictly_typed_pandas.construction"
+    assert span.attributes == {
+        "strictly_typed_pandas.schema": "Schema",
+        "strictly_typed_pandas.level": "full",
+        "strictly_typed_pandas.rows": 2,
+        "strictly_typed_pandas.columns": 1,
+    }
+    assert span.start_time <= span.end_time
+    assert failed_span.attributes["error.type"] == "TypeError"
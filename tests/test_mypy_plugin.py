@@ -0,0 +1,138 @@
+import re
+import textwrap
+
+import pandas as pd
+from mypy import api
+
+from strictly_typed_pandas import DataSet, IndexedDataSet, mypy_plugin
+from strictly_typed_pandas.dataset import reordering_functions, schema_preserving_functions
+
+
+class Schema:
+    a: int
+    b: str
+
+
+class SortedIndexSchema:
+    __sorted__ = True
+
+    a: int
+
+
+class DataSchema:
+    b: str
+
+
+source = textwrap.dedent(
+    """
+    from strictly_typed_pandas import DataSet, IndexedDataSet
+
+    class Schema:
+        a: int
+        b: str
+
+    class IndexSchema:
+        a: int
+
+    class SortedIndexSchema:
+        __sorted__ = True
+
+        a: int
+
+    class DataSchema:
+        b: str
+
+    df = DataSet[Schema]({"a": [1, 2], "b": ["x", "y"]})
+    reveal_type(df.head())
+    reveal_type(df.sort_values("a"))
+    reveal_type(df.query("a > 1"))
+    reveal_type(df.sort_values("a", inplace=True))
+    reveal_type(df[df.a > 1])
+    reveal_type(df[:1])
+    reveal_type(df[["a"]])
+    reveal_type(df.copy())
+    reveal_type(df.dropna())
+    reveal_type(df.project(IndexSchema))
+    reveal_type(df.to_dataframe().head())
+
+    idf = IndexedDataSet[IndexSchema, DataSchema](df.set_index("a"))
+    reveal_type(idf.tail())
+    reveal_type(idf.reset_index())
+    reveal_type(idf.drop_duplicates())
+    reveal_type(idf.drop_duplicates(ignore_index=True))
+
+    sdf = IndexedDataSet[SortedIndexSchema, DataSchema](df.set_index("a").sort_index())
+    reveal_type(sdf.sort_values("b"))
+    """
+)
+
+config = textwrap.dedent(
+    """
+    [mypy]
+    plugins = strictly_typed_pandas.mypy_plugin
+
+    [mypy-strictly_typed_pandas._vendor.*]
+    follow_imports = skip
+
+    [mypy-typeguard]
+    ignore_missing_imports = true
+    """
+)
+
+expected = [
+    "strictly_typed_pandas.dataset.DataSet[sample.Schema]",
+    "strictly_typed_pandas.dataset.DataSet[sample.Schema]",
+    "strictly_typed_pandas.dataset.DataSet[sample.Schema]",
+    "None",
+    "strictly_typed_pandas.dataset.DataSet[sample.Schema]",
+    "strictly_typed_pandas.dataset.DataSet[sample.Schema]",
+    "Any",
+    "pandas.core.frame.DataFrame",
+    "pandas.core.frame.DataFrame",
+    "strictly_typed_pandas.dataset.DataSet[sample.IndexSchema]",
+    "pandas.core.frame.DataFrame",
+    "strictly_typed_pandas.dataset.IndexedDataSet[sample.IndexSchema, sample.DataSchema]",
+    "pandas.core.frame.DataFrame",
+    "strictly_typed_pandas.dataset.IndexedDataSet[sample.IndexSchema, sample.DataSchema]",
+    "pandas.core.frame.DataFrame",
+    "pandas.core.frame.DataFrame",
+]
+
+
+def test_mypy_plugin(tmp_path):
+    (tmp_path / "sample.py").write_text(source)
+    (tmp_path / "mypy.ini").write_text(config)
+
+    stdout, stderr, exit_status = api.run(
+        [
+            "--config-file",
+            str(tmp_path / "mypy.ini"),
+            "--cache-dir",
+            str(tmp_path / ".mypy_cache"),
+            str(tmp_path / "sample.py"),
+        ]
+    )
+
+    assert exit_status == 0, stdout + stderr
+    assert re.findall(r'Revealed type is "(.*)"', stdout) == expected
+
+
+def test_mypy_plugin_schema_preserving_functions():
+    assert mypy_plugin.schema_preserving_functions == schema_preserving_functions
+    assert mypy_plugin.reordering_functions == reordering_functions
+
+
+def test_mypy_plugin_matches_runtime():
+    df = DataSet[Schema]({"a": [1, 2], "b": ["x", "y"]})
+
+    assert type(df.head()) is DataSet[Schema]
+    assert type(df.sort_values("a")) is DataSet[Schema]
+    assert type(df.query("a > 1")) is DataSet[Schema]
+    assert type(df[df.a > 1]) is DataSet[Schema]
+    assert type(df[:1]) is DataSet[Schema]
+    assert type(df.copy()) is pd.DataFrame
+    assert type(df.dropna()) is pd.DataFrame
+
+    idf = IndexedDataSet[SortedIndexSchema, DataSchema](df.set_index("a"))
+    assert type(idf.drop_duplicates(ignore_index=True)) is pd.DataFrame
+    assert type(idf.sort_values("b", ascending=False)) is pd.DataFrame
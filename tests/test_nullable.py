@@ -0,0 +1,108 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet, IndexedDataSet
+
+
+class Schema:
+    __nullable__ = True
+
+    a: int
+    b: bool
+    c: str
+    d: float
+
+
+class IndexSchema:
+    i: int
+
+
+class SubSchema:
+    __nullable__ = True
+
+    a: int
+
+
+class NonNullableSchema:
+    a: int
+
+
+def test_nullable_empty():
+    df = DataSet[Schema]()
+
+    assert df.dtypes["a"] == "Int64"
+    assert df.dtypes["b"] == "boolean"
+    assert isinstance(df.dtypes["c"], pd.StringDtype)
+    assert df.dtypes["d"] == np.float64
+
+
+def test_nullable_construction():
+    df = DataSet[Schema](
+        {
+            "a": [1, np.nan],
+            "b": pd.Series([True, None], dtype=object),
+            "c": ["a", None],
+            "d": [1.0, np.nan],
+        }
+    )
+
+    assert df.dtypes["a"] == "Int64"
+    assert df.dtypes["b"] == "boolean"
+    assert isinstance(df.dtypes["c"], pd.StringDtype)
+    assert df.a.isna().tolist() == [False, True]
+    assert df.b.isna().tolist() == [False, True]
+
+    # data that already has the nullable dtypes is not converted
+    DataSet[Schema](df.to_dataframe())
+
+
+def test_nullable_no_coercion():
+    with pytest.raises(TypeError, match="Column a is of type"):
+        DataSet[Schema]({"a": [1.5], "b": [True], "c": ["a"], "d": [1.0]})
+
+    with pytest.raises(TypeError, match="Column a is of type"):
+        DataSet[Schema]({"a": ["1"], "b": [True], "c": ["a"], "d": [1.0]})
+
+    with pytest.raises(TypeError, match="Column c is of type"):
+        DataSet[Schema]({"a": [1], "b": [True], "c": [1], "d": [1.0]})
+
+
+def test_nullable_indexed_dataset():
+    df = (
+        pd.DataFrame({"i": [1, 2], "a": [1, None], "b": [True, False], "c": ["a", "b"], "d": 1.0})
+        .set_index("i")
+        .pipe(IndexedDataSet[IndexSchema, Schema])
+    )
+
+    assert df.dtypes["a"] == "Int64"
+
+
+def test_nullable_subschema():
+    df = DataSet[Schema]({"a": [1], "b": [True], "c": ["a"], "d": [1.0]})
+
+    assert df.project(SubSchema).dtypes["a"] == "Int64"
+
+    with pytest.raises(TypeError):
+        df.project(NonNullableSchema)
+
+
+def test_nullable_builder():
+    builder = DataSet[Schema].builder()
+    builder.append({"a": 1, "b": None, "c": "a", "d": 1.0})
+    builder.append({"a": None, "b": True, "c": None, "d": np.nan})
+    df = builder.build()
+
+    assert df.dtypes["a"] == "Int64"
+    assert df.b.isna().tolist() == [True, False]
+
+
+def test_nullable_typed_operations():
+    df = DataSet[NonNullableSchema]({"a": [1, 2]})
+
+    assigned = df.assign_typed(SubSchema)
+    assert type(assigned) is DataSet[SubSchema]
+    assert assigned.dtypes["a"] == "Int64"
+
+    concatenated = DataSet.concat_typed(SubSchema, [df, df])
+    assert concatenated.dtypes["a"] == "Int64"
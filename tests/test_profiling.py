@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.dataset import DataSetBase
+from strictly_typed_pandas.profiling import (
+    ATTRIBUTE_INTERCEPTION,
+    TYPE_CHECKS,
+    VALIDATION,
+    Profile,
+)
+
+
+class Schema:
+    a: int
+
+
+def foo(df: DataSet[Schema]) -> DataSet[Schema]:
+    return df
+
+
+def test_profile(capsys):
+    head = DataSetBase.head
+
+    with Profile() as profile:
+        df = DataSet[Schema]({"a": [1, 2, 3]})
+        df.head(1)
+        foo(df)
+
+    assert DataSetBase.head is head
+
+    results = profile.results()
+    categories = {category for _, category, _, _ in results}
+    assert categories == {ATTRIBUTE_INTERCEPTION, VALIDATION, TYPE_CHECKS}
+    assert all(call_site.startswith(__file__) for call_site, _, _, _ in results)
+    assert [result[3] for result in results] == sorted([result[3] for result in results])[::-1]
+
+    report = capsys.readouterr().out
+    assert report.startswith("strictly typed pandas overhead")
+    assert "test_profile" in report
+
+
+def test_profile_inactive():
+    with Profile(print_report=False) as profile:
+        pass
+
+    DataSet[Schema]({"a": [1]}).head(1)
+    assert profile.results() == []
+
+
+def test_profile_already_active():
+    with Profile(print_report=False):
+        with pytest.raises(RuntimeError):
+            Profile(print_report=False).start()
+
+
+def test_profile_plain_dataframe():
+    with Profile(print_report=False) as profile:
+        pd.DataFrame({"a": [1]}).head(1)
+
+    assert profile.results() == []
@@ -0,0 +1,102 @@
+import numpy as np  # type: ignore
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.quarantine import quarantine
+
+
+class Schema:
+    a: int
+    b: np.datetime64
+    c: float
+
+
+class NullableSchema:
+    __nullable__ = True
+
+    a: int
+
+
+def test_quarantine():
+    df = pd.DataFrame(
+        {
+            "a": ["1", "2", "three", None, "5.5", 6],
+            "b": ["2024-01-01", "x", None, "2024-01-02", "2024-01-03", "2024-01-04"],
+            "c": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+    dataset, rejected, reasons = quarantine(df, Schema)
+
+    assert type(dataset) is DataSet[Schema]
+    assert list(dataset.index) == [0, 5]
+    assert list(dataset["a"]) == [1, 6]
+    assert dataset.dtypes["a"] == np.int64
+    assert dataset.dtypes["b"] == np.dtype("datetime64[ns]")
+
+    pd.testing.assert_frame_equal(rejected, df.iloc[1:5])
+    pd.testing.assert_frame_equal(
+        reasons,
+        pd.DataFrame(
+            {"a": [False, True, True, True], "b": [True, False, False, False]}, index=[1, 2, 3, 4]
+        ),
+    )
+
+
+def test_quarantine_valid_data():
+    df = pd.DataFrame({"a": [1, 2], "b": pd.to_datetime(["2024-01-01"] * 2), "c": [1.0, 2.0]})
+    dataset, rejected, reasons = quarantine(df, Schema)
+
+    assert type(dataset) is DataSet[Schema]
+    assert np.shares_memory(dataset["a"].values, df["a"].values)
+    assert rejected.shape == (0, 3)
+    assert reasons.shape == (0, 0)
+
+
+def test_quarantine_numeric_casts():
+    class Int32Schema:
+        a: np.int32
+
+    df = pd.DataFrame({"a": [1.0, np.nan, 2.5, 2.0**40, 3.0]})
+    dataset, rejected, _ = quarantine(df, Int32Schema)
+
+    assert list(dataset["a"]) == [1, 3]
+    assert list(rejected.index) == [1, 2, 3]
+
+    # missing values are allowed in a nullable schema
+    dataset, rejected, _ = quarantine(pd.DataFrame({"a": [1.0, np.nan, 2.5]}), NullableSchema)
+
+    assert dataset.dtypes["a"] == "Int64"
+    assert dataset["a"].isna().tolist() == [False, True]
+    assert list(rejected.index) == [2]
+
+
+def test_quarantine_invalid_schema():
+    with pytest.raises(TypeError, match="not present in data"):
+        quarantine(pd.DataFrame({"a": [1]}), Schema)
+
+    with pytest.raises(TypeError, match="duplicate"):
+        quarantine(pd.DataFrame([[1, 2]], columns=["a", "a"]), NullableSchema)
+
+
+def test_quarantine_str_with_missing_values():
+    class StrSchema:
+        a: int
+        b: str
+
+    dataset, rejected, _ = quarantine(pd.DataFrame({"a": [1, 2], "b": [1.0, np.nan]}), StrSchema)
+
+    assert len(rejected) == 0
+    assert dataset["b"].iloc[0] == "1.0"
+    assert pd.isna(dataset["b"].iloc[1])
+
+
+def test_quarantine_float_with_missing_values():
+    class Float32Schema:
+        a: np.float32
+
+    dataset, rejected, _ = quarantine(pd.DataFrame({"a": [1.0, np.nan, 2.0]}), Float32Schema)
+
+    assert len(rejected) == 0
+    assert dataset.dtypes["a"] == np.float32
+    assert dataset["a"].isna().tolist() == [False, True, False]
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas.statistics import column_statistics
+
+
+class Schema:
+    a: int
+    b: str
+
+
+class IntSchema:
+    a: int
+
+
+def test_column_statistics():
+    df = DataSet[Schema]({"a": [3, 1, 2, 1], "b": ["x", None, "y", "x"]})
+
+    assert column_statistics(df) is column_statistics(df)
+    assert list(column_statistics(df)) == ["a", "b"]
+
+    a = column_statistics(df)["a"]
+    assert (a.min, a.max, a.null_count, a.unique_count) == (1, 3, 0, 3)
+
+    b = column_statistics(df)["b"]
+    assert (b.min, b.max, b.null_count, b.unique_count) == ("x", "y", 1, 2)
+
+    with pytest.raises(KeyError):
+        column_statistics(df)["c"]
+
+
+def test_column_statistics_are_cached(monkeypatch):
+    df = DataSet[IntSchema]({"a": [1, 2, 3]})
+
+    computed = []
+    series_max = pd.Series.max
+
+    def counting_max(self, *args, **kwargs):
+        computed.append(self.name)
+        return series_max(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.Series, "max", counting_max)
+    assert [column_statistics(df)["a"].max for _ in range(3)] == [3, 3, 3]
+    assert computed == ["a"]
+
+    # the statistics are not propagated to the results of operations
+    assert column_statistics(df.head(1))["a"].max == 1
+    assert computed == ["a", "a"]
+
+
+def test_column_named_statistics():
+    class StatisticsSchema:
+        statistics: int
+
+    df = DataSet[StatisticsSchema]({"statistics": [1, 2]})
+
+    assert list(df.statistics) == [1, 2]
+    assert column_statistics(df)["statistics"].max == 2
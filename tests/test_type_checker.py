@@ -0,0 +1,103 @@
+import sys
+import textwrap
+import types
+import warnings
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet
+from strictly_typed_pandas._vendor import typeguard
+from strictly_typed_pandas._vendor.typeguard import TypeWarning
+from strictly_typed_pandas.type_checker import references_dataset
+
+requires_monitoring = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="sys.monitoring requires Python 3.12+"
+)
+
+
+class Schema:
+    a: int
+
+
+# the functions are compiled outside of the tests package, such that they are not instrumented by
+# the import hook of the pytest plugin
+source = textwrap.dedent(
+    """
+    from strictly_typed_pandas import DataSet
+    from tests.test_type_checker import Schema
+
+    def foo(df: DataSet[Schema]) -> DataSet[Schema]:
+        return df
+
+    def bar(df: DataSet[Schema]) -> DataSet[Schema]:
+        return df.to_dataframe()
+
+    def unrelated(a: int) -> int:
+        return a
+    """
+)
+module = types.ModuleType("stp_type_checker_sample")
+exec(compile(source, "stp_type_checker_sample", "exec"), module.__dict__)
+
+
+def test_references_dataset():
+    assert references_dataset(DataSet[Schema])
+    assert references_dataset(Optional[DataSet[Schema]])
+    assert references_dataset("DataSet[Schema]")
+    assert not references_dataset(int)
+    assert not references_dataset(Optional[pd.DataFrame])
+
+
+@requires_monitoring
+def test_monitoring_type_checker():
+    from strictly_typed_pandas.type_checker import MonitoringTypeChecker, TypeChecker
+
+    assert TypeChecker is MonitoringTypeChecker
+
+    df = DataSet[Schema]({"a": [1, 2, 3]})
+    with MonitoringTypeChecker("stp_type_checker_sample") as checker:
+        assert checker.active
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            module.foo(df)
+            module.unrelated(1)
+
+        with pytest.warns(TypeWarning) as record:
+            module.foo(pd.DataFrame())
+        assert [str(w.message).split()[1] for w in record] == ["call", "return"]
+
+        with pytest.warns(TypeWarning, match="return from"):
+            module.bar(df)
+
+    assert not checker.active
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        module.foo(pd.DataFrame())
+
+
+@requires_monitoring
+def test_monitoring_type_checker_packages(monkeypatch):
+    from strictly_typed_pandas.type_checker import MonitoringTypeChecker
+
+    # looking up the function of a frame is expensive, so this is skipped for other packages
+    looked_up = []
+    monkeypatch.setattr(typeguard, "find_function", looked_up.append)
+    with MonitoringTypeChecker("some_other_package"):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            module.foo(pd.DataFrame())
+
+    assert looked_up == []
+
+
+@requires_monitoring
+def test_monitoring_type_checker_already_running():
+    from strictly_typed_pandas.type_checker import MonitoringTypeChecker
+
+    with MonitoringTypeChecker("stp_type_checker_sample") as checker:
+        with pytest.raises(RuntimeError):
+            checker.start()
@@ -0,0 +1,142 @@
+import asyncio
+import textwrap
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from strictly_typed_pandas import DataSet, IndexedDataSet
+
+
+class Schema:
+    a: int
+
+
+class IndexSchema:
+    a: int
+
+
+class UniqueIndexSchema:
+    __unique__ = True
+
+    a: int
+
+
+class DataSchema:
+    b: int
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+executor = CountingExecutor()
+
+# the functions are compiled outside of the tests package, such that they are not instrumented by
+# the import hook of the pytest plugin
+source = textwrap.dedent(
+    """
+    from typing import AsyncIterator
+
+    from strictly_typed_pandas import DataSet, IndexedDataSet
+    from strictly_typed_pandas.typeguard import typechecked
+    from tests.test_typechecked import (
+        DataSchema,
+        IndexSchema,
+        Schema,
+        UniqueIndexSchema,
+        executor,
+    )
+
+    @typechecked
+    def identity(df: DataSet[Schema]) -> DataSet[Schema]:
+        return df
+
+    @typechecked
+    def indexed(df: IndexedDataSet[IndexSchema, DataSchema]) -> int:
+        return 1
+
+    @typechecked(offload_validation=True, executor=executor)
+    async def foo(df: DataSet[Schema]) -> DataSet[Schema]:
+        return df
+
+    @typechecked(offload_validation=True, executor=executor)
+    async def bar(df: IndexedDataSet[IndexSchema, DataSchema]) -> int:
+        return 1
+
+    @typechecked(offload_validation=True, executor=executor)
+    async def baz(df: IndexedDataSet[UniqueIndexSchema, DataSchema]) -> int:
+        return 1
+
+    @typechecked(offload_validation=True, executor=executor)
+    async def generate(df) -> AsyncIterator[DataSet[Schema]]:
+        yield df
+    """
+)
+module = types.ModuleType("stp_typechecked_sample")
+exec(compile(source, "stp_typechecked_sample", "exec"), module.__dict__)
+
+
+def _submitted(coroutine) -> int:
+    before = executor.submitted
+    asyncio.run(coroutine)
+    return executor.submitted - before
+
+
+async def _consume(generator):
+    return [value async for value in generator]
+
+
+def test_dataset_without_schema():
+    # a DataSet without a schema is accepted if its data adheres to the annotated schema
+    module.identity(DataSet({"a": [1]}))
+    module.indexed(IndexedDataSet(pd.DataFrame({"a": [1], "b": [1]}).set_index("a")))
+
+    with pytest.raises(TypeError, match="must be a DataSet"):
+        module.identity(DataSet({"a": ["a"]}))
+
+    with pytest.raises(TypeError, match="must be a IndexedDataSet"):
+        module.indexed(IndexedDataSet(pd.DataFrame({"a": [1], "c": [1]}).set_index("a")))
+
+
+def test_offload_validation():
+    # the dtypes of a DataSet are validated inline, since this is cheaper than awaiting an executor
+    assert _submitted(module.foo(DataSet[Schema]({"a": [1]}))) == 0
+    assert _submitted(module.foo(DataSet({"a": [1]}))) == 0
+
+    with pytest.raises(TypeError, match="must be a DataSet"):
+        _submitted(module.foo(DataSet({"a": ["a"]})))
+
+    with pytest.raises(TypeError, match="must be a DataSet"):
+        _submitted(module.foo(pd.DataFrame({"a": [1]})))
+
+
+def test_offload_validation_indexed_dataset():
+    df = pd.DataFrame({"a": [1], "b": [1]}).set_index("a")
+    assert _submitted(module.bar(IndexedDataSet[IndexSchema, DataSchema](df))) == 0
+    assert _submitted(module.bar(IndexedDataSet(df))) == 0
+
+    with pytest.raises(TypeError, match="No named columns in index"):
+        _submitted(module.bar(IndexedDataSet(df.reset_index())))
+
+    # the guarantees on the index take O(rows), so these are offloaded
+    assert _submitted(module.baz(IndexedDataSet(df))) == 1
+
+    duplicates = pd.DataFrame({"a": [1, 1], "b": [1, 2]}).set_index("a")
+    with pytest.raises(TypeError, match="duplicate"):
+        _submitted(module.baz(IndexedDataSet(duplicates)))
+
+
+def test_offload_validation_async_generator():
+    assert _submitted(_consume(module.generate(DataSet[Schema]({"a": [1]})))) == 0
+    assert _submitted(_consume(module.generate(DataSet({"a": [1]})))) == 0
+
+    with pytest.raises(TypeError, match="value yielded from generator"):
+        _submitted(_consume(module.generate(DataSet({"a": ["a"]}))))